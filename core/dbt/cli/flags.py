@@ -314,6 +314,10 @@ class Flags:
         self._assert_mutually_exclusive(params_assigned_from_default, ["SELECT", "INLINE"])
         self._assert_mutually_exclusive(params_assigned_from_default, ["SELECTOR", "INLINE"])
 
+        # Watch mode builds the file diffs it parses, so they can't be turned off
+        if getattr(self, "WATCH", False) and not getattr(self, "PARTIAL_PARSE_FILE_DIFF", True):
+            raise DbtUsageException("watch: not allowed with argument no_partial_parse_file_diff")
+
         # Check event_time configs for validity
         self._validate_event_time_configs()
 
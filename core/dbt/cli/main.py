@@ -100,6 +100,8 @@ class dbtRunner:
 # approach from https://github.com/pallets/click/issues/108#issuecomment-280489786
 def global_flags(func):
     @p.cache_selected_only
+    @p.compact_manifest
+    @p.critical_path_scheduling
     @p.debug
     @p.defer
     @p.deprecated_defer
@@ -121,6 +123,8 @@ def global_flags(func):
     @p.partial_parse
     @p.partial_parse_file_path
     @p.partial_parse_file_diff
+    @p.parse_read_workers
+    @p.parse_workers
     @p.populate_cache
     @p.print
     @p.printer_width
@@ -533,6 +537,7 @@ cli.add_command(ls, "ls")
 @p.target_path
 @p.threads
 @p.vars
+@p.watch
 @requires.postflight
 @requires.preflight
 @requires.profile
@@ -542,6 +547,15 @@ cli.add_command(ls, "ls")
 def parse(ctx, **kwargs):
     """Parses the project and provides information on performance"""
     # manifest generation and writing happens in @requires.manifest
+    if ctx.obj["flags"].WATCH:
+        from dbt.parser.watch import ManifestWatcher
+
+        watcher = ManifestWatcher(
+            ctx.obj["runtime_config"],
+            ctx.obj["manifest"],
+            write_json=ctx.obj["flags"].write_json,
+        )
+        ctx.obj["manifest"] = watcher.run() or ctx.obj["manifest"]
     return ctx.obj["manifest"], True
 
 
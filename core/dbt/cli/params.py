@@ -58,6 +58,20 @@ clean_project_files_only = click.option(
     default=True,
 )
 
+compact_manifest = click.option(
+    "--compact-manifest/--no-compact-manifest",
+    envvar="DBT_COMPACT_MANIFEST",
+    help="After loading the manifest, share a single copy of the strings that repeat across its nodes, such as package names, tags, column names and data types. This reduces the memory used by large projects.",
+    default=False,
+)
+
+critical_path_scheduling = click.option(
+    "--critical-path-scheduling/--no-critical-path-scheduling",
+    envvar="DBT_CRITICAL_PATH_SCHEDULING",
+    help="Start the nodes with the longest remaining chain of work first, using the execution times in the run_results.json of the --state directory. Nodes without a previous execution time are expected to take the median time.",
+    default=False,
+)
+
 compile_docs = click.option(
     "--compile/--no-compile",
     envvar=None,
@@ -399,6 +413,22 @@ partial_parse = click.option(
     default=True,
 )
 
+parse_read_workers = click.option(
+    "--parse-read-workers",
+    envvar="DBT_PARSE_READ_WORKERS",
+    help="Number of threads used to find, read and hash project files during parsing. Files are read serially by default.",
+    default=1,
+    type=click.IntRange(min=1),
+)
+
+parse_workers = click.option(
+    "--parse-workers",
+    envvar="DBT_PARSE_WORKERS",
+    help="Number of processes used to decode schema yaml files, and to parse model, snapshot, analysis and singular test files during a full parse. Files are parsed serially by default.",
+    default=1,
+    type=click.IntRange(min=1),
+)
+
 partial_parse_file_diff = click.option(
     "--partial-parse-file-diff/--no-partial-parse-file-diff",
     envvar="DBT_PARTIAL_PARSE_FILE_DIFF",
@@ -738,6 +768,14 @@ version_check = click.option(
     default=True,
 )
 
+watch = click.option(
+    "--watch",
+    envvar=None,
+    help="Keep running after parsing, and partially parse the project again each time one of its files changes.",
+    is_flag=True,
+    default=False,
+)
+
 warn_error = click.option(
     "--warn-error",
     envvar="DBT_WARN_ERROR",
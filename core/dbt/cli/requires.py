@@ -11,6 +11,7 @@ import dbt.tracking
 from dbt.adapters.factory import adapter_management, get_adapter, register_adapter
 from dbt.cli.exceptions import ExceptionExit, ResultExit
 from dbt.cli.flags import Flags
+from dbt.clients.jinja_bytecode import bytecode_cache
 from dbt.config import RuntimeConfig
 from dbt.config.runtime import UnsetProfile, load_profile, load_project
 from dbt.context.providers import generate_runtime_macro_context
@@ -59,6 +60,10 @@ def preflight(func):
 
         set_invocation_context({})
 
+        # Templates cached outside of a command (e.g. by loading a manifest
+        # programmatically) aren't saved by this one
+        bytecode_cache.close()
+
         # Record/Replay
         setup_record_replay()
 
@@ -196,6 +201,8 @@ def postflight(func):
             )
 
             tear_down_record_replay()
+            bytecode_cache.save()
+            bytecode_cache.close()
 
         if not success:
             raise ResultExit(result)
@@ -10,6 +10,7 @@ import jinja2.nodes
 import jinja2.parser
 import jinja2.sandbox
 
+from dbt.clients.jinja_bytecode import bytecode_cache
 from dbt.contracts.graph.nodes import GenericTestNode
 from dbt.exceptions import (
     DbtInternalError,
@@ -18,10 +19,13 @@ from dbt.exceptions import (
 )
 from dbt.node_types import ModelLanguage
 from dbt_common.clients.jinja import (
+    MACRO_DEBUGGING,
     CallableMacroGenerator,
     MacroProtocol,
-    get_template,
+    catch_jinja,
+    get_environment,
     render_template,
+    template_cache,
 )
 from dbt_common.utils import deep_map_render
 
@@ -58,6 +62,13 @@ class MacroGenerator(CallableMacroGenerator):
         self.node = node
         self.stack = stack
 
+    def get_template(self) -> jinja2.Template:
+        # like dbt_common's template cache, but compiled through the bytecode cache
+        key = self.macro.macro_sql
+        if key not in template_cache.file_cache:
+            template_cache.file_cache[key] = get_template(key, {}, node=self.macro)
+        return template_cache.file_cache[key]
+
     # This adds the macro's unique id to the node's 'depends_on'
     @contextmanager
     def track_call(self):
@@ -112,6 +123,29 @@ _HAS_RENDER_CHARS_PAT = re.compile(r"({[{%#]|[#}%]})")
 _render_cache: Dict[str, Any] = dict()
 
 
+def has_render_chars(string: str) -> bool:
+    """Whether rendering the string with jinja could change it."""
+    return _HAS_RENDER_CHARS_PAT.search(string) is not None
+
+
+def get_template(
+    string: str,
+    ctx: Dict[str, Any],
+    node=None,
+    capture_macros: bool = False,
+    native: bool = False,
+) -> jinja2.Template:
+    with catch_jinja(node):
+        env = get_environment(node, capture_macros, native=native)
+
+        template_source = str(string)
+        # the compiled code is saved to the python linecache when debugging macros
+        if MACRO_DEBUGGING:
+            return env.from_string(template_source, globals=ctx)
+        code = bytecode_cache.compile(env, template_source, capture_macros, native)
+        return env.template_class.from_code(env, code, env.make_globals(ctx), None)
+
+
 def get_rendered(
     string: str,
     ctx: Dict[str, Any],
@@ -125,9 +159,9 @@ def get_rendered(
     # If this is desirable in the native env as well, we could handle the
     # native=True case by passing the input string to ast.literal_eval, like
     # the native renderer does.
-    has_render_chars = not isinstance(string, str) or _HAS_RENDER_CHARS_PAT.search(string)
+    needs_render = not isinstance(string, str) or has_render_chars(string)
 
-    if not has_render_chars:
+    if not needs_render:
         if not native:
             return string
         elif string in _render_cache:
@@ -143,7 +177,7 @@ def get_rendered(
 
     rendered = render_template(template, ctx, node)
 
-    if not has_render_chars and native:
+    if not needs_render and native:
         _render_cache[string] = rendered
 
     return rendered
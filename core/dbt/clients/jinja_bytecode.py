@@ -0,0 +1,125 @@
+import hashlib
+import importlib.util
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Optional
+
+import jinja2
+import msgpack  # type: ignore
+
+from dbt.version import __version__
+from dbt_common.clients.system import make_directory
+
+# Compiled templates can only be reused by the same versions of dbt, jinja
+# and python that compiled them
+BYTECODE_VERSION = "-".join([__version__, jinja2.__version__, importlib.util.MAGIC_NUMBER.hex()])
+
+# The least recently used templates are dropped when the cache gets bigger than this
+MAX_BYTECODE_CACHE_SIZE = 64 * 1024 * 1024
+
+
+class JinjaBytecodeCache:
+    """A cache of the python code that jinja compiles templates into, keyed
+    by the template source and the environment flags that change how it is
+    compiled. It is saved under the target directory, so that macros and
+    models whose source hasn't changed don't need to be compiled again by the
+    next invocation. Until a path is opened, templates are compiled every
+    time and nothing is counted.
+
+    The cache belongs to one invocation: it's opened when the project is
+    loaded, and saved and closed when the command completes, so that a later
+    invocation in the same process can't save it to another project's target
+    directory.
+    """
+
+    VERSION = 1
+
+    def __init__(self, max_size: int = MAX_BYTECODE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.path: Optional[str] = None
+        # key -> marshalled code, least recently used first
+        self.entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self.size = 0
+        self.changed = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def open(self, path: str) -> None:
+        if path == self.path:
+            return
+        self.path = path
+        self.entries = OrderedDict()
+        self.changed = False
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as fp:
+                    data = msgpack.unpackb(fp.read(), raw=False)
+                if data.get("version") == self.VERSION and data.get("dbt") == BYTECODE_VERSION:
+                    self.entries = OrderedDict(data["entries"])
+            except Exception:
+                # A corrupt or unreadable cache just means every template is compiled
+                pass
+        self.size = sum(len(code) for code in self.entries.values())
+
+    def close(self) -> None:
+        """Forget the opened path and the cached templates, without saving them"""
+        with self._lock:
+            self.path = None
+            self.entries = OrderedDict()
+            self.size = 0
+            self.changed = False
+
+    def save(self) -> None:
+        if self.path is None or not self.changed:
+            return
+        with self._lock:
+            while self.size > self.max_size and self.entries:
+                _, code = self.entries.popitem(last=False)
+                self.size -= len(code)
+            data = msgpack.packb(
+                {"version": self.VERSION, "dbt": BYTECODE_VERSION, "entries": self.entries}
+            )
+            self.changed = False
+        try:
+            make_directory(os.path.dirname(self.path))
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Not being able to save the cache only makes the next invocation slower
+            pass
+
+    def compile(
+        self, env: jinja2.Environment, source: str, capture_macros: bool, native: bool
+    ) -> CodeType:
+        if self.path is None:
+            return env.compile(source)
+
+        key = hashlib.sha256(
+            f"{BYTECODE_VERSION}\0{capture_macros}\0{native}\0{source}".encode()
+        ).hexdigest()
+        with self._lock:
+            code = self.entries.get(key)
+            if code is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+        if code is not None:
+            return marshal.loads(code)
+
+        compiled = env.compile(source)
+        code = marshal.dumps(compiled)
+        with self._lock:
+            self.misses += 1
+            if key not in self.entries:
+                self.entries[key] = code
+                self.size += len(code)
+                self.changed = True
+        return compiled
+
+
+bytecode_cache = JinjaBytecodeCache()
@@ -1,4 +1,5 @@
 import typing
+from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 import jinja2
@@ -17,18 +18,23 @@ if typing.TYPE_CHECKING:
 _TESTING_MACRO_CACHE: Dict[str, Any] = {}
 
 
-def statically_extract_has_name_this(source: str) -> bool:
-    """Checks whether the raw jinja has any references to `this`"""
+def statically_extract_has_name(source: str, name: str) -> bool:
+    """Checks whether the raw jinja has any references to `name`"""
     env = get_environment(None, capture_macros=True)
     parsed = env.parse(source)
     names = tuple(parsed.find_all(jinja2.nodes.Name))
 
-    for name in names:
-        if hasattr(name, "name") and name.name == "this":
+    for node in names:
+        if hasattr(node, "name") and node.name == name:
             return True
     return False
 
 
+def statically_extract_has_name_this(source: str) -> bool:
+    """Checks whether the raw jinja has any references to `this`"""
+    return statically_extract_has_name(source, "this")
+
+
 def statically_extract_macro_calls(
     source: str, ctx: Dict[str, Any], db_wrapper: Optional["ParseDatabaseWrapper"] = None
 ) -> List[str]:
@@ -243,3 +249,247 @@ def construct_static_kwarg_value(kwarg) -> str:
     # This is still useful to be able to detect changes in unrendered configs, even if it is
     # not an exact representation of the user input.
     return str(kwarg)
+
+
+class StaticAnalysisError(Exception):
+    """Raised when a model can't be statically analyzed and has to be rendered
+    instead. The message is the reason, which is reported in perf_info."""
+
+
+# A value assigned with {% set %} that isn't a literal
+_NOT_LITERAL = object()
+
+
+def _has_call(node: jinja2.nodes.Node) -> bool:
+    return isinstance(node, jinja2.nodes.Call) or any(node.find_all(jinja2.nodes.Call))
+
+
+class _ModelCallsExtractor:
+    """Walks the parsed jinja of a model the way rendering it at parse time
+    would: `is_incremental()` and `execute` are always false, so only the
+    branches of if statements that rendering takes are visited."""
+
+    def __init__(self) -> None:
+        self.refs: List[Dict[str, Any]] = []
+        self.sources: List[List[str]] = []
+        self.configs: List[Any] = []
+        self.vars: List[str] = []
+        self.target_fields: List[str] = []
+        self.macros: List[str] = []
+        self.assigned: Dict[str, Any] = {}
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "refs": self.refs,
+            "sources": self.sources,
+            "configs": self.configs,
+            "vars": self.vars,
+            "target_fields": self.target_fields,
+            "macros": self.macros,
+        }
+
+    def visit_statements(self, statements: List[jinja2.nodes.Node]) -> None:
+        for statement in statements:
+            if isinstance(statement, jinja2.nodes.Output):
+                for node in statement.nodes:
+                    self.visit_expression(node)
+            elif isinstance(statement, jinja2.nodes.If):
+                self.visit_if(statement)
+            elif isinstance(statement, jinja2.nodes.Assign):
+                self.visit_assign(statement)
+            elif isinstance(statement, jinja2.nodes.AssignBlock):
+                if not isinstance(statement.target, jinja2.nodes.Name):
+                    raise StaticAnalysisError("set block with more than one name")
+                self.visit_statements(statement.body)
+                if statement.filter is not None:
+                    self.visit_expression(statement.filter)
+                self.assigned[statement.target.name] = _NOT_LITERAL
+            elif isinstance(statement, jinja2.nodes.ExprStmt):
+                self.visit_expression(statement.node)
+            else:
+                raise StaticAnalysisError(f"{type(statement).__name__} statement")
+
+    def visit_if(self, node: jinja2.nodes.If) -> None:
+        for branch in [node, *node.elif_]:
+            test = self.evaluate_test(branch.test)
+            if test is None:
+                raise StaticAnalysisError("if statement that depends on the context")
+            if test:
+                self.visit_statements(branch.body)
+                return
+        self.visit_statements(node.else_)
+
+    def visit_assign(self, node: jinja2.nodes.Assign) -> None:
+        if not isinstance(node.target, jinja2.nodes.Name):
+            raise StaticAnalysisError("set with more than one name")
+        try:
+            value = self.literal(node.node)
+        except StaticAnalysisError:
+            self.visit_expression(node.node)
+            value = _NOT_LITERAL
+        self.assigned[node.target.name] = value
+
+    def evaluate_test(self, node: jinja2.nodes.Node) -> Optional[bool]:
+        """Returns the truth value of an if statement's test when it doesn't
+        depend on anything but is_incremental() and execute, else None"""
+        if isinstance(node, jinja2.nodes.Not):
+            test = self.evaluate_test(node.node)
+            return None if test is None else not test
+        elif isinstance(node, (jinja2.nodes.And, jinja2.nodes.Or)):
+            # short-circuit like rendering does, so that calls on the right
+            # are only recorded if they would happen
+            left = self.evaluate_test(node.left)
+            if left is None:
+                return None
+            if left == isinstance(node, jinja2.nodes.Or):
+                return left
+            return self.evaluate_test(node.right)
+        elif isinstance(node, jinja2.nodes.Call) and self.called_name(node) == "is_incremental":
+            self.visit_call(node)
+            return False
+        elif (
+            isinstance(node, jinja2.nodes.Name)
+            and node.name == "execute"
+            and node.name not in self.assigned
+        ):
+            return False
+        try:
+            return bool(self.literal(node))
+        except StaticAnalysisError:
+            return None
+
+    def literal(self, node: jinja2.nodes.Node) -> Any:
+        if isinstance(node, jinja2.nodes.Const):
+            return node.value
+        elif isinstance(node, jinja2.nodes.List):
+            return [self.literal(item) for item in node.items]
+        elif isinstance(node, jinja2.nodes.Tuple):
+            return tuple(self.literal(item) for item in node.items)
+        elif isinstance(node, jinja2.nodes.Dict):
+            return {self.literal(pair.key): self.literal(pair.value) for pair in node.items}
+        elif isinstance(node, jinja2.nodes.Neg):
+            value = self.literal(node.node)
+            if isinstance(value, (int, float)):
+                return -value
+        elif isinstance(node, jinja2.nodes.Name):
+            value = self.assigned.get(node.name, _NOT_LITERAL)
+            if value is not _NOT_LITERAL:
+                return deepcopy(value)
+        raise StaticAnalysisError(f"{type(node).__name__.lower()} where a literal is required")
+
+    def called_name(self, node: jinja2.nodes.Call) -> Optional[str]:
+        if isinstance(node.node, jinja2.nodes.Name) and node.node.name not in self.assigned:
+            return node.node.name
+        return None
+
+    def visit_expression(self, node: jinja2.nodes.Node) -> None:
+        if isinstance(node, jinja2.nodes.Call):
+            self.visit_call(node)
+        elif isinstance(node, (jinja2.nodes.And, jinja2.nodes.Or)):
+            # the right side is only evaluated depending on the left one
+            if _has_call(node.right):
+                raise StaticAnalysisError("call in a conditional expression")
+            self.visit_expression(node.left)
+            self.visit_expression(node.right)
+        elif isinstance(node, jinja2.nodes.CondExpr):
+            if _has_call(node.expr1) or (node.expr2 is not None and _has_call(node.expr2)):
+                raise StaticAnalysisError("call in a conditional expression")
+            for child in node.iter_child_nodes():
+                self.visit_expression(child)
+        else:
+            if (
+                isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+                and isinstance(node.node, jinja2.nodes.Name)
+                and node.node.name == "target"
+                and "target" not in self.assigned
+            ):
+                field = node.attr if isinstance(node, jinja2.nodes.Getattr) else node.arg
+                if isinstance(field, jinja2.nodes.Const):
+                    field = field.value
+                if not isinstance(field, str):
+                    raise StaticAnalysisError("target field that isn't a literal")
+                if not hasattr(dict, field) and field not in self.target_fields:
+                    self.target_fields.append(field)
+            for child in node.iter_child_nodes():
+                self.visit_expression(child)
+
+    def visit_call(self, node: jinja2.nodes.Call) -> None:
+        name = self.called_name(node)
+        if name not in ("ref", "source", "config", "var", "is_incremental"):
+            raise StaticAnalysisError(f"call to {name or 'a method'}()")
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise StaticAnalysisError(f"{name}() with *args or **kwargs")
+
+        if name == "var":
+            if not node.args:
+                raise StaticAnalysisError("var() without a name")
+            var_name = self.literal(node.args[0])
+            if not isinstance(var_name, str):
+                raise StaticAnalysisError("var() with a name that isn't a string")
+            # the default is evaluated whether it is used or not
+            for arg in node.args[1:]:
+                self.visit_expression(arg)
+            for kwarg in node.kwargs:
+                self.visit_expression(kwarg.value)
+            if var_name not in self.vars:
+                self.vars.append(var_name)
+            return
+
+        args = [self.literal(arg) for arg in node.args]
+        kwargs = {kwarg.key: self.literal(kwarg.value) for kwarg in node.kwargs}
+        if name == "ref":
+            version = kwargs.get("version") or kwargs.get("v")
+            package = args[0] if len(args) == 2 else None
+            if (
+                len(args) not in (1, 2)
+                or not all(isinstance(arg, str) for arg in args)
+                or not isinstance(version, (str, int, float, type(None)))
+            ):
+                raise StaticAnalysisError("ref() with invalid arguments")
+            self.refs.append({"name": args[-1], "package": package, "version": version})
+        elif name == "source":
+            if len(args) != 2 or kwargs or not all(isinstance(arg, str) for arg in args):
+                raise StaticAnalysisError("source() with invalid arguments")
+            self.sources.append(args)
+        elif name == "config":
+            if len(args) == 1 and not kwargs and isinstance(args[0], dict):
+                opts = args[0]
+            elif not args and kwargs:
+                opts = kwargs
+            else:
+                raise StaticAnalysisError("config() with invalid arguments")
+            for oldkey in ("pre_hook", "post_hook"):
+                if oldkey in opts:
+                    newkey = oldkey.replace("_", "-")
+                    if newkey in opts:
+                        raise StaticAnalysisError("config() with invalid arguments")
+                    opts[newkey] = opts.pop(oldkey)
+            self.configs.extend(opts.items())
+        elif name == "is_incremental":
+            if args or kwargs:
+                raise StaticAnalysisError("is_incremental() with arguments")
+            if name not in self.macros:
+                self.macros.append(name)
+
+
+def statically_extract_model_calls(source: str) -> Dict[str, Any]:
+    """
+    Extracts the ref, source and config calls of a model without rendering it,
+    for models that the static parser can't read. Like the static parser,
+    this returns a dict with "refs", "sources" and "configs", in the order
+    rendering the model at parse time would make the calls. Also returns the
+    names of the vars and target fields read, and of the macros called.
+
+    Only a few common patterns are supported: literals assigned with set,
+    `var()` and if statements on `is_incremental()` or `execute`. For anything
+    else a StaticAnalysisError is raised, and the model has to be rendered.
+    """
+    env = get_environment(None, capture_macros=True)
+    try:
+        parsed = env.parse(source)
+    except jinja2.TemplateSyntaxError:
+        raise StaticAnalysisError("jinja syntax error")
+
+    extractor = _ModelCallsExtractor()
+    extractor.visit_statements(parsed.body)
+    return extractor.result()
@@ -36,7 +36,7 @@ from dbt.exceptions import (
     ParsingError,
 )
 from dbt.flags import get_flags
-from dbt.graph import Graph
+from dbt.graph import AncestryIndex, Graph
 from dbt.node_types import ModelLanguage, NodeType
 from dbt_common.clients.system import make_directory
 from dbt_common.contracts.constraints import ConstraintType
@@ -268,38 +268,31 @@ class Linker:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
+        # A node waits on a test if it is a descendant of every node the test
+        # depends on, so rather than walking the ancestors of every node, the
+        # descendants of each test's dependencies are looked up in an index
+        # and intersected. The index is dropped once the edges are added.
+        ancestry = AncestryIndex(self.graph)
+
+        # Get all tests that depend on any node. Test nodes do not distinguish
+        # between what node the test is "testing" and what node(s) it depends
+        # on, so tests on multiple nodes (ex: relationship tests) are found
+        # from each of them.
+        tests: Dict[UniqueID, None] = {}
         for node_id in self.graph:
-            # If node is executable (in manifest.nodes) and does _not_
-            # represent a test, continue.
-            if (
-                node_id in manifest.nodes
-                and manifest.nodes[node_id].resource_type != NodeType.Test
-            ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(self.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
-
-                # Get all tests that depend on any upstream nodes.
-                upstream_tests = []
-                for upstream_node in upstream_nodes:
-                    # This gets tests with unique_ids starting with "test."
-                    upstream_tests += _get_tests_for_node(manifest, upstream_node)
-
-                for upstream_test in upstream_tests:
-                    # Get the set of all nodes that the test depends on
-                    # including the upstream_node itself. This is necessary
-                    # because tests can depend on multiple nodes (ex:
-                    # relationship tests). Test nodes do not distinguish
-                    # between what node the test is "testing" and what
-                    # node(s) it depends on.
-                    test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
-
-                    # If the set of nodes that an upstream test depends on
-                    # is a subset of all upstream nodes of the current node,
-                    # add an edge from the upstream test to the current node.
-                    if test_depends_on.issubset(upstream_nodes):
-                        self.graph.add_edge(upstream_test, node_id, edge_type="parent_test")
+            for test_id in _get_tests_for_node(manifest, node_id):
+                tests[test_id] = None
+
+        for test_id in tests:
+            test_depends_on = manifest.nodes[test_id].depends_on_nodes
+            for node_id in ancestry.common_descendants(test_depends_on):
+                # If node is executable (in manifest.nodes) and does _not_
+                # represent a test, add an edge from the test to the node.
+                if (
+                    node_id in manifest.nodes
+                    and manifest.nodes[node_id].resource_type != NodeType.Test
+                ):
+                    self.graph.add_edge(test_id, node_id, edge_type="parent_test")
 
     def add_test_edges_2(self, manifest: Manifest):
         graph = self.graph
@@ -552,6 +545,7 @@ class Compiler:
             else:
                 # This is an ephemeral parsed model that we can compile.
                 # Render the raw_code and set compiled to True
+                manifest.snapshot_flat_graph_node(cte_model.unique_id)
                 cte_model = self._compile_code(cte_model, manifest, extra_context)
                 # recursively call this method, sets extra_ctes_injected to True
                 cte_model, new_prepended_ctes = self._recursively_prepend_ctes(
@@ -750,6 +744,7 @@ class Compiler:
         if hasattr(Lexer, "get_default_instance"):
             Lexer.get_default_instance()
 
+        manifest.snapshot_flat_graph_node(node.unique_id)
         node = self._compile_code(node, manifest, extra_context)
 
         node, _ = self._recursively_prepend_ctes(node, manifest, extra_context)
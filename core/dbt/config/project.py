@@ -640,6 +640,12 @@ class Project:
     restrict_access: bool
     dbt_cloud: Dict[str, Any]
     flags: Dict[str, Any]
+    # The configs above compiled by the context config generators as they're
+    # needed, so that they're compiled once per project. See
+    # dbt.context.context_config.ConfigSource.get_config_trie
+    config_tries: Dict[Any, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def all_source_paths(self) -> List[str]:
@@ -4,6 +4,10 @@ DEFAULT_ENV_PLACEHOLDER = "DBT_DEFAULT_PLACEHOLDER"
 
 SECRET_PLACEHOLDER = "$$$DBT_SECRET_START$$${}$$$DBT_SECRET_END$$$"
 
+# Reads of the target's fields are tracked for partial parsing along with the
+# vars, under the name of the field with this prefix
+TARGET_FIELD_VAR_PREFIX = "target."
+
 MAXIMUM_SEED_SIZE = 1 * 1024 * 1024
 MAXIMUM_SEED_SIZE_NAME = "1MB"
 
@@ -21,4 +25,6 @@ LEGACY_TIME_SPINE_MODEL_NAME = "metricflow_time_spine"
 LEGACY_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 MINIMUM_REQUIRED_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+PARTIAL_PARSE_FILE_STATS_FILE_NAME = "partial_parse_file_stats.msgpack"
+JINJA_BYTECODE_CACHE_FILE_NAME = "jinja_bytecode.msgpack"
 PACKAGE_LOCK_HASH_KEY = "sha1_hash"
@@ -144,12 +144,20 @@ class Var:
         context: Mapping[str, Any],
         cli_vars: Mapping[str, Any],
         node: Optional[Resource] = None,
+        on_read: Optional[Callable[[str], None]] = None,
     ) -> None:
         self._context: Mapping[str, Any] = context
         self._cli_vars: Mapping[str, Any] = cli_vars
         self._node: Optional[Resource] = node
+        # Called with the name of each var that's looked up, so that
+        # partial parsing knows what to reparse when --vars change
+        self._on_read = on_read
         self._merged: Mapping[str, Any] = self._generate_merged()
 
+    def record_read(self, var_name: str) -> None:
+        if self._on_read is not None:
+            self._on_read(var_name)
+
     def _generate_merged(self) -> Mapping[str, Any]:
         return self._cli_vars
 
@@ -165,10 +173,14 @@ class Var:
         raise RequiredVarNotFoundError(var_name, dict(self._merged), self._node)
 
     def has_var(self, var_name: str) -> bool:
+        self.record_read(var_name)
         return var_name in self._merged
 
+    def get_raw_var(self, var_name: str) -> Any:
+        return self._merged[var_name]
+
     def get_rendered_var(self, var_name: str) -> Any:
-        raw = self._merged[var_name]
+        raw = self.get_raw_var(var_name)
         # if bool/int/float/etc are passed in, don't compile anything
         if not isinstance(raw, str):
             return raw
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from dbt.adapters.contracts.connection import AdapterRequiredConfig
 from dbt.constants import DEFAULT_ENV_PLACEHOLDER
@@ -37,12 +37,14 @@ class ConfiguredVar(Var):
         context: Dict[str, Any],
         config: AdapterRequiredConfig,
         project_name: str,
+        on_read: Optional[Callable[[str], None]] = None,
     ):
-        super().__init__(context, config.cli_vars)
+        super().__init__(context, config.cli_vars, on_read=on_read)
         self._config = config
         self._project_name = project_name
 
     def __call__(self, var_name, default=Var._VAR_NOTSET):
+        self.record_read(var_name)
         my_config = self._config.load_dependencies()[self._project_name]
 
         # cli vars > active project > local project
@@ -82,7 +84,11 @@ class SchemaYamlContext(ConfiguredContext):
 
     @contextproperty()
     def var(self) -> ConfiguredVar:
-        return ConfiguredVar(self._ctx, self.config, self._project_name)
+        return ConfiguredVar(self._ctx, self.config, self._project_name, on_read=self._record_var)
+
+    def _record_var(self, var_name: str) -> None:
+        if self.schema_yaml_vars:
+            self.schema_yaml_vars.vars[var_name] = True
 
     @contextmember()
     def env_var(self, var: str, default: Optional[str] = None) -> str:
@@ -1,7 +1,17 @@
 from abc import abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, Iterator, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from dbt.adapters.factory import get_config_class_by_name
 from dbt.config import IsFQNResource, Project, RuntimeConfig
@@ -9,7 +19,6 @@ from dbt.contracts.graph.model_config import get_config_for
 from dbt.exceptions import SchemaConfigError
 from dbt.flags import get_flags
 from dbt.node_types import NodeType
-from dbt.utils import fqn_search
 from dbt_common.contracts.config.base import BaseConfig, merge_config_dicts
 from dbt_common.dataclass_schema import ValidationError
 from dbt_common.exceptions import DbtInternalError
@@ -32,6 +41,18 @@ class ConfigSource:
 
     def get_config_dict(self, resource_type: NodeType): ...
 
+    def get_config_trie(self, resource_type: NodeType) -> "ProjectConfigTrie":
+        """The trie of the configs of resource_type, built the first time
+        it's needed and kept on the project. It's rebuilt if the project's
+        configs are replaced, but they must not be changed in place."""
+        model_configs = self.get_config_dict(resource_type)
+        key = (self.__class__.__name__, resource_type)
+        cached = self.project.config_tries.get(key)
+        if cached is None or cached[0] is not model_configs:
+            cached = (model_configs, ProjectConfigTrie(model_configs or {}))
+            self.project.config_tries[key] = cached
+        return cached[1]
+
 
 class UnrenderedConfig(ConfigSource):
     def __init__(self, project: Project):
@@ -93,6 +114,65 @@ class RenderedConfig(ConfigSource):
         return model_configs
 
 
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _copier(value: Any) -> Callable[[Any], Any]:
+    # most config values are lists or dicts of scalars, which are cheaper to copy
+    if isinstance(value, list) and all(isinstance(v, _IMMUTABLE_TYPES) for v in value):
+        return list
+    if isinstance(value, dict) and all(isinstance(v, _IMMUTABLE_TYPES) for v in value.values()):
+        return dict
+    return deepcopy
+
+
+class ProjectConfigTrie:
+    """The configs of one resource type from dbt_project.yml, as a tree of fqn
+    levels. Each level holds the configs set on it and on every level above
+    it, with the `+` prefixes removed, so the configs for a node are found with
+    one walk down its fqn instead of searching and copying the raw configs.
+    The tree is never modified once it is built."""
+
+    def __init__(
+        self,
+        level_configs: Dict[str, Any],
+        parent_layers: Tuple[Tuple[Dict[str, Any], Tuple[Tuple[str, Callable], ...]], ...] = (),
+    ) -> None:
+        layer: Dict[str, Any] = {}
+        for key, value in level_configs.items():
+            if key.startswith("+"):
+                layer[key[1:].strip()] = value
+            elif not isinstance(value, dict):
+                layer[key] = value
+        # values that are copied before they are handed out, because the node
+        # configs built from them can be modified
+        mutable_values = tuple(
+            (key, _copier(value))
+            for key, value in layer.items()
+            if isinstance(value, (dict, list, set))
+        )
+        self.layers = parent_layers + ((layer, mutable_values),)
+        self.children: Dict[str, ProjectConfigTrie] = {
+            key: ProjectConfigTrie(value, self.layers)
+            for key, value in level_configs.items()
+            if isinstance(value, dict)
+        }
+
+    def configs_for(self, fqn: List[str]) -> Iterator[Dict[str, Any]]:
+        trie = self
+        for level in fqn:
+            child = trie.children.get(level)
+            if child is None:
+                break
+            trie = child
+
+        for layer, mutable_values in trie.layers:
+            result = dict(layer)
+            for key, copier in mutable_values:
+                result[key] = copier(result[key])
+            yield result
+
+
 class BaseContextConfigGenerator(Generic[T]):
     def __init__(self, active_project: RuntimeConfig):
         self._active_project = active_project
@@ -115,16 +195,7 @@ class BaseContextConfigGenerator(Generic[T]):
         self, project: Project, fqn: List[str], resource_type: NodeType
     ) -> Iterator[Dict[str, Any]]:
         src = self.get_config_source(project)
-        model_configs = src.get_config_dict(resource_type)
-        for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith("+"):
-                    result[key[1:].strip()] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
+        return src.get_config_trie(resource_type).configs_for(fqn)
 
     def _active_project_configs(
         self, fqn: List[str], resource_type: NodeType
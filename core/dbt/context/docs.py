@@ -4,7 +4,14 @@ from dbt.config.runtime import RuntimeConfig
 from dbt.context.base import contextmember
 from dbt.context.configured import SchemaYamlContext
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.nodes import Macro, ResultNode
+from dbt.contracts.graph.nodes import (
+    Exposure,
+    Macro,
+    Metric,
+    ResultNode,
+    SavedQuery,
+    SemanticModel,
+)
 from dbt.exceptions import DocArgsError, DocTargetNotFoundError
 
 
@@ -12,7 +19,7 @@ class DocsRuntimeContext(SchemaYamlContext):
     def __init__(
         self,
         config: RuntimeConfig,
-        node: Union[Macro, ResultNode],
+        node: Union[Macro, ResultNode, Exposure, Metric, SemanticModel, SavedQuery],
         manifest: Manifest,
         current_project: str,
     ) -> None:
@@ -20,6 +27,11 @@ class DocsRuntimeContext(SchemaYamlContext):
         self.node = node
         self.manifest = manifest
 
+    def _record_var(self, var_name: str) -> None:
+        # Descriptions are rendered after the files are parsed, so the var
+        # can't be tracked to the file it was used in
+        self.manifest.state_check.add_unattributed_var(var_name)
+
     @contextmember()
     def doc(self, *args: str) -> str:
         """The `doc` function is used to reference docs blocks in schema.yml
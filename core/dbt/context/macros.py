@@ -1,54 +1,171 @@
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Union,
+)
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.nodes import Macro
 from dbt.exceptions import DuplicateMacroNameError, PackageNotFoundForMacroError
 from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 
-FlatNamespace = Dict[str, MacroGenerator]
-NamespaceMember = Union[FlatNamespace, MacroGenerator]
-FullNamespace = Dict[str, NamespaceMember]
+# [macro name] = Macro
+MacrosByName = Dict[str, Macro]
+NamespaceMember = Union["PackageNamespace", MacroGenerator]
 
 
-# The point of this class is to collect the various macros
-# and provide the ability to flatten them into the ManifestContexts
-# that are created for jinja, so that macro calls can be resolved.
-# Creates special iterators and _keys methods to flatten the lists.
+# A package's macros, as seen from one context. The Macro dicts are shared
+# with the manifest and every other context, so nothing is copied when the
+# context is built: each macro is only bound to the context (as a
+# MacroGenerator) the first time it's looked up. Values that are assigned
+# (unit test macro overrides) are kept by the view and shadow the macros.
+class PackageNamespace(MutableMapping):
+    def __init__(self, namespace: "MacroNamespace", packages: List[MacrosByName]) -> None:
+        self._namespace = namespace
+        # searched in order, the first package with a macro wins
+        self._packages = packages
+        self._overrides: Dict[str, Any] = {}
+        self._deleted: Set[str] = set()
+
+    def _macro(self, name: str) -> Optional[Macro]:
+        if name in self._deleted:
+            return None
+        for macros in self._packages:
+            if name in macros:
+                return macros[name]
+        return None
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._overrides:
+            return self._overrides[name]
+        macro = self._macro(name)
+        if macro is None:
+            raise KeyError(name)
+        return self._namespace.bind(macro)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._deleted.discard(name)
+        self._overrides[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._overrides.pop(name, None)
+        self._deleted.add(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._overrides or (isinstance(name, str) and self._macro(name) is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        keys: Dict[str, None] = {}
+        for macros in self._packages:
+            keys.update(dict.fromkeys(macros))
+        keys.update(dict.fromkeys(self._overrides))
+        for key in keys:
+            if key in self:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# The point of this class is to resolve macro calls from the jinja contexts
+# built by ManifestContexts. It searches the macros of the node's package,
+# then the root package, then the package namespaces, then the internal
+# packages. The macros themselves come from the manifest's macros by package,
+# which are shared by every context, so building a MacroNamespace only costs
+# as much as the number of packages; macros are bound to this namespace's
+# context, node and macro stack when they are looked up.
 # When this class is created it has a static 'local_namespace' which
 # depends on the package of the node, so it only works for one
 # particular local package at a time for "flattening" into a context.
-# 'get_by_package' should work for any macro.
+# 'get_from_package' should work for any macro.
 class MacroNamespace(Mapping):
     def __init__(
         self,
-        global_namespace: FlatNamespace,  # root package macros
-        local_namespace: FlatNamespace,  # packages for *this* node
-        global_project_namespace: FlatNamespace,  # internal packages
-        packages: Dict[str, FlatNamespace],  # non-internal packages
-    ):
-        self.global_namespace: FlatNamespace = global_namespace
-        self.local_namespace: FlatNamespace = local_namespace
-        self.packages: Dict[str, FlatNamespace] = packages
-        self.global_project_namespace: FlatNamespace = global_project_namespace
-
-    def _search_order(self) -> Iterable[Union[FullNamespace, FlatNamespace]]:
-        yield self.local_namespace  # local package
-        yield self.global_namespace  # root package
-        # TODO CT-211
-        yield self.packages  # type: ignore[misc] # non-internal packages
-        yield {
-            # TODO CT-211
-            GLOBAL_PROJECT_NAME: self.global_project_namespace,  # type: ignore[misc] # dbt
+        macros_by_package: Mapping[str, MacrosByName],
+        root_package: str,
+        search_package: str,
+        internal_packages: List[str],
+        ctx: Dict[str, Any],
+        node: Optional[Any] = None,
+        thread_ctx: Optional[MacroStack] = None,
+    ) -> None:
+        internal_package_names = set(internal_packages)
+        # packages for *this* node
+        self.local_namespace: MacrosByName = {}
+        # root package macros
+        self.global_namespace: MacrosByName = {}
+        if search_package not in internal_package_names:
+            self.local_namespace = macros_by_package.get(search_package, {})
+        if root_package != search_package and root_package not in internal_package_names:
+            self.global_namespace = macros_by_package.get(root_package, {})
+        # non-internal packages
+        self.packages: Dict[str, MacrosByName] = {
+            package_name: macros
+            for package_name, macros in macros_by_package.items()
+            if package_name not in internal_package_names
         }
-        yield self.global_project_namespace  # other internal project besides dbt
+        # internal packages, the ones that are first in the list "win"
+        self.internal_packages: List[MacrosByName] = [
+            macros_by_package[package_name]
+            for package_name in internal_packages
+            if package_name in macros_by_package
+        ]
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        self._bound: Dict[str, MacroGenerator] = {}
+        self._package_namespaces: Dict[str, PackageNamespace] = {}
+
+    def bind(self, macro: Macro) -> MacroGenerator:
+        # MacroGenerator is in clients/jinja.py
+        # a MacroGenerator object is a callable object that will
+        # execute the MacroGenerator.__call__ function
+        if macro.unique_id not in self._bound:
+            self._bound[macro.unique_id] = MacroGenerator(
+                macro, self.ctx, self.node, self.thread_ctx
+            )
+        return self._bound[macro.unique_id]
+
+    def package_namespace(self, package_name: str) -> PackageNamespace:
+        if package_name not in self._package_namespaces:
+            if package_name == GLOBAL_PROJECT_NAME:
+                packages = self.internal_packages
+            else:
+                packages = [self.packages[package_name]]
+            self._package_namespaces[package_name] = PackageNamespace(self, packages)
+        return self._package_namespaces[package_name]
+
+    def _find_macro(self, name: str) -> Optional[Macro]:
+        for macros in (self.local_namespace, self.global_namespace):
+            if name in macros:
+                return macros[name]
+        return None
+
+    def _find_internal_macro(self, name: str) -> Optional[Macro]:
+        for macros in self.internal_packages:
+            if name in macros:
+                return macros[name]
+        return None
 
     # provides special keys method for MacroNamespace iterator
     # returns keys from local_namespace, global_namespace, packages,
     # global_project_namespace
     def _keys(self) -> Set[str]:
-        keys: Set[str] = set()
-        for search in self._search_order():
-            keys.update(search)
+        keys: Set[str] = set(self.local_namespace)
+        keys.update(self.global_namespace)
+        keys.update(self.packages)
+        keys.add(GLOBAL_PROJECT_NAME)
+        for macros in self.internal_packages:
+            keys.update(macros)
         return keys
 
     # special iterator using special keys
@@ -59,25 +176,90 @@ class MacroNamespace(Mapping):
     def __len__(self):
         return len(self._keys())
 
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        return (
+            self._find_macro(key) is not None
+            or key in self.packages
+            or key == GLOBAL_PROJECT_NAME
+            or self._find_internal_macro(key) is not None
+        )
+
     def __getitem__(self, key: str) -> NamespaceMember:
-        for dct in self._search_order():
-            if key in dct:
-                return dct[key]
+        macro = self._find_macro(key)
+        if macro is not None:
+            return self.bind(macro)
+        if key in self.packages or key == GLOBAL_PROJECT_NAME:
+            return self.package_namespace(key)
+        macro = self._find_internal_macro(key)
+        if macro is not None:
+            return self.bind(macro)
         raise KeyError(key)
 
     def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroGenerator]:
         if package_name is None:
             return self.get(name)
-        elif package_name == GLOBAL_PROJECT_NAME:
-            return self.global_project_namespace.get(name)
-        elif package_name in self.packages:
-            return self.packages[package_name].get(name)
+        elif package_name == GLOBAL_PROJECT_NAME or package_name in self.packages:
+            return self.package_namespace(package_name).get(name)
         else:
             raise PackageNotFoundForMacroError(package_name)
 
 
-# This class builds the MacroNamespace by adding macros to
-# internal_packages or packages, and locals/globals.
+# The jinja context of a ManifestContext. The macros in its MacroNamespace
+# are looked up when jinja resolves a name that isn't otherwise in the
+# context, instead of all being added to it up front.
+class ContextDict(Dict[str, Any]):
+    def __init__(self) -> None:
+        super().__init__()
+        self._namespace: Optional[MacroNamespace] = None
+
+    def set_namespace(self, namespace: MacroNamespace) -> None:
+        self._namespace = namespace
+
+    def __missing__(self, key: str) -> Any:
+        if self._namespace is None:
+            raise KeyError(key)
+        value = self._namespace[key]
+        super().__setitem__(key, value)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or (
+            self._namespace is not None and key in self._namespace
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):  # type: ignore[override]
+        keys = dict.fromkeys(super().keys())
+        if self._namespace is not None:
+            keys.update(dict.fromkeys(self._namespace))
+        return keys.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def items(self):  # type: ignore[override]
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):  # type: ignore[override]
+        return [self[key] for key in self.keys()]
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+
+# This class builds the MacroNamespace for a node. Macros can be added one
+# at a time, which checks them for duplicates, but 'build_namespace' uses
+# the manifest's macros by package directly when none have been added.
 # Call 'build_namespace' to return a MacroNamespace.
 # This is used by ManifestContext (and subclasses)
 class MacroNamespaceBuilder:
@@ -92,80 +274,36 @@ class MacroNamespaceBuilder:
         self.root_package = root_package
         self.search_package = search_package
         # internal packages comes from get_adapter_package_names
-        self.internal_package_names = set(internal_packages)
         self.internal_package_names_order = internal_packages
-        # macro_func is added here if in root package, since
-        # the root package acts as a "global" namespace, overriding
-        # everything else except local external package macro calls
-        self.globals: FlatNamespace = {}
-        # macro_func is added here if it's the package for this node
-        self.locals: FlatNamespace = {}
-        # Create a dictionary of [package name][macro name] =
-        #     MacroGenerator object which acts like a function
-        self.internal_packages: Dict[str, FlatNamespace] = {}
-        self.packages: Dict[str, FlatNamespace] = {}
+        # Create a dictionary of [package name][macro name] = Macro
+        self.macros_by_package: Dict[str, MacrosByName] = {}
         self.thread_ctx = thread_ctx
         self.node = node
 
-    def _add_macro_to(
-        self,
-        hierarchy: Dict[str, FlatNamespace],
-        macro: Macro,
-        macro_func: MacroGenerator,
-    ):
-        if macro.package_name in hierarchy:
-            namespace = hierarchy[macro.package_name]
-        else:
-            namespace = {}
-            hierarchy[macro.package_name] = namespace
-
+    def add_macro(self, macro: Macro) -> None:
+        namespace = self.macros_by_package.setdefault(macro.package_name, {})
         if macro.name in namespace:
-            raise DuplicateMacroNameError(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
-
-    def add_macro(self, macro: Macro, ctx: Dict[str, Any]) -> None:
-        macro_name: str = macro.name
+            raise DuplicateMacroNameError(namespace[macro.name], macro, macro.package_name)
+        namespace[macro.name] = macro
 
-        # MacroGenerator is in clients/jinja.py
-        # a MacroGenerator object is a callable object that will
-        # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
-
-        # internal macros (from plugins) will be processed separately from
-        # project macros, so store them in a different place
-        if macro.package_name in self.internal_package_names:
-            self._add_macro_to(self.internal_packages, macro, macro_func)
-        else:
-            # if it's not an internal package
-            self._add_macro_to(self.packages, macro, macro_func)
-            # add to locals if it's the package this node is in
-            if macro.package_name == self.search_package:
-                self.locals[macro_name] = macro_func
-            # add to globals if it's in the root package
-            elif macro.package_name == self.root_package:
-                self.globals[macro_name] = macro_func
-
-    def add_macros(self, macros: Iterable[Macro], ctx: Dict[str, Any]) -> None:
+    def add_macros(self, macros: Iterable[Macro]) -> None:
         for macro in macros:
-            self.add_macro(macro, ctx)
+            self.add_macro(macro)
 
     def build_namespace(
-        self, macros_by_package: Dict[str, Dict[str, Macro]], ctx: Dict[str, Any]
+        self, macros_by_package: Mapping[str, MacrosByName], ctx: Dict[str, Any]
     ) -> MacroNamespace:
-        for package in macros_by_package.values():
-            self.add_macros(package.values(), ctx)
-
-        # Iterate in reverse-order and overwrite: the packages that are first
-        # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
-        for pkg in reversed(self.internal_package_names_order):
-            if pkg in self.internal_packages:
-                # add the macros pointed to by this package name
-                global_project_namespace.update(self.internal_packages[pkg])
+        if self.macros_by_package:
+            for package in macros_by_package.values():
+                self.add_macros(package.values())
+            macros_by_package = self.macros_by_package
 
         return MacroNamespace(
-            global_namespace=self.globals,  # root package macros
-            local_namespace=self.locals,  # packages for *this* node
-            global_project_namespace=global_project_namespace,  # internal packages
-            packages=self.packages,  # non internal_packages
+            macros_by_package,
+            root_package=self.root_package,
+            search_package=self.search_package,
+            internal_packages=self.internal_package_names_order,
+            ctx=ctx,
+            node=self.node,
+            thread_ctx=self.thread_ctx,
         )
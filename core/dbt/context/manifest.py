@@ -7,7 +7,7 @@ from dbt.contracts.graph.manifest import Manifest
 
 from .base import contextproperty
 from .configured import ConfiguredContext
-from .macros import MacroNamespace, MacroNamespaceBuilder
+from .macros import ContextDict, MacroNamespace, MacroNamespaceBuilder
 
 
 class ManifestContext(ConfiguredContext):
@@ -30,14 +30,17 @@ class ManifestContext(ConfiguredContext):
         # this is the package of the node for which this context was built
         self.search_package = search_package
         self.macro_stack = MacroStack()
+        self._ctx = ContextDict()
         # This namespace is used by the BaseDatabaseWrapper in jinja rendering.
         # The namespace is passed to it when it's constructed. It expects
         # to be able to do: namespace.get_from_package(..)
         self.namespace = self._build_namespace()
+        if isinstance(self.namespace, MacroNamespace):
+            self._ctx.set_namespace(self.namespace)
 
     def _build_namespace(self) -> MacroNamespace:
-        # this takes all the macros in the manifest and adds them
-        # to the MacroNamespaceBuilder stored in self.namespace
+        # this builds a namespace over all the macros in the manifest, which
+        # binds them to self._ctx when they are looked up
         builder = self._get_namespace_builder()
         return builder.build_namespace(self.manifest.get_macros_by_package(), self._ctx)
 
@@ -63,7 +66,10 @@ class ManifestContext(ConfiguredContext):
             dct.update(self.namespace.local_namespace)
             dct.update(self.namespace.project_namespace)
         else:
-            dct.update(self.namespace)
+            # The other macros are looked up by the ContextDict when they're
+            # used, only the ones that override context members are added
+            for key in [key for key in dict.keys(dct) if key in self.namespace]:
+                dct[key] = self.namespace[key]
 
         return dct
 
@@ -51,6 +51,7 @@ from dbt.context.exceptions_jinja import wrapped_exports
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.macros import MacroNamespace, MacroNamespaceBuilder
 from dbt.context.manifest import ManifestContext
+from dbt.contracts.files import SourceFile
 from dbt.contracts.graph.manifest import Disabled, Manifest
 from dbt.contracts.graph.metrics import MetricReference, ResolvedMetricReference
 from dbt.contracts.graph.nodes import (
@@ -809,10 +810,11 @@ class ModelConfiguredVar(Var):
         context: Dict[str, Any],
         config: RuntimeConfig,
         node: Resource,
+        on_read: Optional[Callable[[str], None]] = None,
     ) -> None:
         self._node: Resource
         self._config: RuntimeConfig = config
-        super().__init__(context, config.cli_vars, node=node)
+        super().__init__(context, config.cli_vars, node=node, on_read=on_read)
 
     def packages_for_node(self) -> Iterable[Project]:
         dependencies = self._config.load_dependencies()
@@ -855,6 +857,7 @@ class UnitTestVar(RuntimeVar):
         context: Dict[str, Any],
         config: RuntimeConfig,
         node: Resource,
+        on_read: Optional[Callable[[str], None]] = None,
     ) -> None:
         config_copy = None
         assert isinstance(node, UnitTestNode)
@@ -862,7 +865,7 @@ class UnitTestVar(RuntimeVar):
             config_copy = deepcopy(config)
             config_copy.cli_vars.update(node.overrides.vars)
 
-        super().__init__(context, config_copy or config, node=node)
+        super().__init__(context, config_copy or config, node=node, on_read=on_read)
 
 
 # Providers
@@ -1325,8 +1328,24 @@ class ProviderContext(ManifestContext):
             context=self._ctx,
             config=self.config,
             node=self.model,
+            on_read=self._record_var,
         )
 
+    def _record_var(self, var_name: str) -> None:
+        # Save the var name in the source file, so that the file is reparsed
+        # when the value of the var changes. Vars read when compiling or
+        # running are irrelevant to parsing.
+        if self.provider.execute:
+            return
+        if self.model and self.model.file_id in self.manifest.files:
+            source_file = self.manifest.files[self.model.file_id]
+            if isinstance(source_file, SourceFile):
+                if var_name not in source_file.vars:
+                    source_file.vars.append(var_name)
+                return
+        # hooks come from dbt_project.yml which doesn't have a real file_id
+        self.manifest.state_check.add_unattributed_var(var_name)
+
     @contextproperty("adapter")
     def ctx_adapter(self) -> BaseDatabaseWrapper:
         """`adapter` is a wrapper around the internal database adapter used by
@@ -2029,6 +2048,20 @@ class TestContext(ProviderContext):
         else:
             raise EnvVarMissingError(var)
 
+    def _record_var(self, var_name: str) -> None:
+        if self.provider.execute:
+            return
+        # the "model" should only be test nodes, but just in case, check
+        # TODO CT-211
+        if self.model.resource_type == NodeType.Test and self.model.file_key_name:  # type: ignore[union-attr] # noqa
+            source_file = self.manifest.files[self.model.file_id]
+            # TODO CT-211
+            (yaml_key, name) = self.model.file_key_name.split(".")  # type: ignore[union-attr] # noqa
+            # TODO CT-211
+            source_file.add_var(var_name, yaml_key, name)  # type: ignore[union-attr]
+        else:
+            super()._record_var(var_name)
+
 
 def generate_test_context(
     model: ManifestNode,
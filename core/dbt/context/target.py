@@ -1,8 +1,55 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator
 
+from dbt.constants import TARGET_FIELD_VAR_PREFIX
 from dbt.context.base import BaseContext, contextproperty
 
 
+class TargetDict(dict):
+    """The target dict as seen from Jinja. Reports the name of each field
+    that's read from it, so partial parsing knows which fields were used."""
+
+    def __init__(self, target_dict: Dict[str, Any], on_read: Callable[[str], None]) -> None:
+        super().__init__(target_dict)
+        self._on_read = on_read
+
+    def _read_all(self) -> None:
+        for key in super().__iter__():
+            self._on_read(key)
+
+    def __getitem__(self, key: str) -> Any:
+        self._on_read(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            self._on_read(key)
+        return super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._on_read(key)
+        return super().get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        self._read_all()
+        return super().__iter__()
+
+    def keys(self):
+        self._read_all()
+        return super().keys()
+
+    def values(self):
+        self._read_all()
+        return super().values()
+
+    def items(self):
+        self._read_all()
+        return super().items()
+
+    def copy(self) -> Dict[str, Any]:
+        self._read_all()
+        return dict(super().items())
+
+
 class TargetContext(BaseContext):
     # subclass is ConfiguredContext
     def __init__(self, target_dict: Dict[str, Any], cli_vars: Dict[str, Any]):
@@ -71,4 +118,11 @@ class TargetContext(BaseContext):
             |----------|-----------|------------------------------------------|
 
         """
-        return self.target_dict
+        return TargetDict(self.target_dict, self._record_target_field)
+
+    def _record_target_field(self, field: str) -> None:
+        self._record_var(f"{TARGET_FIELD_VAR_PREFIX}{field}")
+
+    def _record_var(self, var_name: str) -> None:
+        # Overridden by the contexts used when parsing
+        pass
@@ -159,6 +159,9 @@ class SourceFile(BaseSourceFile):
     docs: List[str] = field(default_factory=list)
     macros: List[str] = field(default_factory=list)
     env_vars: List[str] = field(default_factory=list)
+    # names of the vars read with var() when parsing this file, and of the
+    # target fields read, like "target.schema"
+    vars: List[str] = field(default_factory=list)
 
     @classmethod
     def big_seed(cls, path: FilePath) -> "SourceFile":
@@ -213,6 +216,7 @@ class SchemaSourceFile(BaseSourceFile):
     # created too, but those are in 'sources'
     sop: List[SourceKey] = field(default_factory=list)
     env_vars: Dict[str, Any] = field(default_factory=dict)
+    vars: Dict[str, Any] = field(default_factory=dict)
     unrendered_configs: Dict[str, Any] = field(default_factory=dict)
     unrendered_databases: Dict[str, Any] = field(default_factory=dict)
     unrendered_schemas: Dict[str, Any] = field(default_factory=dict)
@@ -372,6 +376,22 @@ class SchemaSourceFile(BaseSourceFile):
             if not self.env_vars[yaml_key]:
                 del self.env_vars[yaml_key]
 
+    def add_var(self, var, yaml_key, name):
+        if yaml_key not in self.vars:
+            self.vars[yaml_key] = {}
+        if name not in self.vars[yaml_key]:
+            self.vars[yaml_key][name] = []
+        if var not in self.vars[yaml_key][name]:
+            self.vars[yaml_key][name].append(var)
+
+    def delete_from_vars(self, yaml_key, name):
+        # We delete all vars for this yaml_key/name because the
+        # entry has been scheduled for reparsing.
+        if yaml_key in self.vars and name in self.vars[yaml_key]:
+            del self.vars[yaml_key][name]
+            if not self.vars[yaml_key]:
+                del self.vars[yaml_key]
+
     def add_unrendered_database(self, yaml_key: str, name: str, unrendered_database: str) -> None:
         if yaml_key not in self.unrendered_databases:
             self.unrendered_databases[yaml_key] = {}
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+# The attributes of members and their configs that hold strings which are
+# commonly repeated across a project, or that are mostly shared by the nodes
+# of a package
+_MEMBER_STRINGS = ("package_name", "unique_id", "schema", "database", "group", "language")
+_MEMBER_LISTS = ("fqn", "tags")
+_CONFIG_STRINGS = ("materialized", "schema", "database", "incremental_strategy", "access")
+_COLUMN_STRINGS = ("name", "description", "data_type")
+
+
+class StringDeduplicator:
+    """Replaces equal strings with a single shared instance of them.
+
+    Members that are deserialized or parsed separately get their own copy of
+    every string, so package names, fqn segments, unique_ids in depends_on,
+    tags, column names, data types and boilerplate column descriptions are
+    stored once per use. Sharing one instance of each keeps only a reference
+    per use. Unlike sys.intern, the table is dropped when the deduplicator
+    is, so strings that stop being used are freed.
+    """
+
+    def __init__(self) -> None:
+        self._strings: Dict[str, str] = {}
+
+    def string(self, value: Any) -> Any:
+        if type(value) is not str:
+            return value
+        return self._strings.setdefault(value, value)
+
+    def strings(self, values: Optional[List[Any]]) -> None:
+        # in place, so the list is still the one the member refers to
+        if not values:
+            return
+        for i, value in enumerate(values):
+            if type(value) is str:
+                values[i] = self._strings.setdefault(value, value)
+
+    def _attributes(self, obj: Any, names: Iterable[str]) -> None:
+        for name in names:
+            value = getattr(obj, name, None)
+            if type(value) is str:
+                setattr(obj, name, self._strings.setdefault(value, value))
+
+    def member(self, member: Any) -> None:
+        self._attributes(member, _MEMBER_STRINGS)
+        for name in _MEMBER_LISTS:
+            self.strings(getattr(member, name, None))
+
+        depends_on = getattr(member, "depends_on", None)
+        if depends_on is not None:
+            self.strings(getattr(depends_on, "nodes", None))
+            self.strings(getattr(depends_on, "macros", None))
+
+        config = getattr(member, "config", None)
+        if config is not None:
+            self._attributes(config, _CONFIG_STRINGS)
+            self.strings(getattr(config, "tags", None))
+
+        columns = getattr(member, "columns", None)
+        if columns:
+            for column in columns.values():
+                self._attributes(column, _COLUMN_STRINGS)
+                self.strings(column.tags)
+            # The keys are usually the column names, so share those too
+            member.columns = {self.string(key): column for key, column in columns.items()}
@@ -0,0 +1,139 @@
+import threading
+import weakref
+from enum import Enum
+from typing import Any, Callable, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+# Values that can't be changed in place, so reading them can't lead to a
+# change that the other manifest would see
+_IMMUTABLE = (str, int, float, bool, bytes, frozenset, Enum, type(None))
+
+# The key, in the attributes shared by a member and its copy, of their _Link
+_LINK = "_copy_on_write_link"
+
+_lock = threading.RLock()
+_shared_classes: Dict[type, type] = {}
+
+
+class _Link:
+    """A member of a manifest and the copy of it that shares its attributes,
+    with the way to clone the member when either of them is about to change.
+    The copy is only weakly referenced, so that a manifest that outlives its
+    copy doesn't clone its members for it."""
+
+    __slots__ = ("original", "copy", "cls", "clone")
+
+    def __init__(self, original: Any, copy: Any, cls: type, clone: Callable[[Any], Any]) -> None:
+        self.original = original
+        self.copy = weakref.ref(copy)
+        self.cls = cls
+        self.clone = clone
+
+
+def unshare(member: Any) -> None:
+    """Give the copy of a shared member its own clone of it, and make both
+    of them plain members of their class again. The member keeps its own
+    attributes, so references to it and to the objects it holds still see
+    its changes. Does nothing if the member isn't shared."""
+    with _lock:
+        attributes = object.__getattribute__(member, "__dict__")
+        link = attributes.pop(_LINK, None)
+        if link is None:
+            return
+        object.__setattr__(link.original, "__class__", link.cls)
+        copy = link.copy()
+        if copy is not None:
+            clone = link.clone(link.original)
+            object.__setattr__(copy, "__dict__", clone.__dict__)
+            object.__setattr__(copy, "__class__", link.cls)
+
+
+def is_shared(member: Any) -> bool:
+    return _LINK in object.__getattribute__(member, "__dict__")
+
+
+def _shared_getattribute(self, name: str) -> Any:
+    if name.startswith("__") and name != "__dict__":
+        return object.__getattribute__(self, name)
+    attributes = object.__getattribute__(self, "__dict__")
+    if name in attributes:
+        if isinstance(attributes[name], _IMMUTABLE):
+            return attributes[name]
+    elif isinstance(getattr(type(self), name, None), property):
+        # whatever the property reads goes through here too
+        return object.__getattribute__(self, name)
+    # A mutable value, or a method, could be used to change the member
+    unshare(self)
+    return object.__getattribute__(self, name)
+
+
+def _shared_setattr(self, name: str, value: Any) -> None:
+    unshare(self)
+    setattr(self, name, value)
+
+
+def _shared_delattr(self, name: str) -> None:
+    unshare(self)
+    delattr(self, name)
+
+
+def _shared_eq(self, other: Any) -> bool:
+    unshare(self)
+    return self == other
+
+
+def _shared_reduce_ex(self, protocol: Any) -> Any:
+    unshare(self)
+    return self.__reduce_ex__(protocol)
+
+
+def _shared_class(cls: Type[T]) -> Type[T]:
+    shared = _shared_classes.get(cls)
+    if shared is None:
+        with _lock:
+            shared = _shared_classes.get(cls)
+            if shared is None:
+                shared = type(
+                    cls.__name__,
+                    (cls,),
+                    {
+                        "__module__": cls.__module__,
+                        "__qualname__": cls.__qualname__,
+                        "__getattribute__": _shared_getattribute,
+                        "__setattr__": _shared_setattr,
+                        "__delattr__": _shared_delattr,
+                        "__eq__": _shared_eq,
+                        "__hash__": cls.__hash__,
+                        "__reduce_ex__": _shared_reduce_ex,
+                    },
+                )
+                _shared_classes[cls] = shared
+    return shared
+
+
+def share(member: T, clone: Callable[[T], T]) -> T:
+    """Returns a copy of member that shares its attributes with it, without
+    copying any of them. The member and its copy are each other's until one
+    of them is about to be changed, when unshare gives the copy a clone of
+    the member, made with `clone`.
+
+    Both are write-barriered by switching them to a subclass of the member's
+    class, which unshares them before an attribute is set or deleted, and
+    before a value that could be changed in place (a list, dict or object)
+    or a method is read from them. Reading strings, numbers, enums and
+    properties that only read those keeps them shared. References to the
+    objects held by the member that were taken before it was shared, or
+    through its __dict__, go around the barrier, so they must not be used to
+    change it.
+    """
+    if is_shared(member):
+        unshare(member)
+    cls = type(member)
+    shared = _shared_class(cls)
+    copy = object.__new__(shared)
+    attributes = member.__dict__
+    attributes[_LINK] = _Link(member, copy, cls, clone)
+    object.__setattr__(copy, "__dict__", attributes)
+    object.__setattr__(member, "__class__", shared)
+    return copy
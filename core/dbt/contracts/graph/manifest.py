@@ -1,5 +1,9 @@
 import enum
+import re
+import threading
 from collections import defaultdict
+from collections.abc import ItemsView, ValuesView
+from copy import deepcopy
 from dataclasses import dataclass, field, replace
 from itertools import chain
 from multiprocessing.synchronize import Lock
@@ -10,6 +14,7 @@ from typing import (
     DefaultDict,
     Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -35,7 +40,11 @@ from dbt.adapters.factory import get_adapter_package_names
 from dbt.artifacts.resources import BaseResource, DeferRelation, NodeVersion, RefArgs
 from dbt.artifacts.resources.v1.config import NodeConfig
 from dbt.artifacts.schemas.manifest import ManifestMetadata, UniqueID, WritableManifest
-from dbt.clients.jinja_static import statically_parse_ref_or_source
+from dbt.clients.jinja_static import (
+    statically_extract_has_name,
+    statically_parse_ref_or_source,
+)
+from dbt.constants import TARGET_FIELD_VAR_PREFIX
 from dbt.contracts.files import (
     AnySourceFile,
     FileHash,
@@ -43,6 +52,8 @@ from dbt.contracts.files import (
     SchemaSourceFile,
     SourceFile,
 )
+from dbt.contracts.graph.compact import StringDeduplicator
+from dbt.contracts.graph.copy_on_write import share
 from dbt.contracts.graph.nodes import (
     RESOURCE_CLASS_TO_NODE_CLASS,
     BaseNode,
@@ -179,6 +190,8 @@ class RefableLookup(dbtClassMixin):
 
     def __init__(self, manifest: "Manifest") -> None:
         self.storage: Dict[str, Dict[PackageName, UniqueID]] = {}
+        # the storage keys each node was added under, for remove_node
+        self._node_keys: Dict[UniqueID, List[Tuple[str, PackageName]]] = {}
         self.populate(manifest)
 
     def get_unique_id(
@@ -248,14 +261,25 @@ class RefableLookup(dbtClassMixin):
             if node.name not in self.storage:
                 self.storage[node.name] = {}
 
+            keys = self._node_keys.setdefault(node.unique_id, [])
             if node.is_versioned:
                 if node.search_name not in self.storage:
                     self.storage[node.search_name] = {}
                 self.storage[node.search_name][node.package_name] = node.unique_id
+                keys.append((node.search_name, node.package_name))
                 if node.is_latest_version:  # type: ignore
                     self.storage[node.name][node.package_name] = node.unique_id
+                    keys.append((node.name, node.package_name))
             else:
                 self.storage[node.name][node.package_name] = node.unique_id
+                keys.append((node.name, node.package_name))
+
+    def remove_node(self, unique_id: UniqueID) -> None:
+        """Remove a node from the lookup, under the names it was added with,
+        so that it can be added again after its name or version changes."""
+        for key, package_name in self._node_keys.pop(unique_id, []):
+            if self.storage.get(key, {}).get(package_name) == unique_id:
+                del self.storage[key][package_name]
 
     def populate(self, manifest):
         for node in manifest.nodes.values():
@@ -413,6 +437,8 @@ class SemanticModelByMeasureLookup(dbtClassMixin):
 class DisabledLookup(dbtClassMixin):
     def __init__(self, manifest: "Manifest") -> None:
         self.storage: Dict[str, Dict[PackageName, List[Any]]] = {}
+        # the storage key each node was added under, by node id, for remove_node
+        self._node_keys: Dict[int, Tuple[str, PackageName]] = {}
         self.populate(manifest)
 
     def populate(self, manifest: "Manifest"):
@@ -425,6 +451,18 @@ class DisabledLookup(dbtClassMixin):
         if node.package_name not in self.storage[node.search_name]:
             self.storage[node.search_name][node.package_name] = []
         self.storage[node.search_name][node.package_name].append(node)
+        self._node_keys[id(node)] = (node.search_name, node.package_name)
+
+    def remove_node(self, node: GraphMemberNode) -> None:
+        """Remove a node from the lookup, under the name it was added with,
+        so that it can be added again after its name or version changes."""
+        if id(node) not in self._node_keys:
+            return
+        search_name, package_name = self._node_keys.pop(id(node))
+        pkg_dct = self.storage[search_name]
+        pkg_dct[package_name] = [n for n in pkg_dct[package_name] if n is not node]
+        if not pkg_dct[package_name]:
+            del pkg_dct[package_name]
 
     # This should return a list of disabled nodes. It's different from
     # the other Lookup functions in that it returns full nodes, not just unique_ids
@@ -509,6 +547,158 @@ class SingularTestLookup(dbtClassMixin):
         return node
 
 
+class FlatGraphSection(Dict[str, Any]):
+    """One of the collections in the 'graph' context variable, e.g.
+    `graph.nodes`. It has the members of the manifest's collection when the
+    flat graph was built, and serializes each member with
+    `to_dict(omit_none=False)` the first time it is read. Members that are
+    changed in place afterwards, e.g. by compiling them, have to be
+    snapshotted before they're changed, so that the section shows them as
+    they were when the graph was built.
+
+    It is a dict so that it can be used wherever the flat graph's dictionaries
+    could, but it is read-only.
+    """
+
+    def __init__(self, members: Mapping[str, Any]) -> None:
+        super().__init__(dict.fromkeys(members))
+        self._members = dict(members)
+        # unique_id -> the member's dictionary
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if not super().__contains__(key):
+            raise KeyError(key)
+        return self._serialize(key)
+
+    def _serialize(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            # Held while serializing, so that a member isn't changed by a
+            # snapshotting thread while another thread serializes it
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._members[key].to_dict(omit_none=False)
+                    self._entries[key] = entry
+        return entry
+
+    def snapshot(self, key: str) -> None:
+        """Serialize a member that is about to be changed in place"""
+        if super().__contains__(key):
+            self._serialize(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    # Overriding __iter__ makes dict() and ** copy the serialized members
+    def __iter__(self):
+        return super().__iter__()
+
+    def __eq__(self, other: object) -> bool:
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        return (self.__class__, (self._members,))
+
+    def items(self):  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self):  # type: ignore[override]
+        return ValuesView(self)
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def _read_only(self, *args, **kwargs):
+        raise dbt_common.exceptions.DbtInternalError("The flat graph is read-only")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+
+FLAT_GRAPH_SECTIONS = (
+    "exposures",
+    "groups",
+    "metrics",
+    "nodes",
+    "sources",
+    "semantic_models",
+    "saved_queries",
+)
+
+
+class FlatGraph(Dict[str, Any]):
+    """The 'graph' context variable for a manifest that doesn't refer to it
+    statically. Its sections are only built if it is read anyway, e.g.
+    through `context['graph']`.
+    """
+
+    def __init__(self, manifest: "Manifest") -> None:
+        super().__init__(dict.fromkeys(FLAT_GRAPH_SECTIONS))
+        self._manifest = manifest
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if value is None and key in FLAT_GRAPH_SECTIONS:
+            value = FlatGraphSection(getattr(self._manifest, key))
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    # Overriding __iter__ makes dict() and ** build the sections
+    def __iter__(self):
+        return super().__iter__()
+
+    def __eq__(self, other: object) -> bool:
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    def items(self):  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self):  # type: ignore[override]
+        return ValuesView(self)
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+
+_GRAPH_NAME = re.compile(r"\bgraph\b")
+
+
+def _refers_to_graph(source: str) -> bool:
+    # the substring check is much faster than the regex, and usually enough
+    if "graph" not in source or not _GRAPH_NAME.search(source):
+        return False
+    try:
+        return statically_extract_has_name(source, "graph")
+    except Exception:
+        # If it can't be parsed, assume that it does
+        return True
+
+
 def _packages_to_search(
     current_project: str,
     node_package: str,
@@ -557,10 +747,143 @@ def build_macro_edges(nodes: List[Any]):
     return _sort_values(forward_edges)
 
 
+class SortedEdgeMap(Mapping[str, List[str]]):
+    """A read-only view of the parent or child map of a NodeEdgeIndex. Each
+    member's edges are only sorted when they're read, and stay sorted until
+    they change. The lists are shared between reads and must not be modified.
+    """
+
+    def __init__(self, members: Mapping[str, Any], sort: Callable[[str], List[str]]) -> None:
+        self._members = members
+        self._sort = sort
+        # unique_id -> sorted edges, dropped by the index when they change
+        self._sorted: Dict[str, List[str]] = {}
+
+    def __getitem__(self, unique_id: str) -> List[str]:
+        try:
+            return self._sorted[unique_id]
+        except KeyError:
+            if unique_id not in self._members:
+                raise
+        edges = self._sorted[unique_id] = self._sort(unique_id)
+        return edges
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        sorted_edges = self._sorted
+        for unique_id in self._members:
+            if unique_id not in sorted_edges:
+                sorted_edges[unique_id] = self._sort(unique_id)
+        return {unique_id: sorted_edges[unique_id] for unique_id in self._members}
+
+
+class NodeEdgeIndex:
+    """The parents and children of the members of a manifest's graph, kept up
+    to date as members are added, replaced, removed or have their
+    depends_on.nodes changed.
+
+    Members get their depends_on.nodes filled in after they're added to the
+    manifest, and whole collections are replaced, so instead of hooking every
+    place that changes them, 'update' compares each member (by identity) and
+    its parents with the ones it saw last, and only updates the edges of the
+    members that changed. That's linear in the size of the graph and involves
+    no sorting; the edges are sorted by the SortedEdgeMaps when they're read.
+    """
+
+    def __init__(self) -> None:
+        # unique_id -> (member, its parents as of the last update)
+        self._members: Dict[str, Tuple[Any, List[str]]] = {}
+        # unique_id -> {child unique_id: number of times it lists the parent}
+        self._children: Dict[str, Dict[str, int]] = {}
+        self.parent_map = SortedEdgeMap(self._members, self._sort_parents)
+        self.child_map = SortedEdgeMap(self._members, self._sort_children)
+
+    def update(self, collections: List[Mapping[str, Any]]) -> None:
+        members = self._members
+        seen = 0
+        for unique_id, member in chain.from_iterable(c.items() for c in collections):
+            seen += 1
+            parents = member.depends_on_nodes
+            current = members.get(unique_id)
+            if current is None or current[0] is not member or current[1] != parents:
+                self._set_parents(unique_id, member, parents)
+        if seen < len(members):
+            self._remove_missing(collections)
+
+    def _remove_missing(self, collections: List[Mapping[str, Any]]) -> None:
+        present = set(chain.from_iterable(collections))
+        for unique_id in [unique_id for unique_id in self._members if unique_id not in present]:
+            self._unlink(unique_id, self._members.pop(unique_id)[1])
+            self.parent_map._sorted.pop(unique_id, None)
+
+    def _set_parents(self, unique_id: str, member: Any, parents: List[str]) -> None:
+        current = self._members.get(unique_id)
+        if current is not None:
+            self._unlink(unique_id, current[1])
+            self.parent_map._sorted.pop(unique_id, None)
+        self._members[unique_id] = (member, parents[:])
+        sorted_children = self.child_map._sorted
+        for parent in parents:
+            children = self._children.setdefault(parent, {})
+            children[unique_id] = children.get(unique_id, 0) + 1
+            sorted_children.pop(parent, None)
+
+    def _unlink(self, unique_id: str, parents: List[str]) -> None:
+        sorted_children = self.child_map._sorted
+        for parent in parents:
+            children = self._children[parent]
+            children[unique_id] -= 1
+            if not children[unique_id]:
+                del children[unique_id]
+            sorted_children.pop(parent, None)
+
+    def _sort_parents(self, unique_id: str) -> List[str]:
+        return sorted(self._members[unique_id][1])
+
+    def _sort_children(self, unique_id: str) -> List[str]:
+        children = self._children.get(unique_id, {})
+        if len(children) == sum(children.values()):
+            return sorted(children)
+        # a child that lists the same parent more than once is its child as
+        # many times, as in build_node_edges
+        return sorted(chain.from_iterable([child] * count for child, count in children.items()))
+
+
 def _deepcopy(value):
     return value.from_dict(value.to_dict(omit_none=True))
 
 
+def _share(value):
+    return share(value, _deepcopy)
+
+
+# The collections whose members Manifest.deepcopy shares with the copy
+_SHARED_COLLECTIONS = (
+    "nodes",
+    "sources",
+    "macros",
+    "docs",
+    "exposures",
+    "metrics",
+    "groups",
+    "files",
+    "semantic_models",
+    "unit_tests",
+    "saved_queries",
+)
+
+
 class Locality(enum.IntEnum):
     Core = 1
     Imported = 2
@@ -850,15 +1173,51 @@ class MacroMethods:
 class ParsingInfo:
     static_analysis_parsed_path_count: int = 0
     static_analysis_path_count: int = 0
+    # file_id -> why the file couldn't be statically analyzed and was rendered
+    static_analysis_fallback_reasons: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
 class ManifestStateCheck(dbtClassMixin):
+    # A hash of the dbt version only. vars and the target are hashed in
+    # cli_var_hashes and target_hashes.
     vars_hash: FileHash = field(default_factory=FileHash.empty)
     project_env_vars_hash: FileHash = field(default_factory=FileHash.empty)
     profile_env_vars_hash: FileHash = field(default_factory=FileHash.empty)
     profile_hash: FileHash = field(default_factory=FileHash.empty)
     project_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    # The rendered configs of all projects, which --vars can change
+    project_config_hash: FileHash = field(default_factory=FileHash.empty)
+    # A hash of the value of each var passed with --vars, and of each field of
+    # the target. Files that read a var or target field with a changed value
+    # are reparsed.
+    cli_var_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    target_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    # vars and target fields read while parsing that couldn't be tracked to
+    # a file, such as in hooks or descriptions. If one of these changes, the
+    # whole project is reparsed.
+    unattributed_vars: List[str] = field(default_factory=list)
+
+    def add_unattributed_var(self, var_name: str) -> None:
+        if var_name not in self.unattributed_vars:
+            self.unattributed_vars.append(var_name)
+
+    def changed_vars(self, other: "ManifestStateCheck") -> Set[str]:
+        """Return the names of the --vars and target fields that were added,
+        removed or changed since the other state check. Target fields are
+        named like they're recorded when they're read, e.g. "target.schema"."""
+        changed = _changed_keys(self.cli_var_hashes, other.cli_var_hashes)
+        for target_field in _changed_keys(self.target_hashes, other.target_hashes):
+            changed.add(f"{TARGET_FIELD_VAR_PREFIX}{target_field}")
+        return changed
+
+
+def _changed_keys(
+    hashes: Mapping[str, FileHash], other_hashes: Mapping[str, FileHash]
+) -> Set[str]:
+    return {
+        key for key in set(hashes) | set(other_hashes) if hashes.get(key) != other_hashes.get(key)
+    }
 
 
 NodeClassT = TypeVar("NodeClassT", bound="BaseNode")
@@ -935,6 +1294,26 @@ class Manifest(MacroMethods, dbtClassMixin):
         default=None,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    _refers_to_graph: Optional[bool] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    _edges: Optional[NodeEdgeIndex] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    # The unique_ids of the members added since track_dirty was called, in the
+    # order they were added. None when they aren't being tracked.
+    _dirty: Optional[Dict[str, None]] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    # The indexes that the node selection methods look members up in, built
+    # as they're needed. See dbt.graph.selector_methods.SelectorIndex
+    _selector_index: Optional[Any] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self, context: Optional[Dict] = None):
         # serialization won't work with anything except an empty source_patches because
@@ -951,22 +1330,50 @@ class Manifest(MacroMethods, dbtClassMixin):
         """This attribute is used in context.common by each node, so we want to
         only build it once and avoid any concurrency issues around it.
         Make sure you don't call this until you're done with building your
-        manifest!
+        manifest! The members of each section are only serialized when the
+        'graph' context variable is used to read them, and the sections are
+        only built when they're read if no macro or node refers to 'graph'.
         """
+        if not self.refers_to_graph():
+            self.flat_graph = FlatGraph(self)
+            return
+
         self.flat_graph = {
-            "exposures": {k: v.to_dict(omit_none=False) for k, v in self.exposures.items()},
-            "groups": {k: v.to_dict(omit_none=False) for k, v in self.groups.items()},
-            "metrics": {k: v.to_dict(omit_none=False) for k, v in self.metrics.items()},
-            "nodes": {k: v.to_dict(omit_none=False) for k, v in self.nodes.items()},
-            "sources": {k: v.to_dict(omit_none=False) for k, v in self.sources.items()},
-            "semantic_models": {
-                k: v.to_dict(omit_none=False) for k, v in self.semantic_models.items()
-            },
-            "saved_queries": {
-                k: v.to_dict(omit_none=False) for k, v in self.saved_queries.items()
-            },
+            section: FlatGraphSection(getattr(self, section)) for section in FLAT_GRAPH_SECTIONS
         }
 
+    def refers_to_graph(self) -> bool:
+        """Whether any macro, node or hook in the manifest refers to the 'graph'
+        context variable, found by statically parsing their jinja.
+        """
+        if self._refers_to_graph is None:
+            sources = chain(
+                (macro.macro_sql for macro in self.macros.values()),
+                (node.raw_code for node in self.nodes.values()),
+                (
+                    hook.sql
+                    for node in self.nodes.values()
+                    for hook in chain(
+                        getattr(node.config, "pre_hook", []), getattr(node.config, "post_hook", [])
+                    )
+                ),
+            )
+            self._refers_to_graph = any(_refers_to_graph(source) for source in sources)
+        return self._refers_to_graph
+
+    def snapshot_flat_graph_node(self, unique_id: str) -> None:
+        """Nodes are changed in place when they are compiled, so the flat
+        graph has to serialize them first to keep showing them as they were
+        when it was built.
+        """
+        # This doesn't build the section of a FlatGraph that hasn't been
+        # read: the project doesn't refer to 'graph', so the section is only
+        # built if it's read dynamically, and then shows the nodes as they
+        # are at that point.
+        nodes = dict.get(self.flat_graph, "nodes")
+        if isinstance(nodes, FlatGraphSection):
+            nodes.snapshot(unique_id)
+
     def build_disabled_by_file_id(self):
         disabled_by_file_id = {}
         for node_list in self.disabled.values():
@@ -1075,41 +1482,70 @@ class Manifest(MacroMethods, dbtClassMixin):
         return frozenset(x.database for x in chain(self.nodes.values(), self.sources.values()))
 
     def deepcopy(self):
+        """Copy the manifest. The copy shares each member with this manifest
+        until either of them is about to change it, when the copy is given a
+        clone of it, so members that are only read are never cloned. Neither
+        manifest sees changes the other makes to its members afterwards.
+        See dbt.contracts.graph.copy_on_write.share for the changes that
+        can't be seen to.
+        """
+        # Finding this for the copy would unshare all of its macros and nodes
+        refers_to_graph = self.refers_to_graph()
         copy = Manifest(
-            nodes={k: _deepcopy(v) for k, v in self.nodes.items()},
-            sources={k: _deepcopy(v) for k, v in self.sources.items()},
-            macros={k: _deepcopy(v) for k, v in self.macros.items()},
-            docs={k: _deepcopy(v) for k, v in self.docs.items()},
-            exposures={k: _deepcopy(v) for k, v in self.exposures.items()},
-            metrics={k: _deepcopy(v) for k, v in self.metrics.items()},
-            groups={k: _deepcopy(v) for k, v in self.groups.items()},
-            selectors={k: _deepcopy(v) for k, v in self.selectors.items()},
             metadata=self.metadata,
-            disabled={k: _deepcopy(v) for k, v in self.disabled.items()},
-            files={k: _deepcopy(v) for k, v in self.files.items()},
             state_check=_deepcopy(self.state_check),
-            semantic_models={k: _deepcopy(v) for k, v in self.semantic_models.items()},
-            unit_tests={k: _deepcopy(v) for k, v in self.unit_tests.items()},
-            saved_queries={k: _deepcopy(v) for k, v in self.saved_queries.items()},
+            selectors=deepcopy(self.selectors),
+            disabled={k: [_share(node) for node in v] for k, v in self.disabled.items()},
+            **{
+                name: {k: _share(v) for k, v in getattr(self, name).items()}
+                for name in _SHARED_COLLECTIONS
+            },
         )
+        copy._refers_to_graph = refers_to_graph
         copy.build_flat_graph()
         return copy
 
+    def compact(self) -> None:
+        """Share a single instance of each of the strings that repeat across
+        the members of the manifest, such as package names, fqn segments,
+        the unique_ids in depends_on, tags, column names and data types.
+        This makes large manifests take considerably less memory while they
+        are used by a command, at the cost of a pass over every member.
+        """
+        deduplicator = StringDeduplicator()
+        for member in chain(
+            self.nodes.values(),
+            self.sources.values(),
+            self.macros.values(),
+            self.exposures.values(),
+            self.metrics.values(),
+            self.semantic_models.values(),
+            self.saved_queries.values(),
+            self.unit_tests.values(),
+            chain.from_iterable(self.disabled.values()),
+        ):
+            deduplicator.member(member)
+
     def build_parent_and_child_maps(self):
-        edge_members = list(
-            chain(
-                self.nodes.values(),
-                self.sources.values(),
-                self.exposures.values(),
-                self.metrics.values(),
-                self.semantic_models.values(),
-                self.saved_queries.values(),
-                self.unit_tests.values(),
-            )
+        """Bring child_map and parent_map up to date with the manifest. Only
+        the edges of members that were added, removed or changed since the
+        last call are updated; see NodeEdgeIndex.
+        """
+        if self._edges is None:
+            self._edges = NodeEdgeIndex()
+        self._edges.update(
+            [
+                self.nodes,
+                self.sources,
+                self.exposures,
+                self.metrics,
+                self.semantic_models,
+                self.saved_queries,
+                self.unit_tests,
+            ]
         )
-        forward_edges, backward_edges = build_node_edges(edge_members)
-        self.child_map = forward_edges
-        self.parent_map = backward_edges
+        self.child_map = self._edges.child_map
+        self.parent_map = self._edges.parent_map
 
     def build_macro_child_map(self):
         edge_members = list(
@@ -1206,6 +1642,8 @@ class Manifest(MacroMethods, dbtClassMixin):
         self.build_parent_and_child_maps()
         self.build_group_map()
         self.fill_tracking_metadata()
+        edges = self._edges
+        assert edges is not None, "build_parent_and_child_maps builds the edge index"
 
         return WritableManifest(
             nodes=self._map_nodes_to_map_resources(self.nodes),
@@ -1218,8 +1656,8 @@ class Manifest(MacroMethods, dbtClassMixin):
             selectors=self.selectors,
             metadata=self.metadata,
             disabled=self._map_list_nodes_to_map_list_resources(self.disabled),
-            child_map=self.child_map,
-            parent_map=self.parent_map,
+            child_map=edges.child_map.to_dict(),
+            parent_map=edges.parent_map.to_dict(),
             group_map=self.group_map,
             semantic_models=self._map_nodes_to_map_resources(self.semantic_models),
             unit_tests=self._map_nodes_to_map_resources(self.unit_tests),
@@ -1263,6 +1701,25 @@ class Manifest(MacroMethods, dbtClassMixin):
     def rebuild_doc_lookup(self):
         self._doc_lookup = DocLookup(self)
 
+    def clear_lookups(self):
+        """Drop the lookups and macro indexes, so they're built from the current
+        contents of the manifest the next time they're used, as they are for a
+        manifest that was just read from disk."""
+        self._doc_lookup = None
+        self._source_lookup = None
+        self._ref_lookup = None
+        self._metric_lookup = None
+        self._saved_query_lookup = None
+        self._semantic_model_by_measure_lookup = None
+        self._disabled_lookup = None
+        self._analysis_lookup = None
+        self._singular_test_lookup = None
+        self._macros_by_name = None
+        self._macros_by_package = None
+        self._refers_to_graph = None
+        self._parsing_info = ParsingInfo()
+        self.flat_graph = {}
+
     @property
     def source_lookup(self) -> SourceLookup:
         if self._source_lookup is None:
@@ -1561,6 +2018,23 @@ class Manifest(MacroMethods, dbtClassMixin):
         # Rebuild the flat_graph, which powers the 'graph' context variable
         self.build_flat_graph()
 
+    def track_dirty(self) -> None:
+        """Start recording the unique_ids of the macros, nodes, sources,
+        exposures, metrics, semantic models, unit tests and saved queries that
+        are added to the manifest. When partially parsing, those are the members
+        that were added, changed or depend on something that changed, and the
+        only ones that need to be processed after parsing.
+        """
+        self._dirty = {}
+
+    def mark_dirty(self, unique_id: str) -> None:
+        if self._dirty is not None:
+            self._dirty[unique_id] = None
+
+    @property
+    def dirty(self) -> Optional[Dict[str, None]]:
+        return self._dirty
+
     # Methods that were formerly in ParseResult
     def add_macro(self, source_file: SourceFile, macro: Macro):
         if macro.unique_id in self.macros:
@@ -1568,6 +2042,7 @@ class Manifest(MacroMethods, dbtClassMixin):
             raise DuplicateMacroInPackageError(macro=macro, macro_mapping=self.macros)
 
         self.macros[macro.unique_id] = macro
+        self.mark_dirty(macro.unique_id)
 
         if self._macros_by_name is None:
             self._macros_by_name = self._build_macros_by_name(self.macros)
@@ -1600,12 +2075,16 @@ class Manifest(MacroMethods, dbtClassMixin):
         # sources can't be overwritten!
         _check_duplicates(source, self.sources)
         self.sources[source.unique_id] = source  # type: ignore
+        self.mark_dirty(source.unique_id)
         source_file.sources.append(source.unique_id)
 
     def add_node_nofile(self, node: ManifestNode):
         # nodes can't be overwritten!
         _check_duplicates(node, self.nodes)
         self.nodes[node.unique_id] = node
+        self.mark_dirty(node.unique_id)
+        if self._ref_lookup is not None:
+            self._ref_lookup.add_node(node)
 
     def add_node(self, source_file: AnySourceFile, node: ManifestNode, test_from=None):
         self.add_node_nofile(node)
@@ -1629,6 +2108,7 @@ class Manifest(MacroMethods, dbtClassMixin):
     def add_exposure(self, source_file: SchemaSourceFile, exposure: Exposure):
         _check_duplicates(exposure, self.exposures)
         self.exposures[exposure.unique_id] = exposure
+        self.mark_dirty(exposure.unique_id)
         source_file.exposures.append(exposure.unique_id)
 
     def add_metric(
@@ -1636,6 +2116,7 @@ class Manifest(MacroMethods, dbtClassMixin):
     ):
         _check_duplicates(metric, self.metrics)
         self.metrics[metric.unique_id] = metric
+        self.mark_dirty(metric.unique_id)
         if not generated_from:
             source_file.metrics.append(metric.unique_id)
         else:
@@ -1652,6 +2133,8 @@ class Manifest(MacroMethods, dbtClassMixin):
             self.disabled[node.unique_id].append(node)
         else:
             self.disabled[node.unique_id] = [node]
+        if self._disabled_lookup is not None:
+            self._disabled_lookup.add_node(node)
 
     def add_disabled(self, source_file: AnySourceFile, node: GraphMemberNode, test_from=None):
         self.add_disabled_nofile(node)
@@ -1682,12 +2165,14 @@ class Manifest(MacroMethods, dbtClassMixin):
     def add_semantic_model(self, source_file: SchemaSourceFile, semantic_model: SemanticModel):
         _check_duplicates(semantic_model, self.semantic_models)
         self.semantic_models[semantic_model.unique_id] = semantic_model
+        self.mark_dirty(semantic_model.unique_id)
         source_file.semantic_models.append(semantic_model.unique_id)
 
     def add_unit_test(self, source_file: SchemaSourceFile, unit_test: UnitTestDefinition):
         if unit_test.unique_id in self.unit_tests:
             raise DuplicateResourceNameError(unit_test, self.unit_tests[unit_test.unique_id])
         self.unit_tests[unit_test.unique_id] = unit_test
+        self.mark_dirty(unit_test.unique_id)
         source_file.unit_tests.append(unit_test.unique_id)
 
     def add_fixture(self, source_file: FixtureSourceFile, fixture: UnitTestFileFixture):
@@ -1699,6 +2184,7 @@ class Manifest(MacroMethods, dbtClassMixin):
     def add_saved_query(self, source_file: SchemaSourceFile, saved_query: SavedQuery) -> None:
         _check_duplicates(saved_query, self.saved_queries)
         self.saved_queries[saved_query.unique_id] = saved_query
+        self.mark_dirty(saved_query.unique_id)
         source_file.saved_queries.append(saved_query.unique_id)
 
     # end of methods formerly in ParseResult
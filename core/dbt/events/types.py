@@ -588,7 +588,7 @@ class StateCheckVarsHash(DebugLevel):
         return "I025"
 
     def message(self) -> str:
-        return f"checksum: {self.checksum}, vars: {self.vars}, profile: {self.profile}, target: {self.target}, version: {self.version}"
+        return f"version: {self.version}, version checksum: {self.checksum}, vars: {self.vars}, profile: {self.profile}, target: {self.target}"
 
 
 # Skipped I025, I026, I026, I027
@@ -1,6 +1,5 @@
 from functools import partial
-from itertools import product
-from typing import Iterable, Iterator, NewType, Optional, Set
+from typing import Dict, Iterable, Iterator, List, NewType, Optional, Set, Tuple
 
 import networkx as nx  # type: ignore
 
@@ -9,6 +8,75 @@ from dbt_common.exceptions import DbtInternalError
 UniqueId = NewType("UniqueId", str)
 
 
+class AncestryIndex:
+    """The descendants of every node of a DAG, computed once in topological
+    order, so that they can be looked up without walking the graph.
+
+    Each node is given a bit, in topological order, and the descendants of a
+    node are kept as a bitset (an int) that combines the bitsets of its
+    children. They are computed the first time they are used. The graph must
+    not change afterwards.
+
+    The bitsets take up to a bit per pair of nodes, which adds up on large
+    graphs, so an index is meant to be built for one pass over the graph and
+    dropped afterwards rather than kept around.
+    """
+
+    def __init__(self, graph: nx.DiGraph) -> None:
+        self.graph = graph
+        self._node_ids: List[UniqueId] = list(nx.topological_sort(graph))
+        self._indexes: Dict[UniqueId, int] = {
+            node_id: index for index, node_id in enumerate(self._node_ids)
+        }
+        self._descendant_bits: Optional[List[int]] = None
+
+    def _get_descendant_bits(self) -> List[int]:
+        if self._descendant_bits is None:
+            descendant_bits = [0] * len(self._node_ids)
+            for index in reversed(range(len(self._node_ids))):
+                bits = 0
+                for child_id in self.graph.succ[self._node_ids[index]]:
+                    child = self._indexes[child_id]
+                    bits |= descendant_bits[child] | (1 << child)
+                descendant_bits[index] = bits
+            self._descendant_bits = descendant_bits
+        return self._descendant_bits
+
+    def _node_set(self, bits: int) -> Set[UniqueId]:
+        nodes: Set[UniqueId] = set()
+        # the binary digits, lowest first
+        digits = bin(bits)[:1:-1]
+        index = digits.find("1")
+        while index != -1:
+            nodes.add(self._node_ids[index])
+            index = digits.find("1", index + 1)
+        return nodes
+
+    def descendants(self, nodes: Iterable[UniqueId]) -> Set[UniqueId]:
+        """Returns all nodes reachable from any of `nodes`"""
+        descendant_bits = self._get_descendant_bits()
+        bits = 0
+        for node in nodes:
+            index = self._indexes.get(node)
+            if index is not None:
+                bits |= descendant_bits[index]
+        return self._node_set(bits)
+
+    def common_descendants(self, nodes: Iterable[UniqueId]) -> Set[UniqueId]:
+        """Returns the nodes reachable from every one of `nodes`, which is
+        none if `nodes` is empty or has a node that isn't in the graph."""
+        descendant_bits = self._get_descendant_bits()
+        bits: Optional[int] = None
+        for node in nodes:
+            index = self._indexes.get(node)
+            if index is None:
+                return set()
+            bits = descendant_bits[index] if bits is None else bits & descendant_bits[index]
+            if not bits:
+                return set()
+        return self._node_set(bits) if bits else set()
+
+
 class Graph:
     """A wrapper around the networkx graph that understands SelectionCriteria
     and how they interact with the graph.
@@ -16,6 +84,25 @@ class Graph:
 
     def __init__(self, graph) -> None:
         self.graph: nx.DiGraph = graph
+        # the children and parents of each node, leaving out parent_test edges
+        self._child_links: Optional[Dict[UniqueId, List[UniqueId]]] = None
+        self._parent_links: Optional[Dict[UniqueId, List[UniqueId]]] = None
+
+    def _links(self, parents: bool) -> Dict[UniqueId, List[UniqueId]]:
+        """The parents or children of each node, leaving out the edges from
+        tests to the nodes that wait on them. There can be many more of those
+        than of other edges, and walks would otherwise step over them each
+        time. These are built the first time they're used, as the graph
+        doesn't change once it's been linked."""
+        if self._child_links is None or self._parent_links is None:
+            child_links: Dict[UniqueId, List[UniqueId]] = {node: [] for node in self.graph}
+            parent_links: Dict[UniqueId, List[UniqueId]] = {node: [] for node in self.graph}
+            for parent, child, edge_type in self.graph.edges(data="edge_type"):
+                if edge_type != "parent_test":
+                    child_links[parent].append(child)
+                    parent_links[child].append(parent)
+            self._child_links, self._parent_links = child_links, parent_links
+        return self._parent_links if parents else self._child_links
 
     def nodes(self) -> Set[UniqueId]:
         return set(self.graph.nodes())
@@ -30,6 +117,8 @@ class Graph:
         """Returns all nodes having a path to `node` in `graph`"""
         if not self.graph.has_node(node):
             raise DbtInternalError(f"Node {node} not found in the graph!")
+        if max_depth is None:
+            return self._reachable([node], self._links(parents=True))
         filtered_graph = self.exclude_edge_type("parent_test")
         return {
             child
@@ -40,9 +129,24 @@ class Graph:
         """Returns all nodes reachable from `node` in `graph`"""
         if not self.graph.has_node(node):
             raise DbtInternalError(f"Node {node} not found in the graph!")
+        if max_depth is None:
+            return self._reachable([node], self._links(parents=False))
         filtered_graph = self.exclude_edge_type("parent_test")
         return {child for _, child in nx.bfs_edges(filtered_graph, node, depth_limit=max_depth)}
 
+    def _reachable(
+        self, nodes: Iterable[UniqueId], links: Dict[UniqueId, List[UniqueId]]
+    ) -> Set[UniqueId]:
+        """Returns all nodes reachable from any of `nodes` through `links`"""
+        reached: Set[UniqueId] = set()
+        stack = [node for node in nodes if node in links]
+        while stack:
+            for linked in links[stack.pop()]:
+                if linked not in reached:
+                    reached.add(linked)
+                    stack.append(linked)
+        return reached
+
     def exclude_edge_type(self, edge_type_to_exclude):
         return nx.subgraph_view(
             self.graph,
@@ -62,9 +166,11 @@ class Graph:
         """Returns all nodes which are descendants of the 'selected' set.
         Nodes in the 'selected' set are counted as children only if
         they are descendants of other nodes in the 'selected' set."""
+        if max_depth is None:
+            return self._reachable(selected, self._links(parents=False))
         children: Set[UniqueId] = set()
         i = 0
-        while len(selected) > 0 and (max_depth is None or i < max_depth):
+        while len(selected) > 0 and i < max_depth:
             next_layer: Set[UniqueId] = set()
             for node in selected:
                 next_layer.update(
@@ -87,9 +193,11 @@ class Graph:
         """Returns all nodes which are ancestors of the 'selected' set.
         Nodes in the 'selected' set are counted as parents only if
         they are ancestors of other nodes in the 'selected' set."""
+        if max_depth is None:
+            return self._reachable(selected, self._links(parents=True))
         parents: Set[UniqueId] = set()
         i = 0
-        while len(selected) > 0 and (max_depth is None or i < max_depth):
+        while len(selected) > 0 and i < max_depth:
             next_layer: Set[UniqueId] = set()
             for node in selected:
                 next_layer.update(
@@ -116,51 +224,63 @@ class Graph:
         """Create and return a new graph that is a shallow copy of the graph,
         but with only the nodes in include_nodes. Transitive edges across
         removed nodes are preserved as explicit new edges.
-        """
 
-        new_graph: nx.DiGraph = self.graph.copy()
+        A selected node gets an edge from each selected node that reaches it
+        through removed nodes only. Those are found in one sweep of the graph
+        in topological order, where the selected nodes that reach each node
+        that way are kept as a bitset (an int, with one bit per selected node)
+        that its successors combine.
+        """
         include_nodes: Set[UniqueId] = set(selected)
-
-        still_removing: bool = True
-        while still_removing:
-            nodes_to_remove = list(
-                node
-                for node in new_graph
-                if node not in include_nodes
-                and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
-            )
-            if len(nodes_to_remove) == 0:
-                still_removing = False
-            else:
-                new_graph.remove_nodes_from(nodes_to_remove)
-
-        # sort remaining nodes by degree
-        remaining_nodes = list(new_graph.nodes())
-        remaining_nodes.sort(
-            key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node)
-        )
-
-        for node in remaining_nodes:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target)
-                    for source, target in new_edges
-                    if source != target and not new_graph.has_edge(source, target)
-                ]  # removes cyclic refs and edges already existing in new graph
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is it disabled?".format(node)
                 )
 
+        new_graph: nx.DiGraph = nx.DiGraph()
+        new_graph.graph.update(self.graph.graph)
+        # keep the order and attributes of the original nodes
+        selected_ids: List[UniqueId] = []
+        for node, data in self.graph.nodes(data=True):
+            if node in include_nodes:
+                new_graph.add_node(node, **data)
+                selected_ids.append(node)
+        bits: Dict[UniqueId, int] = {node: 1 << i for i, node in enumerate(selected_ids)}
+
+        # the selected nodes that reach a removed node through removed nodes
+        # only, until all of its successors have been visited
+        reached_by: Dict[UniqueId, int] = {}
+        successors_left: Dict[UniqueId, int] = {}
+        bridged_edges: List[Tuple[UniqueId, UniqueId]] = []
+        for node in nx.topological_sort(self.graph):
+            is_selected = node in include_nodes
+            reached = 0
+            for parent in self.graph.predecessors(node):
+                if parent in include_nodes:
+                    # edges between selected nodes are copied below
+                    if not is_selected:
+                        reached |= bits[parent]
+                elif parent in reached_by:
+                    reached |= reached_by[parent]
+                    successors_left[parent] -= 1
+                    if not successors_left[parent]:
+                        del reached_by[parent]
+                        del successors_left[parent]
+
+            if is_selected:
+                while reached:
+                    lowest = reached & -reached
+                    bridged_edges.append((selected_ids[lowest.bit_length() - 1], node))
+                    reached ^= lowest
+            elif reached and self.graph.out_degree(node):
+                reached_by[node] = reached
+                successors_left[node] = self.graph.out_degree(node)
+
+        new_graph.add_edges_from(bridged_edges)
+        # edges that were already there keep their attributes
+        new_graph.add_edges_from(self.graph.subgraph(include_nodes).edges(data=True))
+
         return Graph(new_graph)
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
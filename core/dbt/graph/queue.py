@@ -1,6 +1,9 @@
+import heapq
+import statistics
 import threading
+from array import array
 from queue import PriorityQueue
-from typing import Dict, Generator, List, Optional, Set
+from typing import Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import networkx as nx  # type: ignore
 
@@ -18,7 +21,18 @@ from .graph import UniqueId
 
 class GraphQueue:
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
+
+    The graph is read once, when the queue is created: each node is given an
+    index, its successors are stored as ranges of one flat array (one range
+    per node, as in a CSR sparse matrix), and a counter keeps the number of
+    its parents that aren't done yet. Marking a node as done decrements the
+    counters of its successors and queues the ones that reach zero, so it's
+    linear in the node's out-degree and the graph is never modified.
+
+    Nodes are given out by their depth in the graph, unless
+    `prioritize_by_duration` is called with the durations of the nodes in an
+    earlier run, in which case the nodes on the longest remaining path are
+    given out first.
 
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
@@ -45,10 +59,27 @@ class GraphQueue:
         self.queued: Set[UniqueId] = set()
         # this lock controls most things
         self.lock = threading.Lock()
+        # the index of each node, and the node at each index
+        self._node_ids: List[UniqueId] = list(self.graph.nodes())
+        self._indexes: Dict[UniqueId, int] = {
+            node_id: index for index, node_id in enumerate(self._node_ids)
+        }
+        # the successors of the node at index i are
+        # _successors[_successor_offsets[i]:_successor_offsets[i + 1]]
+        self._successor_offsets, self._successors = self._build_successors()
+        # the number of parents of each node that aren't done
+        self._waiting_on: List[int] = self._in_degrees()
+        # the number of nodes that aren't done
+        self._unfinished = len(self._node_ids)
         # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        self._scores: List[Union[int, float]] = list(self._get_scores())
+        # the expected duration of each node, by index, once prioritized by
+        # duration
+        self._durations: Optional[List[float]] = None
         # populate the initial queue
-        self._find_new_additions(list(self.graph.nodes()))
+        for index, waiting_on in enumerate(self._waiting_on):
+            if not waiting_on:
+                self._add(index)
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -65,58 +96,140 @@ class GraphQueue:
             return False
         return True
 
-    @staticmethod
-    def _grouped_topological_sort(
-        graph: nx.DiGraph,
-    ) -> Generator[List[str], None, None]:
-        """Topological sort of given graph that groups ties.
-
-        Adapted from `nx.topological_sort`, this function returns a topo sort of a graph however
-        instead of arbitrarily ordering ties in the sort order, ties are grouped together in
-        lists.
-
-        Args:
-            graph: The graph to be sorted.
-
-        Returns:
-            A generator that yields lists of nodes, one list per graph depth level.
-        """
-        indegree_map = {v: d for v, d in graph.in_degree() if d > 0}
-        zero_indegree = [v for v, d in graph.in_degree() if d == 0]
-
-        while zero_indegree:
-            yield zero_indegree
-            new_zero_indegree = []
-            for v in zero_indegree:
-                for _, child in graph.edges(v):
-                    indegree_map[child] -= 1
-                    if not indegree_map[child]:
-                        new_zero_indegree.append(child)
-            zero_indegree = new_zero_indegree
-
-    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
+    def _build_successors(self) -> Tuple[array, array]:
+        offsets = array("l", [0])
+        successors = array("l")
+        indexes = self._indexes
+        for node_id in self._node_ids:
+            successors.extend(indexes[successor] for successor in self.graph.successors(node_id))
+            offsets.append(len(successors))
+        return offsets, successors
+
+    def _in_degrees(self) -> List[int]:
+        in_degrees = [0] * len(self._node_ids)
+        for successor in self._successors:
+            in_degrees[successor] += 1
+        return in_degrees
+
+    def _successors_of(self, index: int) -> array:
+        return self._successors[
+            self._successor_offsets[index] : self._successor_offsets[index + 1]
+        ]
+
+    def _get_scores(self) -> List[int]:
         """Scoring nodes for processing order.
 
-        Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
-
-        Args:
-            graph: The graph to be scored.
+        Scores are calculated by the graph depth level: the length of the
+        longest path to the node from a node without parents, found with a
+        topological sort that groups ties. Lowest score (0) should be
+        processed first.
 
         Returns:
-            A dictionary consisting of `node name`:`score` pairs.
+            The score of each node, by index.
         """
-        # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
+        scores = [0] * len(self._node_ids)
+        waiting_on = self._in_degrees()
+        level_nodes = [index for index, count in enumerate(waiting_on) if not count]
+        level = 0
+        while level_nodes:
+            next_level_nodes = []
+            for index in level_nodes:
+                scores[index] = level
+                for successor in self._successors_of(index):
+                    waiting_on[successor] -= 1
+                    if not waiting_on[successor]:
+                        next_level_nodes.append(successor)
+            level_nodes = next_level_nodes
+            level += 1
+        return scores
 
-        # score all nodes in all subgraphs
-        scores = {}
-        for subgraph in subgraphs:
-            grouped_nodes = self._grouped_topological_sort(subgraph)
-            for level, group in enumerate(grouped_nodes):
-                for node in group:
-                    scores[node] = level
+    def _topological_order(self) -> List[int]:
+        waiting_on = self._in_degrees()
+        order = [index for index, count in enumerate(waiting_on) if not count]
+        for index in order:
+            for successor in self._successors_of(index):
+                waiting_on[successor] -= 1
+                if not waiting_on[successor]:
+                    order.append(successor)
+        return order
+
+    def _expected_durations(self, durations: Mapping[str, float]) -> List[float]:
+        """The expected duration of each node, by index. Nodes without a
+        duration are expected to take the median of the known durations, or
+        a second if there are none, except for ephemeral models, which aren't
+        run at all.
+        """
+        known = [durations[node_id] for node_id in self._node_ids if node_id in durations]
+        default = statistics.median(known) if known else 1.0
+        expected = []
+        for node_id in self._node_ids:
+            if node_id in durations:
+                expected.append(durations[node_id])
+            elif node_id in self.manifest.nodes and self.manifest.nodes[node_id].is_ephemeral:
+                expected.append(0.0)
+            else:
+                expected.append(default)
+        return expected
+
+    def prioritize_by_duration(self, durations: Mapping[str, float]) -> None:
+        """Give out the nodes with the longest remaining path first, where
+        the length of a path is the sum of the expected durations of its nodes,
+        so that long chains of nodes start as early as possible (critical path
+        scheduling).
+
+        This must be called before any node is taken off the queue.
+
+        :param durations: The duration of nodes in an earlier run, in
+            seconds, by unique ID.
+        """
+        expected = self._expected_durations(durations)
+        remaining = list(expected)
+        for index in reversed(self._topological_order()):
+            longest = 0.0
+            for successor in self._successors_of(index):
+                if remaining[successor] > longest:
+                    longest = remaining[successor]
+            remaining[index] += longest
 
-        return scores
+        with self.lock:
+            self._durations = expected
+            self._scores = [-length for length in remaining]
+            # queue the nodes that are ready again, with their new scores
+            ready = self.queued
+            self.inner = PriorityQueue()
+            self.queued = set()
+            for node_id in ready:
+                self._add(self._indexes[node_id])
+
+    def predicted_makespan(self, threads: int) -> Optional[float]:
+        """How long running every node with this many threads is expected
+        to take, by simulating the queue with the expected durations, or None
+        if the queue isn't prioritized by duration.
+        """
+        if self._durations is None:
+            return None
+        durations = self._durations
+        waiting_on = self._in_degrees()
+        ready = [
+            (self._scores[index], self._node_ids[index], index)
+            for index, count in enumerate(waiting_on)
+            if not count
+        ]
+        heapq.heapify(ready)
+        running: List[Tuple[float, int]] = []
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < max(threads, 1):
+                _, _, index = heapq.heappop(ready)
+                heapq.heappush(running, (now + durations[index], index))
+            now, index = heapq.heappop(running)
+            for successor in self._successors_of(index):
+                waiting_on[successor] -= 1
+                if not waiting_on[successor]:
+                    heapq.heappush(
+                        ready, (self._scores[successor], self._node_ids[successor], successor)
+                    )
+        return now
 
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
@@ -143,7 +256,7 @@ class GraphQueue:
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return self._unfinished - len(self.in_progress)
 
     def empty(self) -> bool:
         """The graph queue is 'empty' if it all remaining nodes in the graph
@@ -153,25 +266,15 @@ class GraphQueue:
         """
         return len(self) == 0
 
-    def _already_known(self, node: UniqueId) -> bool:
-        """Decide if a node is already known (either handed out as a task, or
-        in the queue).
-
-        Callers must hold the lock.
-
-        :param str node: The node ID to check
-        :returns bool: If the node is in progress/queued.
-        """
-        return node in self.in_progress or node in self.queued
+    def _add(self, index: int) -> None:
+        """Add the node at the index, which has no parents left, to the
+        internal queue.
 
-    def _find_new_additions(self, candidates) -> None:
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+        Callers must hold the lock, or be the constructor.
         """
-        for node in candidates:
-            if self.graph.in_degree(node) == 0 and not self._already_known(node):
-                self.inner.put((self._scores[node], node))
-                self.queued.add(node)
+        node_id = self._node_ids[index]
+        self.inner.put((self._scores[index], node_id))
+        self.queued.add(node_id)
 
     def mark_done(self, node_id: UniqueId) -> None:
         """Given a node's unique ID, mark it as done.
@@ -182,9 +285,12 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
-            successors = list(self.graph.successors(node_id))
-            self.graph.remove_node(node_id)
-            self._find_new_additions(successors)
+            self._unfinished -= 1
+            waiting_on = self._waiting_on
+            for successor in self._successors_of(self._indexes[node_id]):
+                waiting_on[successor] -= 1
+                if not waiting_on[successor]:
+                    self._add(successor)
             self.inner.task_done()
             self.some_task_done.notify_all()
 
@@ -53,6 +53,8 @@ class NodeSelector(MethodManager):
             unique_id for unique_id in self.full_graph.nodes() if self._is_graph_member(unique_id)
         }
         self.graph = self.full_graph.subgraph(graph_members)
+        # the nodes each selection criteria is evaluated against
+        self.graph_members: Set[UniqueId] = graph_members
 
     def select_included(
         self,
@@ -75,9 +77,8 @@ class NodeSelector(MethodManager):
         - perform any selector-specific expansion
         """
 
-        nodes = self.graph.nodes()
         try:
-            collected = self.select_included(nodes, spec)
+            collected = self.select_included(self.graph_members, spec)
         except InvalidSelectorError:
             valid_selectors = ", ".join(self.SELECTOR_METHODS)
             fire_event(
@@ -273,13 +274,14 @@ class NodeSelector(MethodManager):
                 # (Does not include unit tests because they can only have one parent.)
                 if can_select_indirectly(node):
                     # should we add it in directly?
-                    if indirect_selection == IndirectSelection.Eager or set(
+                    if indirect_selection == IndirectSelection.Eager or selected.issuperset(
                         node.depends_on_nodes
-                    ) <= set(selected):
+                    ):
                         direct_nodes.add(unique_id)
-                    elif indirect_selection == IndirectSelection.Buildable and set(
-                        node.depends_on_nodes
-                    ) <= set(selected_and_parents):
+                    elif (
+                        indirect_selection == IndirectSelection.Buildable
+                        and selected_and_parents.issuperset(node.depends_on_nodes)
+                    ):
                         direct_nodes.add(unique_id)
                     elif indirect_selection == IndirectSelection.Empty:
                         pass
@@ -307,14 +309,14 @@ class NodeSelector(MethodManager):
             for unique_id in indirect_nodes:
                 if unique_id in self.manifest.nodes:
                     node = self.manifest.nodes[unique_id]
-                    if set(node.depends_on_nodes) <= set(selected):
+                    if selected.issuperset(node.depends_on_nodes):
                         selected.add(unique_id)
         elif indirect_selection == IndirectSelection.Buildable:
             selected_and_parents = selected.union(self.graph.select_parents(selected))
             for unique_id in indirect_nodes:
                 if unique_id in self.manifest.nodes:
                     node = self.manifest.nodes[unique_id]
-                    if set(node.depends_on_nodes) <= set(selected_and_parents):
+                    if selected_and_parents.issuperset(node.depends_on_nodes):
                         selected.add(unique_id)
 
         return selected
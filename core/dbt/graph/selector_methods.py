@@ -1,11 +1,13 @@
 import abc
-from fnmatch import fnmatch
+import os
+from fnmatch import fnmatch, fnmatchcase
 from itertools import chain
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -113,6 +115,213 @@ SelectorTarget = Union[
 ]
 
 
+def _has_fnmatch_wildcard(pattern: str) -> bool:
+    return any(wildcard in pattern for wildcard in ("*", "?", "["))
+
+
+def _fnmatch_keys(index: Dict[str, Set[UniqueId]], pattern: str) -> Set[UniqueId]:
+    """The unique IDs under the keys of 'index' that match the fnmatch
+    pattern. The keys must have been normalized with os.path.normcase, as
+    fnmatch does, so that a pattern without wildcards is a single lookup."""
+    pattern = os.path.normcase(pattern)
+    if not _has_fnmatch_wildcard(pattern):
+        return set(index.get(pattern, ()))
+    matched: Set[UniqueId] = set()
+    for key, unique_ids in index.items():
+        if fnmatchcase(key, pattern):
+            matched.update(unique_ids)
+    return matched
+
+
+def _add_to_index(index: Dict[Any, Set[UniqueId]], key: Any, unique_id: UniqueId) -> None:
+    unique_ids = index.get(key)
+    if unique_ids is None:
+        index[key] = {unique_id}
+    else:
+        unique_ids.add(unique_id)
+
+
+class ConfigValueIndex:
+    """The values of one config key, for the nodes and sources that have
+    it. String values, and lists of strings, are indexed by string so that
+    a string selector can be looked up. Everything else is kept to be
+    compared one by one.
+    """
+
+    def __init__(self, members: Iterable[Tuple[UniqueId, ResultNode]], parts: List[str]) -> None:
+        self.values: List[Tuple[UniqueId, Any]] = []
+        self.strings: Dict[str, Set[UniqueId]] = {}
+        self.list_strings: Dict[str, Set[UniqueId]] = {}
+        self.others: List[Tuple[UniqueId, Any]] = []
+        for unique_id, node in members:
+            try:
+                value = _getattr_descend(node.config, parts)
+            except AttributeError:
+                continue
+            self.values.append((unique_id, value))
+            if isinstance(value, str):
+                _add_to_index(self.strings, value, unique_id)
+            elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+                for item in value:
+                    _add_to_index(self.list_strings, item, unique_id)
+            else:
+                self.others.append((unique_id, value))
+
+
+class SelectorIndex:
+    """Inverted indexes of the members of a manifest by the attributes that
+    the selector methods match on, so that a selector looks up the members
+    it could match instead of checking every member.
+
+    Each index is built the first time a selector needs it, and the
+    indexes are kept on the manifest (see for_manifest), so that all the
+    selectors of an invocation share them. The indexes are rebuilt if
+    members are added to or removed from the manifest; the selected
+    attributes of members must not change once they're indexed.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self.sizes = self.manifest_sizes(manifest)
+        self._tags: Optional[Dict[str, Set[UniqueId]]] = None
+        self._packages: Optional[Dict[str, Set[UniqueId]]] = None
+        self._resource_types: Optional[Dict[NodeType, Set[UniqueId]]] = None
+        self._paths: Optional[Dict[Path, Set[UniqueId]]] = None
+        self._fqns: Optional[Dict[UniqueId, Tuple[List[str], bool]]] = None
+        self._fqn_names: Dict[str, Set[UniqueId]] = {}
+        self._fqn_prefixes: Dict[Tuple[str, ...], Set[UniqueId]] = {}
+        self._configs: Dict[Tuple[str, ...], ConfigValueIndex] = {}
+
+    @staticmethod
+    def manifest_sizes(manifest: Manifest) -> Tuple[int, ...]:
+        return (
+            len(manifest.nodes),
+            len(manifest.sources),
+            len(manifest.exposures),
+            len(manifest.metrics),
+            len(manifest.unit_tests),
+            len(manifest.semantic_models),
+            len(manifest.saved_queries),
+        )
+
+    @classmethod
+    def for_manifest(cls, manifest: Manifest) -> "SelectorIndex":
+        index = getattr(manifest, "_selector_index", None)
+        if (
+            not isinstance(index, cls)
+            or index.manifest is not manifest
+            or index.sizes != cls.manifest_sizes(manifest)
+        ):
+            index = cls(manifest)
+            manifest._selector_index = index
+        return index
+
+    def _members(self, include_sources: bool = True) -> Iterator[Tuple[UniqueId, SelectorTarget]]:
+        manifest = self.manifest
+        collections: List[Any] = [manifest.nodes]
+        if include_sources:
+            collections.append(manifest.sources)
+        collections.extend(
+            [
+                manifest.exposures,
+                manifest.metrics,
+                manifest.unit_tests,
+                manifest.semantic_models,
+                manifest.saved_queries,
+            ]
+        )
+        for collection in collections:
+            for unique_id, member in collection.items():
+                yield UniqueId(unique_id), member
+
+    def tags(self) -> Dict[str, Set[UniqueId]]:
+        if self._tags is None:
+            self._tags = {}
+            for unique_id, member in self._members():
+                for tag in getattr(member, "tags", ()):
+                    _add_to_index(self._tags, os.path.normcase(tag), unique_id)
+        return self._tags
+
+    def packages(self) -> Dict[str, Set[UniqueId]]:
+        if self._packages is None:
+            self._packages = {}
+            for unique_id, member in self._members():
+                _add_to_index(self._packages, os.path.normcase(member.package_name), unique_id)
+        return self._packages
+
+    def resource_types(self) -> Dict[NodeType, Set[UniqueId]]:
+        if self._resource_types is None:
+            self._resource_types = {}
+            for unique_id, member in self._members():
+                _add_to_index(self._resource_types, member.resource_type, unique_id)
+        return self._resource_types
+
+    def paths(self) -> Dict[Path, Set[UniqueId]]:
+        """The members by their file, each of the directories it's in, and
+        the yaml file that patches them."""
+        if self._paths is None:
+            self._paths = {}
+            for unique_id, member in self._members():
+                original_file_path = Path(member.original_file_path)
+                _add_to_index(self._paths, original_file_path, unique_id)
+                for parent in original_file_path.parents:
+                    _add_to_index(self._paths, parent, unique_id)
+                patch_path = getattr(member, "patch_path", None)
+                if patch_path:
+                    _add_to_index(self._paths, Path(patch_path.split("://")[1]), unique_id)
+        return self._paths
+
+    def fqns(self) -> Dict[UniqueId, Tuple[List[str], bool]]:
+        """The fqn of each member that isn't a source. Each member is also
+        indexed by the last parts of its fqn, and by every prefix of its fqn,
+        with and without the package, split into the parts between dots."""
+        if self._fqns is None:
+            self._fqns = {}
+            for unique_id, member in self._members(include_sources=False):
+                fqn = member.fqn
+                self._fqns[unique_id] = (fqn, member.is_versioned)
+                for scoped_fqn in (fqn, fqn[1:]):
+                    if scoped_fqn:
+                        _add_to_index(self._fqn_names, scoped_fqn[-1], unique_id)
+                        _add_to_index(self._fqn_names, "_".join(scoped_fqn[-2:]), unique_id)
+                    if len(scoped_fqn) > 1:
+                        _add_to_index(self._fqn_names, scoped_fqn[-2], unique_id)
+                    flat_fqn = tuple(item for segment in scoped_fqn for item in segment.split("."))
+                    for length in range(1, len(flat_fqn) + 1):
+                        _add_to_index(self._fqn_prefixes, flat_fqn[:length], unique_id)
+        return self._fqns
+
+    def fqn_candidates(self, selector: str) -> Set[UniqueId]:
+        """The members whose fqn could match the selector, following
+        is_selected_node: the ones whose last parts are the selector, and the
+        ones whose fqn starts with the parts of the selector before the first
+        one with a wildcard."""
+        fqns = self.fqns()
+        selector_parts = selector.split(".")
+        candidates = set(self._fqn_names.get(selector, ()))
+        candidates.update(self._fqn_names.get("_".join(selector_parts[-2:]), ()))
+        prefix: List[str] = []
+        for selector_part in selector_parts:
+            if any(wildcard in selector_part for wildcard in ("*", "?", "[", "]")):
+                break
+            prefix.append(selector_part)
+        if prefix:
+            candidates.update(self._fqn_prefixes.get(tuple(prefix), ()))
+        else:
+            candidates.update(fqns)
+        return candidates
+
+    def config_values(self, parts: List[str]) -> ConfigValueIndex:
+        key = tuple(parts)
+        if key not in self._configs:
+            manifest = self.manifest
+            members = chain(manifest.nodes.items(), manifest.sources.items())
+            self._configs[key] = ConfigValueIndex(
+                ((UniqueId(unique_id), member) for unique_id, member in members), parts
+            )
+        return self._configs[key]
+
+
 class SelectorMethod(metaclass=abc.ABCMeta):
     def __init__(
         self, manifest: Manifest, previous_state: Optional[PreviousState], arguments: List[str]
@@ -121,6 +330,10 @@ class SelectorMethod(metaclass=abc.ABCMeta):
         self.previous_state = previous_state
         self.arguments: List[str] = arguments
 
+    @property
+    def index(self) -> SelectorIndex:
+        return SelectorIndex.for_manifest(self.manifest)
+
     def parsed_nodes(
         self, included_nodes: Set[UniqueId]
     ) -> Iterator[Tuple[UniqueId, ManifestNode]]:
@@ -264,18 +477,17 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
-        non_source_nodes = list(self.non_source_nodes(included_nodes))
-        for unique_id, node in non_source_nodes:
-            if self.node_is_match(selector, node.fqn, node.is_versioned):
+        fqns = self.index.fqns()
+        for unique_id in self.index.fqn_candidates(selector) & included_nodes:
+            fqn, is_versioned = fqns[unique_id]
+            if self.node_is_match(selector, fqn, is_versioned):
                 yield unique_id
 
 
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for unique_id, node in self.all_nodes(included_nodes):
-            if hasattr(node, "tags") and any(fnmatch(tag, selector) for tag in node.tags):
-                yield unique_id
+        yield from _fnmatch_keys(self.index.tags(), selector) & included_nodes
 
 
 class GroupSelectorMethod(SelectorMethod):
@@ -462,17 +674,13 @@ class PathSelectorMethod(SelectorMethod):
         else:
             root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
-        for unique_id, node in self.all_nodes(included_nodes):
-            ofp = Path(node.original_file_path)
-            if ofp in paths:
-                yield unique_id
-            if hasattr(node, "patch_path") and node.patch_path:  # type: ignore
-                pfp = node.patch_path.split("://")[1]  # type: ignore
-                ymlfp = Path(pfp)
-                if ymlfp in paths:
-                    yield unique_id
-            if any(parent in paths for parent in ofp.parents):
-                yield unique_id
+        # nodes match their file, the yaml file that patches them, or any of
+        # the directories they're in
+        path_index = self.index.paths()
+        selected: Set[UniqueId] = set()
+        for path in paths:
+            selected.update(path_index.get(path, ()))
+        yield from selected & included_nodes
 
 
 class FileSelectorMethod(SelectorMethod):
@@ -492,9 +700,7 @@ class PackageSelectorMethod(SelectorMethod):
         if selector == "this" and self.manifest.metadata.project_name is not None:
             selector = self.manifest.metadata.project_name
 
-        for unique_id, node in self.all_nodes(included_nodes):
-            if fnmatch(node.package_name, selector):
-                yield unique_id
+        yield from _fnmatch_keys(self.index.packages(), selector) & included_nodes
 
 
 def _getattr_descend(obj: Any, attrs: List[str]) -> Any:
@@ -536,27 +742,40 @@ class ConfigSelectorMethod(SelectorMethod):
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
         # add more someday, so search them anyway.
-        for unique_id, node in self.configurable_nodes(included_nodes):
-            try:
-                value = _getattr_descend(node.config, parts)
-            except AttributeError:
-                continue
-            else:
-                if isinstance(value, list):
-                    if (
-                        (selector in value)
-                        or (CaseInsensitive(selector) == "true" and True in value)
-                        or (CaseInsensitive(selector) == "false" and False in value)
-                    ):
-                        yield unique_id
-                else:
-                    if (
-                        (selector == value)
-                        or (CaseInsensitive(selector) == "true" and value is True)
-                        or (CaseInsensitive(selector) == "false")
-                        and value is False
-                    ):
-                        yield unique_id
+        config_values = self.index.config_values(parts)
+        if (
+            type(selector) is str
+            and CaseInsensitive(selector) != "true"
+            and CaseInsensitive(selector) != "false"
+        ):
+            # a plain string can only equal a string, or be in a list of them
+            selected = config_values.strings.get(selector, set()) | config_values.list_strings.get(
+                selector, set()
+            )
+            candidates = config_values.others
+        else:
+            selected = set()
+            candidates = config_values.values
+        for unique_id, value in candidates:
+            if self.value_is_match(selector, value):
+                selected.add(unique_id)
+        yield from selected & included_nodes
+
+    @staticmethod
+    def value_is_match(selector: Any, value: Any) -> bool:
+        if isinstance(value, list):
+            return (
+                (selector in value)
+                or (CaseInsensitive(selector) == "true" and True in value)
+                or (CaseInsensitive(selector) == "false" and False in value)
+            )
+        else:
+            return (
+                (selector == value)
+                or (CaseInsensitive(selector) == "true" and value is True)
+                or (CaseInsensitive(selector) == "false")
+                and value is False
+            )
 
 
 class ResourceTypeSelectorMethod(SelectorMethod):
@@ -565,9 +784,7 @@ class ResourceTypeSelectorMethod(SelectorMethod):
             resource_type = NodeType(selector)
         except ValueError as exc:
             raise DbtRuntimeError(f'Invalid resource_type selector "{selector}"') from exc
-        for unique_id, node in self.all_nodes(included_nodes):
-            if node.resource_type == resource_type:
-                yield unique_id
+        yield from self.index.resource_types().get(resource_type, set()) & included_nodes
 
 
 class TestNameSelectorMethod(SelectorMethod):
@@ -5,11 +5,10 @@ import pprint
 import time
 import traceback
 from copy import deepcopy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from itertools import chain
 from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, Union
 
-import msgpack
 from jinja2.nodes import Call
 
 import dbt.deprecations
@@ -27,17 +26,21 @@ from dbt.adapters.factory import (
 )
 from dbt.artifacts.resources import FileHash, NodeRelation, NodeVersion
 from dbt.artifacts.resources.types import BatchSize
+from dbt.artifacts.resources.v1.config import NodeConfig
 from dbt.artifacts.schemas.base import Writable
-from dbt.clients.jinja import MacroStack, get_rendered
+from dbt.clients.jinja import MacroStack, get_rendered, has_render_chars
+from dbt.clients.jinja_bytecode import bytecode_cache
 from dbt.clients.jinja_static import statically_extract_macro_calls
 from dbt.config import Project, RuntimeConfig
 from dbt.constants import (
+    JINJA_BYTECODE_CACHE_FILE_NAME,
     MANIFEST_FILE_NAME,
     PARTIAL_PARSE_FILE_NAME,
+    PARTIAL_PARSE_FILE_STATS_FILE_NAME,
     SEMANTIC_MANIFEST_FILE_NAME,
 )
 from dbt.context.configured import generate_macro_context
-from dbt.context.docs import generate_runtime_docs_context
+from dbt.context.docs import DocsRuntimeContext
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.providers import ParseProvider, generate_runtime_macro_context
 from dbt.context.query_header import generate_query_header_context
@@ -101,11 +104,23 @@ from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
 from dbt.parser.partial import PartialParsing, special_override_macros
+from dbt.parser.partial_parse_file import (  # noqa: F401
+    PartialParseFile,
+    PartialParseIndex,
+    extended_mashumaro_encoder,
+    extended_mashumuro_decoder,
+    extended_msgpack_decoder,
+    extended_msgpack_encoder,
+    partial_parse_shards_path,
+    write_partial_parse_file,
+)
 from dbt.parser.read_files import (
     FileDiff,
+    FileStatCache,
     ReadFiles,
     ReadFilesFromDiff,
     ReadFilesFromFileSystem,
+    load_deferred_contents,
     load_source_file,
 )
 from dbt.parser.schemas import SchemaParser
@@ -115,14 +130,14 @@ from dbt.parser.singular_test import SingularTestParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.sources import SourcePatcher
 from dbt.parser.unit_tests import process_models_for_unit_test
+from dbt.parser.workers import ParseProcessPool
 from dbt.version import __version__
 from dbt_common.clients.jinja import parse
-from dbt_common.clients.system import make_directory, path_exists, read_json, write_file
+from dbt_common.clients.system import path_exists, read_json, write_file
 from dbt_common.constants import SECRET_ENV_PREFIX
 from dbt_common.dataclass_schema import StrEnum, dbtClassMixin
 from dbt_common.events.base_types import EventLevel
 from dbt_common.events.functions import fire_event, get_invocation_id, warn_or_error
-from dbt_common.events.types import Note
 from dbt_common.exceptions.base import DbtValidationError
 from dbt_common.helper_types import PathSet
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
@@ -131,36 +146,6 @@ from dbt_semantic_interfaces.type_enums import MetricType
 PERF_INFO_FILE_NAME = "perf_info.json"
 
 
-def extended_mashumaro_encoder(data):
-    return msgpack.packb(data, default=extended_msgpack_encoder, use_bin_type=True)
-
-
-def extended_msgpack_encoder(obj):
-    if type(obj) is datetime.date:
-        date_bytes = msgpack.ExtType(1, obj.isoformat().encode())
-        return date_bytes
-    elif type(obj) is datetime.datetime:
-        datetime_bytes = msgpack.ExtType(2, obj.isoformat().encode())
-        return datetime_bytes
-
-    return obj
-
-
-def extended_mashumuro_decoder(data):
-    return msgpack.unpackb(data, ext_hook=extended_msgpack_decoder, raw=False)
-
-
-def extended_msgpack_decoder(code, data):
-    if code == 1:
-        d = datetime.date.fromisoformat(data.decode())
-        return d
-    elif code == 2:
-        dt = datetime.datetime.fromisoformat(data.decode())
-        return dt
-    else:
-        return msgpack.ExtType(code, data)
-
-
 def version_to_str(version: Optional[Union[str, int]]) -> str:
     if isinstance(version, int):
         return str(version)
@@ -200,6 +185,14 @@ class ProjectLoaderInfo(dbtClassMixin):
     parsed_path_count: int = 0
 
 
+# Part of saved performance info
+@dataclass
+class ProcessPhaseInfo(dbtClassMixin):
+    phase: str
+    visited_count: int = 0
+    skipped_count: int = 0
+
+
 # Part of saved performance info
 @dataclass
 class ManifestLoaderInfo(dbtClassMixin, Writable):
@@ -207,6 +200,9 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     parsed_path_count: int = 0
     static_analysis_path_count: int = 0
     static_analysis_parsed_path_count: int = 0
+    static_analysis_fallback_reasons: Dict[str, str] = field(default_factory=dict)
+    jinja_bytecode_cache_hits: int = 0
+    jinja_bytecode_cache_misses: int = 0
     is_partial_parse_enabled: Optional[bool] = None
     is_static_analysis_enabled: Optional[bool] = None
     read_files_elapsed: Optional[float] = None
@@ -214,8 +210,13 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     parse_project_elapsed: Optional[float] = None
     patch_sources_elapsed: Optional[float] = None
     process_manifest_elapsed: Optional[float] = None
+    process_docs_elapsed: Optional[float] = None
+    compact_manifest_elapsed: Optional[float] = None
+    rendered_description_count: int = 0
+    plain_description_count: int = 0
     load_all_elapsed: Optional[float] = None
     projects: List[ProjectLoaderInfo] = field(default_factory=list)
+    process_phases: List[ProcessPhaseInfo] = field(default_factory=list)
     _project_index: Dict[str, ProjectLoaderInfo] = field(default_factory=dict)
 
     def __post_serialize__(self, dct: Dict, context: Optional[Dict] = None):
@@ -233,6 +234,7 @@ class ManifestLoader:
         all_projects: Mapping[str, RuntimeConfig],
         macro_hook: Optional[Callable[[Manifest], Any]] = None,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
     ) -> None:
         self.root_project: RuntimeConfig = root_project
         self.all_projects: Mapping[str, RuntimeConfig] = all_projects
@@ -252,6 +254,7 @@ class ManifestLoader:
             self.macro_hook = macro_hook
 
         self._perf_info = self.build_perf_info()
+        self._process_phase_index: Dict[str, ProcessPhaseInfo] = {}
 
         # State check determines whether the saved_manifest and the current
         # manifest match well enough to do partial parsing
@@ -261,9 +264,23 @@ class ManifestLoader:
         self.partially_parsing = False
         self.partial_parser: Optional[PartialParsing] = None
         self.skip_parsing = False
-
-        # This is a saved manifest from a previous run that's used for partial parsing
-        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
+        # Worker processes for parsing model, snapshot, analysis and singular
+        # test files, if requested with --parse-workers
+        self.parse_pool: Optional[ParseProcessPool] = None
+
+        # Checksums of the files that haven't changed on disk since the last parse
+        self.file_stat_cache: Optional[FileStatCache] = self.read_file_stat_cache()
+
+        # The shard table and key order of the saved partial parse state, if
+        # the saved manifest is known to match it. Used to only rewrite the
+        # shards of the files that changed.
+        self.saved_partial_parse_index: Optional[PartialParseIndex] = None
+
+        # This is a saved manifest from a previous run that's used for partial parsing.
+        # A long running process can pass in the manifest it already has in memory.
+        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse(
+            saved_manifest
+        )
 
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
@@ -273,6 +290,7 @@ class ManifestLoader:
         config: RuntimeConfig,
         *,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
         reset: bool = False,
         write_perf_info=False,
     ) -> Manifest:
@@ -300,6 +318,12 @@ class ManifestLoader:
                 file_diff_dct = read_json(file_diff_path)
                 file_diff = FileDiff.from_dict(file_diff_dct)
 
+        # Templates compiled by earlier invocations are loaded from the target directory
+        bytecode_cache.open(
+            os.path.join(config.project_target_path, JINJA_BYTECODE_CACHE_FILE_NAME)
+        )
+        bytecode_cache_hits, bytecode_cache_misses = bytecode_cache.hits, bytecode_cache.misses
+
         # Start performance counting
         start_load_all = time.perf_counter()
 
@@ -309,9 +333,14 @@ class ManifestLoader:
             projects,
             macro_hook=macro_hook,
             file_diff=file_diff,
+            saved_manifest=saved_manifest,
         )
 
         manifest = loader.load()
+        if flags.COMPACT_MANIFEST:
+            start_compact = time.perf_counter()
+            manifest.compact()
+            loader._perf_info.compact_manifest_elapsed = time.perf_counter() - start_compact
 
         _check_manifest(manifest, config)
         manifest.build_flat_graph()
@@ -322,6 +351,10 @@ class ManifestLoader:
 
         # Save performance info
         loader._perf_info.load_all_elapsed = time.perf_counter() - start_load_all
+        loader._perf_info.jinja_bytecode_cache_hits = bytecode_cache.hits - bytecode_cache_hits
+        loader._perf_info.jinja_bytecode_cache_misses = (
+            bytecode_cache.misses - bytecode_cache_misses
+        )
         loader.track_project_load()
 
         if write_perf_info:
@@ -355,6 +388,9 @@ class ManifestLoader:
                 all_projects=self.all_projects,
                 files=self.manifest.files,
                 saved_files=saved_files,
+                max_workers=get_flags().PARSE_READ_WORKERS or 1,
+                file_stat_cache=self.file_stat_cache,
+                yaml_workers=get_flags().PARSE_WORKERS or 1,
             )
 
         # Set the files in the manifest and save the project_parser_files
@@ -413,12 +449,18 @@ class ManifestLoader:
                 HookParser,
                 FixtureParser,
             ]
-            for project in self.all_projects.values():
-                if project.project_name not in project_parser_files:
-                    continue
-                self.parse_project(
-                    project, project_parser_files[project.project_name], parser_types
-                )
+            self.parse_pool = self.start_parse_pool()
+            try:
+                for project in self.all_projects.values():
+                    if project.project_name not in project_parser_files:
+                        continue
+                    self.parse_project(
+                        project, project_parser_files[project.project_name], parser_types
+                    )
+            finally:
+                if self.parse_pool is not None:
+                    self.parse_pool.shutdown()
+                    self.parse_pool = None
 
             # Now that we've loaded most of the nodes (except for schema tests, sources, metrics)
             # load up the Lookup objects to resolve them by name, so the SourceFiles store
@@ -450,21 +492,16 @@ class ManifestLoader:
             self.manifest.sources = patcher.sources
             self._perf_info.patch_sources_elapsed = time.perf_counter() - start_patch
 
-            # We need to rebuild disabled in order to include disabled sources
-            self.manifest.rebuild_disabled_lookup()
-
             # copy the selectors from the root_project to the manifest
             self.manifest.selectors = self.root_project.manifest_selectors
 
             # inject any available external nodes
             self.manifest.build_parent_and_child_maps()
-            external_nodes_modified = self.inject_external_nodes()
-            if external_nodes_modified:
-                self.manifest.rebuild_ref_lookup()
+            self.inject_external_nodes()
 
             # update the refs, sources, docs and metrics depends_on.nodes
-            # These check the created_at time on the nodes to
-            # determine whether they need processing.
+            # These only visit the members that were created or updated in
+            # this parse; see _dirty_members.
             start_process = time.perf_counter()
             self.process_sources(self.root_project.project_name)
             self.process_refs(self.root_project.project_name, self.root_project.dependencies)
@@ -473,10 +510,7 @@ class ManifestLoader:
             self.process_metrics(self.root_project)
             self.process_saved_queries(self.root_project)
             self.process_model_inferred_primary_keys()
-            self.check_valid_group_config()
-            self.check_valid_access_property()
-            self.check_valid_snapshot_config()
-            self.check_valid_microbatch_config()
+            self.check_valid_configs()
 
             semantic_manifest = SemanticManifest(self.manifest)
             if not semantic_manifest.validate():
@@ -490,6 +524,9 @@ class ManifestLoader:
             self._perf_info.static_analysis_path_count = (
                 self.manifest._parsing_info.static_analysis_path_count
             )
+            self._perf_info.static_analysis_fallback_reasons = (
+                self.manifest._parsing_info.static_analysis_fallback_reasons
+            )
 
         # Inject any available external nodes, reprocess refs if changes to the manifest were made.
         external_nodes_modified = False
@@ -497,10 +534,10 @@ class ManifestLoader:
             # If we didn't skip parsing, this will have already run because it must run
             # before process_refs. If we did skip parsing, then it's possible that only
             # external nodes have changed and we need to run this to capture that.
+            self.manifest.track_dirty()
             self.manifest.build_parent_and_child_maps()
             external_nodes_modified = self.inject_external_nodes()
             if external_nodes_modified:
-                self.manifest.rebuild_ref_lookup()
                 self.process_refs(
                     self.root_project.project_name,
                     self.root_project.dependencies,
@@ -510,6 +547,7 @@ class ManifestLoader:
         if not self.skip_parsing or external_nodes_modified:
             # write out the fully parsed manifest
             self.write_manifest_for_partial_parse()
+        self.write_file_stat_cache()
 
         self.check_for_model_deprecations()
         self.check_for_spaces_in_resource_names()
@@ -523,7 +561,17 @@ class ManifestLoader:
         if self.saved_manifest is None:
             return project_parser_files
 
-        self.partial_parser = PartialParsing(self.saved_manifest, self.manifest.files)  # type: ignore[arg-type]
+        self.partial_parser = PartialParsing(
+            self.saved_manifest,
+            self.manifest.files,  # type: ignore[arg-type]
+            self.manifest.state_check.changed_vars(self.saved_manifest.state_check),
+        )
+        # The saved manifest keeps being used, so it needs the current state check.
+        # The vars that the unchanged nodes read outside of project files still apply.
+        self.saved_manifest.state_check = replace(
+            self.manifest.state_check,
+            unattributed_vars=list(self.saved_manifest.state_check.unattributed_vars),
+        )
         self.skip_parsing = self.partial_parser.skip_parsing()
         if self.skip_parsing:
             # nothing changed, so we don't need to generate project_parser_files
@@ -536,6 +584,9 @@ class ManifestLoader:
             # files are different, we need to create a new set of
             # project_parser_files.
             try:
+                # Record what partial parsing adds or updates, so only those
+                # are processed after parsing
+                self.saved_manifest.track_dirty()  # type: ignore[union-attr]
                 project_parser_files = self.partial_parser.get_parsing_files()
                 self.partially_parsing = True
                 self.manifest = self.saved_manifest  # type: ignore[assignment]
@@ -682,7 +733,7 @@ class ManifestLoader:
             if "MacroParser" in parser_files:
                 parser = MacroParser(project, self.manifest)
                 for file_id in parser_files["MacroParser"]:
-                    block = FileBlock(self.manifest.files[file_id])
+                    block = self.get_file_block(file_id)
                     parser.parse_file(block)
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
@@ -691,7 +742,7 @@ class ManifestLoader:
             if "GenericTestParser" in parser_files:
                 parser = GenericTestParser(project, self.manifest)
                 for file_id in parser_files["GenericTestParser"]:
-                    block = FileBlock(self.manifest.files[file_id])
+                    block = self.get_file_block(file_id)
                     parser.parse_file(block)
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
@@ -700,6 +751,11 @@ class ManifestLoader:
         # Look at changed macros and update the macro.depends_on.macros
         self.macro_depends_on()
 
+    def get_file_block(self, file_id: str) -> FileBlock:
+        source_file = self.manifest.files[file_id]
+        load_deferred_contents(source_file)
+        return FileBlock(source_file)
+
     # Parse the files in the 'parser_files' dictionary, for parsers listed in
     # 'parser_types'
     def parse_project(
@@ -726,21 +782,28 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
-                block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
+            if self.parse_pool is not None and self.parse_pool.should_parse(
+                parser_name, len(parser_files[parser_name])
+            ):
+                project_parsed_path_count = self.parse_files_in_pool(
+                    project, parser, parser_files[parser_name]
+                )
+            else:
+                for file_id in parser_files[parser_name]:
+                    block = self.get_file_block(file_id)
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        if self.partially_parsing:
+                            dct = block.file.pp_dict
+                        else:
+                            dct = block.file.dict_from_yaml
+                        # this is where the schema file gets parsed
+                        parser.parse_file(block, dct=dct)
+                        # Came out of here with UnpatchedSourceDefinition containing configs at the source level
+                        # and not configs at the table level (as expected)
                     else:
-                        dct = block.file.dict_from_yaml
-                    # this is where the schema file gets parsed
-                    parser.parse_file(block, dct=dct)
-                    # Came out of here with UnpatchedSourceDefinition containing configs at the source level
-                    # and not configs at the table level (as expected)
-                else:
-                    parser.parse_file(block)
-                project_parsed_path_count += 1
+                        parser.parse_file(block)
+                    project_parsed_path_count += 1
 
             # Save timing info
             project_loader_info.parsers.append(
@@ -775,6 +838,31 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    # Parsing in worker processes is only worth it for a full parse: a partial
+    # parse usually only has a handful of files to parse.
+    def start_parse_pool(self) -> Optional[ParseProcessPool]:
+        parse_workers = get_flags().PARSE_WORKERS or 1
+        if parse_workers <= 1 or self.partially_parsing:
+            return None
+        return ParseProcessPool(parse_workers, self.root_project, self.all_projects, self.manifest)
+
+    def parse_files_in_pool(
+        self, project: RuntimeConfig, parser: Parser, file_ids: List[str]
+    ) -> int:
+        assert self.parse_pool is not None
+        source_files = [self.manifest.files[file_id] for file_id in file_ids]
+        for chunk, result in self.parse_pool.parse_files(
+            project.project_name, type(parser).__name__, source_files
+        ):
+            if result is None or result.error is not None:
+                # Parse the chunk here instead, which raises the same error
+                # a serial parse would have
+                for source_file in chunk:
+                    parser.parse_file(self.get_file_block(source_file.file_id))
+            else:
+                result.merge_into(self.manifest)
+        return len(file_ids)
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -807,8 +895,12 @@ class ManifestLoader:
                 if dep_macro_id:
                     macro.depends_on.add_macro(dep_macro_id)  # will check for dupes
 
+    @property
+    def partial_parse_write_path(self) -> str:
+        return os.path.join(self.root_project.project_target_path, PARTIAL_PARSE_FILE_NAME)
+
     def write_manifest_for_partial_parse(self):
-        path = os.path.join(self.root_project.project_target_path, PARTIAL_PARSE_FILE_NAME)
+        path = self.partial_parse_write_path
         try:
             # This shouldn't be necessary, but we have gotten bug reports (#3757) of the
             # saved manifest not matching the code version.
@@ -817,13 +909,79 @@ class ManifestLoader:
                     UnableToPartialParse(reason="saved manifest contained the wrong version")
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
-            make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            # Only the shards of the changed files need to be written if the
+            # manifest was partially parsed from the saved state
+            saved_index = None
+            if self.manifest is self.saved_manifest:
+                saved_index = self.saved_partial_parse_index
+            write_partial_parse_file(
+                path,
+                self.manifest,
+                saved_index,
+                self.get_changed_files() if saved_index is not None else None,
+            )
         except Exception:
             raise
 
+    def get_changed_files(self) -> Set[str]:
+        """The file_ids of the files whose objects in the saved manifest may have
+        been replaced or modified by partial parsing."""
+        changed_files: Set[str] = set()
+        if self.partial_parser is not None:
+            for key in (
+                "deleted",
+                "deleted_schema_files",
+                "added",
+                "changed",
+                "changed_schema_files",
+            ):
+                changed_files.update(self.partial_parser.file_diff[key])
+            for parser_files in self.partial_parser.project_parser_files.values():
+                for file_ids in parser_files.values():
+                    changed_files.update(file_ids)
+
+        # Everything created or updated in this parse has a new created_at, the
+        # same check the process_* methods use
+        sections: List[Mapping[str, Any]] = [
+            self.manifest.nodes,
+            self.manifest.sources,
+            self.manifest.macros,
+            self.manifest.exposures,
+            self.manifest.metrics,
+            self.manifest.semantic_models,
+            self.manifest.saved_queries,
+            self.manifest.unit_tests,
+        ]
+        for section in sections:
+            for obj in section.values():
+                if obj.created_at >= self.started_at:
+                    changed_files.add(obj.file_id)
+        for unique_id, disabled_nodes in self.manifest.disabled.items():
+            # Removing a node can update the disabled nodes with the same unique_id
+            node = self.manifest.nodes.get(unique_id)
+            reparsed = node is not None and node.created_at >= self.started_at
+            for disabled_node in disabled_nodes:
+                if reparsed or disabled_node.created_at >= self.started_at:
+                    changed_files.add(disabled_node.file_id)
+        return changed_files
+
+    def read_file_stat_cache(self) -> Optional[FileStatCache]:
+        # A file diff already says which files changed
+        if not get_flags().PARTIAL_PARSE or self.file_diff:
+            return None
+        path = os.path.join(
+            self.root_project.project_target_path, PARTIAL_PARSE_FILE_STATS_FILE_NAME
+        )
+        return FileStatCache.from_path(path)
+
+    def write_file_stat_cache(self) -> None:
+        if self.file_stat_cache is None or self.file_diff or not self.file_stat_cache.changed:
+            return
+        path = os.path.join(
+            self.root_project.project_target_path, PARTIAL_PARSE_FILE_STATS_FILE_NAME
+        )
+        self.file_stat_cache.write(path)
+
     def inject_external_nodes(self) -> bool:
         # Remove previously existing external nodes since we are regenerating them
         manifest_nodes_modified = False
@@ -834,6 +992,7 @@ class ManifestLoader:
         for unique_id in self.manifest.external_node_unique_ids:
             # remove external nodes from manifest only after dependent project references safely removed
             self.manifest.nodes.pop(unique_id)
+            self.manifest.ref_lookup.remove_node(unique_id)
 
         # Inject any newly-available external nodes
         pm = plugins.get_plugin_manager(self.root_project.project_name)
@@ -863,23 +1022,16 @@ class ManifestLoader:
             fire_event(UnableToPartialParse(reason="of a version mismatch"))
             # If the version is wrong, the other checks might not work
             return False, ReparseReason.version_mismatch
-        if self.manifest.state_check.vars_hash != manifest.state_check.vars_hash:
+        changed_vars = self.manifest.state_check.changed_vars(manifest.state_check)
+        if changed_vars.intersection(manifest.state_check.unattributed_vars):
             fire_event(
                 UnableToPartialParse(
-                    reason="config vars, config profile, or config target have changed"
+                    reason="config vars or target fields used outside of a project file have changed"
                 )
             )
-            fire_event(
-                Note(
-                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {manifest.state_check.vars_hash.checksum}"
-                ),
-                level=EventLevel.DEBUG,
-            )
             valid = False
             reparse_reason = ReparseReason.vars_changed
         if self.manifest.state_check.profile_hash != manifest.state_check.profile_hash:
-            # Note: This should be made more granular. We shouldn't need to invalidate
-            # partial parsing if a non-used profile section has changed.
             fire_event(UnableToPartialParse(reason="profile has changed"))
             valid = False
             reparse_reason = ReparseReason.profile_changed
@@ -910,6 +1062,16 @@ class ManifestLoader:
                     fire_event(UnableToPartialParse(reason="a project config has changed"))
                     valid = False
                     reparse_reason = ReparseReason.project_config_changed
+        if (
+            valid
+            and self.manifest.state_check.project_config_hash
+            != manifest.state_check.project_config_hash
+        ):
+            fire_event(
+                UnableToPartialParse(reason="config vars used in a project config have changed")
+            )
+            valid = False
+            reparse_reason = ReparseReason.vars_changed
         return valid, reparse_reason
 
     def skip_partial_parsing_because_of_macros(self):
@@ -929,7 +1091,31 @@ class ManifestLoader:
                     return True
         return False
 
-    def read_manifest_for_partial_parse(self) -> Optional[Manifest]:
+    def read_saved_partial_parse_index(
+        self, saved_manifest: Manifest
+    ) -> Optional[PartialParseIndex]:
+        """The index of the saved partial parse state, if it was written from the
+        manifest that a long running process passed in"""
+        path = self.partial_parse_write_path
+        try:
+            with open(path, "rb") as fp, PartialParseFile(
+                fp, partial_parse_shards_path(path)
+            ) as partial_parse_file:
+                # Every invocation has its own id, so the file was written by
+                # this process
+                if (
+                    partial_parse_file.metadata.invocation_id
+                    == saved_manifest.metadata.invocation_id
+                ):
+                    return partial_parse_file.index
+        except Exception:
+            # The whole state is written again
+            pass
+        return None
+
+    def read_manifest_for_partial_parse(
+        self, saved_manifest: Optional[Manifest] = None
+    ) -> Optional[Manifest]:
         flags = get_flags()
         if not flags.PARTIAL_PARSE:
             fire_event(PartialParsingNotEnabled())
@@ -940,15 +1126,34 @@ class ManifestLoader:
 
         reparse_reason = None
 
-        if os.path.exists(path):
+        if saved_manifest is not None:
+            is_partial_parsable, reparse_reason = self.is_partial_parsable(saved_manifest)
+            if is_partial_parsable:
+                self.saved_partial_parse_index = self.read_saved_partial_parse_index(
+                    saved_manifest
+                )
+                # The lookups may refer to nodes that partial parsing replaces
+                saved_manifest.clear_lookups()
+                saved_manifest.metadata.generated_at = datetime.datetime.utcnow()
+                saved_manifest.metadata.invocation_id = get_invocation_id()
+                return saved_manifest
+        elif os.path.exists(path):
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
-                # keep this check inside the try/except in case something about
-                # the file has changed in weird ways, perhaps due to being a
-                # different version of dbt
-                is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
+                with open(path, "rb") as fp, PartialParseFile(
+                    fp, partial_parse_shards_path(path)
+                ) as partial_parse_file:
+                    # keep this check inside the try/except in case something about
+                    # the file has changed in weird ways, perhaps due to being a
+                    # different version of dbt. Only the header of the file is
+                    # decoded for the check, so a full reparse never pays for
+                    # decoding the saved nodes.
+                    is_partial_parsable, reparse_reason = self.is_partial_parsable(
+                        partial_parse_file.header_manifest()
+                    )
+                    if is_partial_parsable:
+                        manifest: Manifest = partial_parse_file.to_manifest()
+                        if path == self.partial_parse_write_path:
+                            self.saved_partial_parse_index = partial_parse_file.index
                 if is_partial_parsable:
                     # We don't want to have stale generated_at dates
                     manifest.metadata.generated_at = datetime.datetime.utcnow()
@@ -987,34 +1192,22 @@ class ManifestLoader:
             mli._project_index[project.project_name] = project_info
         return mli
 
-    # TODO: handle --vars in the same way we handle env_var
-    # https://github.com/dbt-labs/dbt-core/issues/6323
     def build_manifest_state_check(self):
         config = self.root_project
         all_projects = self.all_projects
         # if any of these change, we need to reject the parser
 
-        # Create a FileHash of vars string, profile name and target name
-        # This does not capture vars in dbt_project, just the command line
-        # arg vars, but since any changes to that file will cause state_check
-        # to not pass, it doesn't matter.  If we move to more granular checking
-        # of env_vars, that would need to change.
-        # We are using the parsed cli_vars instead of config.args.vars, in order
-        # to sort them and avoid reparsing because of ordering issues.
+        # vars_hash is only a FileHash of the version, which is_partial_parsable
+        # already compares with the manifest's dbt_version. The vars passed with
+        # --vars and the fields of the target are hashed one by one below, so
+        # that only the files that read a changed var or target field have to be
+        # reparsed. We are using the parsed cli_vars instead of config.args.vars,
+        # in order to sort them and avoid reparsing because of ordering issues.
         secret_vars = [
             v for k, v in config.cli_vars.items() if k.startswith(SECRET_ENV_PREFIX) and v.strip()
         ]
         stringified_cli_vars = pprint.pformat(config.cli_vars)
-        vars_hash = FileHash.from_contents(
-            "\x00".join(
-                [
-                    stringified_cli_vars,
-                    getattr(config.args, "profile", "") or "",
-                    getattr(config.args, "target", "") or "",
-                    __version__,
-                ]
-            )
-        )
+        vars_hash = FileHash.from_contents(__version__)
         fire_event(
             StateCheckVarsHash(
                 checksum=vars_hash.checksum,
@@ -1024,6 +1217,23 @@ class ManifestLoader:
                 version=__version__,
             )
         )
+        cli_var_hashes = {
+            name: FileHash.from_contents(pprint.pformat(value))
+            for name, value in config.cli_vars.items()
+        }
+
+        # vars can also be used in dbt_project.yml, which is rendered before
+        # parsing. Paths that can be set with a flag are left out, because they
+        # don't change the parse results.
+        project_configs = []
+        for name in sorted(all_projects):
+            project_config = all_projects[name].to_project_config()
+            for key in ("project-root", "target-path", "log-path"):
+                project_config.pop(key, None)
+            # the default docs-paths are collected in a set, so they're unordered
+            project_config["docs-paths"] = sorted(project_config["docs-paths"])
+            project_configs.append(project_config)
+        project_config_hash = FileHash.from_contents(pprint.pformat(project_configs))
 
         # Create a FileHash of the env_vars in the project
         key_list = list(config.project_env_vars.keys())
@@ -1033,18 +1243,25 @@ class ManifestLoader:
             env_var_str += f"{key}:{config.project_env_vars[key]}|"
         project_env_vars_hash = FileHash.from_contents(env_var_str)
 
-        # Create a hash of the connection_info, which user has access to in
-        # jinja context. Thus attributes here may affect the parsing result.
-        # Ideally we should not expose all of the connection info to the jinja.
+        # Create a hash of the parts of the profile that parsing uses directly:
+        # the adapter type picks the macros, and the database and schema are the
+        # defaults for every node.
 
         # Renaming this variable mean that we will have to do a whole lot more
         # change to make sure the previous manifest can be loaded correctly.
         # This is an example of naming should be chosen based on the functionality
         # rather than the implementation details.
-        connection_keys = list(config.credentials.connection_info())
-        # avoid reparsing because of ordering issues
-        connection_keys.sort()
-        profile_hash = FileHash.from_contents(pprint.pformat(connection_keys))
+        credentials = config.credentials
+        profile_hash = FileHash.from_contents(
+            pprint.pformat([credentials.type, credentials.database, credentials.schema])
+        )
+
+        # The rest of the target only matters where Jinja reads it. Fields that
+        # aren't in the target, like passwords, are never visible to Jinja.
+        target_hashes = {
+            name: FileHash.from_contents(pprint.pformat(value))
+            for name, value in config.to_target_dict().items()
+        }
 
         # Create a FileHashes for dbt_project for all dependencies
         project_hashes = {}
@@ -1059,6 +1276,9 @@ class ManifestLoader:
             vars_hash=vars_hash,
             profile_hash=profile_hash,
             project_hashes=project_hashes,
+            project_config_hash=project_config_hash,
+            cli_var_hashes=cli_var_hashes,
+            target_hashes=target_hashes,
         )
         return state_check
 
@@ -1133,24 +1353,47 @@ class ManifestLoader:
             }
         )
 
+    def _dirty_members(
+        self, phase: str, collection: Mapping[str, Any], all_if_untracked: bool = False
+    ) -> List[Any]:
+        """The members of 'collection' that 'phase' needs to visit, which are
+        the ones that were created or updated in this load. When the manifest
+        tracks its dirty members (see Manifest.track_dirty) only those are
+        looked at; otherwise every member is checked for a new created_at, or
+        returned if 'all_if_untracked'. The visited and skipped counts are
+        added to the perf info.
+        """
+        dirty = self.manifest.dirty
+        if dirty is not None:
+            members = []
+            for unique_id in dirty:
+                member = collection.get(unique_id)
+                if member is not None and member.created_at >= self.started_at:
+                    members.append(member)
+        elif all_if_untracked:
+            members = list(collection.values())
+        else:
+            members = [m for m in collection.values() if m.created_at >= self.started_at]
+
+        phase_info = self._process_phase_index.get(phase)
+        if phase_info is None:
+            phase_info = ProcessPhaseInfo(phase=phase)
+            self._perf_info.process_phases.append(phase_info)
+            self._process_phase_index[phase] = phase_info
+        phase_info.visited_count += len(members)
+        phase_info.skipped_count += len(collection) - len(members)
+        return members
+
     # Takes references in 'refs' array of nodes and exposures, finds the target
     # node, and updates 'depends_on.nodes' with the unique id
     def process_refs(self, current_project: str, dependencies: Optional[Mapping[str, Project]]):
-        for node in self.manifest.nodes.values():
-            if node.created_at < self.started_at:
-                continue
+        for node in self._dirty_members("process_refs", self.manifest.nodes):
             _process_refs(self.manifest, current_project, node, dependencies)
-        for exposure in self.manifest.exposures.values():
-            if exposure.created_at < self.started_at:
-                continue
+        for exposure in self._dirty_members("process_refs", self.manifest.exposures):
             _process_refs(self.manifest, current_project, exposure, dependencies)
-        for metric in self.manifest.metrics.values():
-            if metric.created_at < self.started_at:
-                continue
+        for metric in self._dirty_members("process_refs", self.manifest.metrics):
             _process_refs(self.manifest, current_project, metric, dependencies)
-        for semantic_model in self.manifest.semantic_models.values():
-            if semantic_model.created_at < self.started_at:
-                continue
+        for semantic_model in self._dirty_members("process_refs", self.manifest.semantic_models):
             _process_refs(self.manifest, current_project, semantic_model, dependencies)
             self.update_semantic_model(semantic_model)
 
@@ -1158,18 +1401,12 @@ class ManifestLoader:
     # node, and updates 'depends_on.nodes' with the unique id
     def process_metrics(self, config: RuntimeConfig):
         current_project = config.project_name
-        for metric in self.manifest.metrics.values():
-            if metric.created_at < self.started_at:
-                continue
+        for metric in self._dirty_members("process_metrics", self.manifest.metrics):
             _process_metric_node(self.manifest, current_project, metric)
             _process_metrics_for_node(self.manifest, current_project, metric)
-        for node in self.manifest.nodes.values():
-            if node.created_at < self.started_at:
-                continue
+        for node in self._dirty_members("process_metrics", self.manifest.nodes):
             _process_metrics_for_node(self.manifest, current_project, node)
-        for exposure in self.manifest.exposures.values():
-            if exposure.created_at < self.started_at:
-                continue
+        for exposure in self._dirty_members("process_metrics", self.manifest.exposures):
             _process_metrics_for_node(self.manifest, current_project, exposure)
 
     def process_saved_queries(self, config: RuntimeConfig):
@@ -1178,16 +1415,25 @@ class ManifestLoader:
         # because they refer to some other changed node, so there will be
         # false positives. Ideally we would compare actual changes.
         semantic_manifest_changed = False
-        semantic_manifest_nodes: chain[SemanticManifestNode] = chain(
-            self.manifest.saved_queries.values(),
-            self.manifest.semantic_models.values(),
-            self.manifest.metrics.values(),
-        )
-        for node in semantic_manifest_nodes:
-            # Check if this node has been modified in this parsing run
-            if node.created_at > self.started_at:
-                semantic_manifest_changed = True
-                break  # as soon as we run into one changed node we can stop
+        dirty = self.manifest.dirty
+        if dirty is not None:
+            semantic_manifest_changed = any(
+                unique_id in self.manifest.saved_queries
+                or unique_id in self.manifest.semantic_models
+                or unique_id in self.manifest.metrics
+                for unique_id in dirty
+            )
+        else:
+            semantic_manifest_nodes: chain[SemanticManifestNode] = chain(
+                self.manifest.saved_queries.values(),
+                self.manifest.semantic_models.values(),
+                self.manifest.metrics.values(),
+            )
+            for node in semantic_manifest_nodes:
+                # Check if this node has been modified in this parsing run
+                if node.created_at > self.started_at:
+                    semantic_manifest_changed = True
+                    break  # as soon as we run into one changed node we can stop
         if semantic_manifest_changed is False:
             return
 
@@ -1201,11 +1447,10 @@ class ManifestLoader:
     def process_model_inferred_primary_keys(self):
         """Processes Model nodes to populate their `primary_key`."""
         model_to_generic_test_map: Dict[str, List[GenericTestNode]] = {}
-        for node in self.manifest.nodes.values():
+        nodes = self._dirty_members("process_model_inferred_primary_keys", self.manifest.nodes)
+        for node in nodes:
             if not isinstance(node, ModelNode):
                 continue
-            if node.created_at < self.started_at:
-                continue
             if not model_to_generic_test_map:
                 model_to_generic_test_map = self.build_model_to_generic_tests_map()
             generic_tests: List[GenericTestNode] = []
@@ -1233,88 +1478,36 @@ class ManifestLoader:
     # metrics: metric descriptions
     # semantic_models: semantic model descriptions
     def process_docs(self, config: RuntimeConfig):
-        for node in self.manifest.nodes.values():
-            if node.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config,
-                node,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_node(ctx, node, self.manifest)
-        for source in self.manifest.sources.values():
-            if source.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config,
-                source,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_source(ctx, source, self.manifest)
-        for macro in self.manifest.macros.values():
-            if macro.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config,
-                macro,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_macro(ctx, macro)
-        for exposure in self.manifest.exposures.values():
-            if exposure.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config,
-                exposure,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_exposure(ctx, exposure)
-        for metric in self.manifest.metrics.values():
-            if metric.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config,
-                metric,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_metrics(ctx, metric)
-        for semantic_model in self.manifest.semantic_models.values():
-            if semantic_model.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config,
-                semantic_model,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_semantic_model(ctx, semantic_model)
-        for saved_query in self.manifest.saved_queries.values():
-            if saved_query.created_at < self.started_at:
-                continue
-            ctx = generate_runtime_docs_context(
-                config, saved_query, self.manifest, config.project_name
-            )
-            _process_docs_for_saved_query(ctx, saved_query)
+        start_process_docs = time.perf_counter()
+        renderer = DocsRenderer(config, self.manifest, config.project_name)
+        for node in self._dirty_members("process_docs", self.manifest.nodes):
+            _process_docs_for_node(renderer, node, self.manifest)
+        for source in self._dirty_members("process_docs", self.manifest.sources):
+            _process_docs_for_source(renderer, source, self.manifest)
+        for macro in self._dirty_members("process_docs", self.manifest.macros):
+            _process_docs_for_macro(renderer, macro)
+        for exposure in self._dirty_members("process_docs", self.manifest.exposures):
+            _process_docs_for_exposure(renderer, exposure)
+        for metric in self._dirty_members("process_docs", self.manifest.metrics):
+            _process_docs_for_metrics(renderer, metric)
+        for semantic_model in self._dirty_members("process_docs", self.manifest.semantic_models):
+            _process_docs_for_semantic_model(renderer, semantic_model)
+        for saved_query in self._dirty_members("process_docs", self.manifest.saved_queries):
+            _process_docs_for_saved_query(renderer, saved_query)
+        self._perf_info.process_docs_elapsed = time.perf_counter() - start_process_docs
+        self._perf_info.rendered_description_count = renderer.rendered_count
+        self._perf_info.plain_description_count = renderer.plain_count
 
     # Loops through all nodes and exposures, for each element in
     # 'sources' array finds the source node and updates the
     # 'depends_on.nodes' array with the unique id
     def process_sources(self, current_project: str):
-        for node in self.manifest.nodes.values():
+        for node in self._dirty_members("process_sources", self.manifest.nodes):
             if node.resource_type == NodeType.Source:
                 continue
             assert not isinstance(node, SourceDefinition)
-            if node.created_at < self.started_at:
-                continue
             _process_sources_for_node(self.manifest, current_project, node)
-        for exposure in self.manifest.exposures.values():
-            if exposure.created_at < self.started_at:
-                continue
+        for exposure in self._dirty_members("process_sources", self.manifest.exposures):
             _process_sources_for_exposure(self.manifest, current_project, exposure)
 
     # Loops through all nodes, for each element in
@@ -1322,15 +1515,11 @@ class ManifestLoader:
     # 'depends_on.nodes' array with the unique id
     def process_unit_tests(self, current_project: str):
         models_to_versions = None
-        unit_test_unique_ids = list(self.manifest.unit_tests.keys())
-        for unit_test_unique_id in unit_test_unique_ids:
+        unit_tests = self._dirty_members("process_unit_tests", self.manifest.unit_tests)
+        for unit_test in unit_tests:
             # This is because some unit tests will be removed when processing
-            # and the list of unit_test_unique_ids won't have changed
-            if unit_test_unique_id in self.manifest.unit_tests:
-                unit_test = self.manifest.unit_tests[unit_test_unique_id]
-            else:
-                continue
-            if unit_test.created_at < self.started_at:
+            # and the list of unit_tests won't have changed
+            if unit_test.unique_id not in self.manifest.unit_tests:
                 continue
             if not models_to_versions:
                 models_to_versions = _build_model_names_to_versions(self.manifest)
@@ -1348,6 +1537,7 @@ class ManifestLoader:
                 self.manifest.add_disabled_nofile(node)
         for unique_id in disabled_nodes:
             self.manifest.nodes.pop(unique_id)
+            self.manifest.ref_lookup.remove_node(unique_id)
 
         disabled_copy = deepcopy(self.manifest.disabled)
         for disabled in disabled_copy.values():
@@ -1355,29 +1545,50 @@ class ManifestLoader:
                 if node.config.enabled:
                     for dis_index, dis_node in enumerate(disabled):
                         # Remove node from disabled and unique_id from disabled dict if necessary
-                        del self.manifest.disabled[node.unique_id][dis_index]
+                        removed = self.manifest.disabled[node.unique_id].pop(dis_index)
+                        self.manifest.disabled_lookup.remove_node(removed)
                         if not self.manifest.disabled[node.unique_id]:
                             self.manifest.disabled.pop(node.unique_id)
 
                     self.manifest.add_node_nofile(node)
 
-        self.manifest.rebuild_ref_lookup()
-
-    def check_valid_group_config(self):
+    def check_valid_configs(self):
+        """Validates the configs that can only be checked once everything is
+        parsed, in a single pass over the nodes created or updated in this
+        load."""
         manifest = self.manifest
         group_names = {group.name for group in manifest.groups.values()}
+        for collection in (manifest.metrics, manifest.semantic_models, manifest.saved_queries):
+            for member in self._dirty_members(
+                "check_valid_configs", collection, all_if_untracked=True
+            ):
+                self.check_valid_group_config_node(member, group_names)
 
-        for metric in manifest.metrics.values():
-            self.check_valid_group_config_node(metric, group_names)
-
-        for semantic_model in manifest.semantic_models.values():
-            self.check_valid_group_config_node(semantic_model, group_names)
-
-        for saved_query in manifest.saved_queries.values():
-            self.check_valid_group_config_node(saved_query, group_names)
-
-        for node in manifest.nodes.values():
+        check_microbatch = manifest.use_microbatch_batches(
+            project_name=self.root_project.project_name
+        )
+        nodes = self._dirty_members("check_valid_configs", manifest.nodes, all_if_untracked=True)
+        for node in nodes:
             self.check_valid_group_config_node(node, group_names)
+            self.check_valid_access_property_node(node)
+            # Snapshot config can be set in either SQL files or yaml files,
+            # so we need to validate afterward.
+            if node.resource_type == NodeType.Snapshot and node.created_at >= self.started_at:
+                node.config.final_validate()
+            if check_microbatch:
+                self.check_valid_microbatch_config_node(node)
+
+        # Whether microbatch models are run in batches depends on the
+        # microbatch macro, so if that changed the unchanged models are checked too
+        if check_microbatch and manifest.dirty is not None:
+            microbatch_macro_changed = any(
+                manifest.macros[unique_id].name == "get_incremental_microbatch_sql"
+                for unique_id in manifest.dirty
+                if unique_id in manifest.macros
+            )
+            if microbatch_macro_changed:
+                for node in manifest.nodes.values():
+                    self.check_valid_microbatch_config_node(node)
 
     def check_valid_group_config_node(
         self,
@@ -1391,89 +1602,82 @@ class ManifestLoader:
                 node=groupable_node,
             )
 
-    def check_valid_access_property(self):
-        for node in self.manifest.nodes.values():
-            if (
-                isinstance(node, ModelNode)
-                and node.access == AccessType.Public
-                and node.get_materialization() == "ephemeral"
-            ):
-                raise InvalidAccessTypeError(
-                    unique_id=node.unique_id,
-                    field_value=node.access,
-                    materialization=node.get_materialization(),
-                )
+    def check_valid_access_property_node(self, node: ManifestNode) -> None:
+        if (
+            isinstance(node, ModelNode)
+            and node.access == AccessType.Public
+            and node.get_materialization() == "ephemeral"
+        ):
+            raise InvalidAccessTypeError(
+                unique_id=node.unique_id,
+                field_value=node.access,
+                materialization=node.get_materialization(),
+            )
 
-    def check_valid_snapshot_config(self):
-        # Snapshot config can be set in either SQL files or yaml files,
-        # so we need to validate afterward.
-        for node in self.manifest.nodes.values():
-            if node.resource_type != NodeType.Snapshot:
-                continue
-            if node.created_at < self.started_at:
-                continue
-            node.config.final_validate()
+    def check_valid_microbatch_config_node(self, node: ManifestNode) -> None:
+        # Only NodeConfigs have an incremental_strategy. A TestConfig can't
+        # be materialized as "incremental".
+        config = node.config
+        if not (
+            isinstance(config, NodeConfig)
+            and config.materialized == "incremental"
+            and config.incremental_strategy == "microbatch"
+        ):
+            return
 
-    def check_valid_microbatch_config(self):
-        if self.manifest.use_microbatch_batches(project_name=self.root_project.project_name):
-            for node in self.manifest.nodes.values():
-                if (
-                    node.config.materialized == "incremental"
-                    and node.config.incremental_strategy == "microbatch"
-                ):
-                    # Required configs: event_time, batch_size, begin
-                    event_time = node.config.event_time
-                    if event_time is None:
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' must provide an 'event_time' (string) config that indicates the name of the event time column."
-                        )
-                    if not isinstance(event_time, str):
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' must provide an 'event_time' config of type string, but got: {type(event_time)}."
-                        )
+        # Required configs: event_time, batch_size, begin
+        event_time = config.event_time
+        if event_time is None:
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' must provide an 'event_time' (string) config that indicates the name of the event time column."
+            )
+        if not isinstance(event_time, str):
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' must provide an 'event_time' config of type string, but got: {type(event_time)}."
+            )
 
-                    begin = node.config.begin
-                    if begin is None:
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' must provide a 'begin' (datetime) config that indicates the earliest timestamp the microbatch model should be built from."
-                        )
+        begin = config.begin
+        if begin is None:
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' must provide a 'begin' (datetime) config that indicates the earliest timestamp the microbatch model should be built from."
+            )
 
-                    # Try to cast begin to a datetime using same format as mashumaro for consistency with other yaml-provided datetimes
-                    # Mashumaro default: https://github.com/Fatal1ty/mashumaro/blob/4ac16fd060a6c651053475597b58b48f958e8c5c/README.md?plain=1#L1186
-                    if isinstance(begin, str):
-                        try:
-                            begin = datetime.datetime.fromisoformat(begin)
-                            node.config.begin = begin
-                        except Exception:
-                            raise dbt.exceptions.ParsingError(
-                                f"Microbatch model '{node.name}' must provide a 'begin' config of valid datetime (ISO format), but got: {begin}."
-                            )
-
-                    if not isinstance(begin, datetime.datetime):
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' must provide a 'begin' config of type datetime, but got: {type(begin)}."
-                        )
+        # Try to cast begin to a datetime using same format as mashumaro for consistency with other yaml-provided datetimes
+        # Mashumaro default: https://github.com/Fatal1ty/mashumaro/blob/4ac16fd060a6c651053475597b58b48f958e8c5c/README.md?plain=1#L1186
+        if isinstance(begin, str):
+            try:
+                begin = datetime.datetime.fromisoformat(begin)
+                config.begin = begin
+            except Exception:
+                raise dbt.exceptions.ParsingError(
+                    f"Microbatch model '{node.name}' must provide a 'begin' config of valid datetime (ISO format), but got: {begin}."
+                )
 
-                    batch_size = node.config.batch_size
-                    valid_batch_sizes = [size.value for size in BatchSize]
-                    if batch_size not in valid_batch_sizes:
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' must provide a 'batch_size' config that is one of {valid_batch_sizes}, but got: {batch_size}."
-                        )
+        if not isinstance(begin, datetime.datetime):
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' must provide a 'begin' config of type datetime, but got: {type(begin)}."
+            )
 
-                    # Optional config: lookback (int)
-                    lookback = node.config.lookback
-                    if not isinstance(lookback, int) and lookback is not None:
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' must provide the optional 'lookback' config as type int, but got: {type(lookback)})."
-                        )
+        batch_size = config.batch_size
+        valid_batch_sizes = [size.value for size in BatchSize]
+        if batch_size not in valid_batch_sizes:
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' must provide a 'batch_size' config that is one of {valid_batch_sizes}, but got: {batch_size}."
+            )
 
-                    # optional config: concurrent_batches (bool)
-                    concurrent_batches = node.config.concurrent_batches
-                    if not isinstance(concurrent_batches, bool) and concurrent_batches is not None:
-                        raise dbt.exceptions.ParsingError(
-                            f"Microbatch model '{node.name}' optional 'concurrent_batches' config must be of type `bool` if specified, but got: {type(concurrent_batches)})."
-                        )
+        # Optional config: lookback (int)
+        lookback = config.lookback
+        if not isinstance(lookback, int) and lookback is not None:
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' must provide the optional 'lookback' config as type int, but got: {type(lookback)})."
+            )
+
+        # optional config: concurrent_batches (bool)
+        concurrent_batches = config.concurrent_batches
+        if not isinstance(concurrent_batches, bool) and concurrent_batches is not None:
+            raise dbt.exceptions.ParsingError(
+                f"Microbatch model '{node.name}' optional 'concurrent_batches' config must be of type `bool` if specified, but got: {type(concurrent_batches)})."
+            )
 
     def check_forcing_batch_concurrency(self) -> None:
         if self.manifest.use_microbatch_batches(project_name=self.root_project.project_name):
@@ -1657,9 +1861,52 @@ def _check_manifest(manifest: Manifest, config: RuntimeConfig) -> None:
 
 
 DocsContextCallback = Callable[[ResultNode], Dict[str, Any]]
+DocsTarget = Union[Macro, ResultNode, Exposure, Metric, SemanticModel, SavedQuery]
+
+
+class DocsRenderer:
+    """Renders the descriptions of the members processed by process_docs.
+
+    Most descriptions are plain text, which rendering wouldn't change, so
+    they're returned as they are without building a docs context. Otherwise
+    the docs context of the member's package is built the first time it's
+    needed and reused for the other members of the package, pointed at the
+    member being rendered so that doc() resolves and records it.
+    """
+
+    def __init__(self, config: RuntimeConfig, manifest: Manifest, current_project: str) -> None:
+        self.config = config
+        self.manifest = manifest
+        self.current_project = current_project
+        # package_name -> (docs context, its dict)
+        self._contexts: Dict[str, Tuple[DocsRuntimeContext, Dict[str, Any]]] = {}
+        self.rendered_count = 0
+        self.plain_count = 0
+
+    def get_context(self, target: DocsTarget) -> Dict[str, Any]:
+        entry = self._contexts.get(target.package_name)
+        if entry is None:
+            docs_context = DocsRuntimeContext(
+                self.config, target, self.manifest, self.current_project
+            )
+            # This is not a Mashumaro to_dict call
+            entry = self._contexts[target.package_name] = (docs_context, docs_context.to_dict())
+        entry[0].node = target
+        return entry[1]
+
+    def render(self, description: str, target: DocsTarget) -> str:
+        if not has_render_chars(description):
+            self.plain_count += 1
+            return description
+        self.rendered_count += 1
+        return get_rendered(description, self.get_context(target))
 
 
 def _get_doc_blocks(description: str, manifest: Manifest, node_package: str) -> List[str]:
+    # doc() can only be called from jinja
+    if not has_render_chars(description):
+        return []
+
     ast = parse(description)
     doc_blocks: List[str] = []
 
@@ -1699,72 +1946,72 @@ def _get_doc_blocks(description: str, manifest: Manifest, node_package: str) ->
 
 # node and column descriptions
 def _process_docs_for_node(
-    context: Dict[str, Any],
+    renderer: DocsRenderer,
     node: ManifestNode,
     manifest: Manifest,
 ):
     node.doc_blocks = _get_doc_blocks(node.description, manifest, node.package_name)
-    node.description = get_rendered(node.description, context)
+    node.description = renderer.render(node.description, node)
 
     for column_name, column in node.columns.items():
         column.doc_blocks = _get_doc_blocks(column.description, manifest, node.package_name)
-        column.description = get_rendered(column.description, context)
+        column.description = renderer.render(column.description, node)
 
 
 # source and table descriptions, column descriptions
 def _process_docs_for_source(
-    context: Dict[str, Any],
+    renderer: DocsRenderer,
     source: SourceDefinition,
     manifest: Manifest,
 ):
     source.doc_blocks = _get_doc_blocks(source.description, manifest, source.package_name)
-    source.description = get_rendered(source.description, context)
+    source.description = renderer.render(source.description, source)
 
-    source.source_description = get_rendered(source.source_description, context)
+    source.source_description = renderer.render(source.source_description, source)
 
     for column in source.columns.values():
         column.doc_blocks = _get_doc_blocks(column.description, manifest, source.package_name)
-        column.description = get_rendered(column.description, context)
+        column.description = renderer.render(column.description, source)
 
 
 # macro argument descriptions
-def _process_docs_for_macro(context: Dict[str, Any], macro: Macro) -> None:
-    macro.description = get_rendered(macro.description, context)
+def _process_docs_for_macro(renderer: DocsRenderer, macro: Macro) -> None:
+    macro.description = renderer.render(macro.description, macro)
     for arg in macro.arguments:
-        arg.description = get_rendered(arg.description, context)
+        arg.description = renderer.render(arg.description, macro)
 
 
 # exposure descriptions
-def _process_docs_for_exposure(context: Dict[str, Any], exposure: Exposure) -> None:
-    exposure.description = get_rendered(exposure.description, context)
+def _process_docs_for_exposure(renderer: DocsRenderer, exposure: Exposure) -> None:
+    exposure.description = renderer.render(exposure.description, exposure)
 
 
-def _process_docs_for_metrics(context: Dict[str, Any], metric: Metric) -> None:
-    metric.description = get_rendered(metric.description, context)
+def _process_docs_for_metrics(renderer: DocsRenderer, metric: Metric) -> None:
+    metric.description = renderer.render(metric.description, metric)
 
 
 def _process_docs_for_semantic_model(
-    context: Dict[str, Any], semantic_model: SemanticModel
+    renderer: DocsRenderer, semantic_model: SemanticModel
 ) -> None:
     if semantic_model.description:
-        semantic_model.description = get_rendered(semantic_model.description, context)
+        semantic_model.description = renderer.render(semantic_model.description, semantic_model)
 
     for dimension in semantic_model.dimensions:
         if dimension.description:
-            dimension.description = get_rendered(dimension.description, context)
+            dimension.description = renderer.render(dimension.description, semantic_model)
 
     for measure in semantic_model.measures:
         if measure.description:
-            measure.description = get_rendered(measure.description, context)
+            measure.description = renderer.render(measure.description, semantic_model)
 
     for entity in semantic_model.entities:
         if entity.description:
-            entity.description = get_rendered(entity.description, context)
+            entity.description = renderer.render(entity.description, semantic_model)
 
 
-def _process_docs_for_saved_query(context: Dict[str, Any], saved_query: SavedQuery) -> None:
+def _process_docs_for_saved_query(renderer: DocsRenderer, saved_query: SavedQuery) -> None:
     if saved_query.description:
-        saved_query.description = get_rendered(saved_query.description, context)
+        saved_query.description = renderer.render(saved_query.description, saved_query)
 
 
 def _process_refs(
@@ -1991,6 +2238,7 @@ def remove_dependent_project_references(manifest, external_node_unique_id):
         if external_node_unique_id in node.depends_on_nodes:
             node.depends_on_nodes.remove(external_node_unique_id)
         node.created_at = time.time()
+        manifest.mark_dirty(child_id)
 
 
 def _process_sources_for_exposure(manifest: Manifest, current_project: str, exposure: Exposure):
@@ -2067,13 +2315,7 @@ def _process_sources_for_node(manifest: Manifest, current_project: str, node: Ma
 # This is called in task.rpc.sql_commands when a "dynamic" node is
 # created in the manifest, in 'add_refs'
 def process_macro(config: RuntimeConfig, manifest: Manifest, macro: Macro) -> None:
-    ctx = generate_runtime_docs_context(
-        config,
-        macro,
-        manifest,
-        config.project_name,
-    )
-    _process_docs_for_macro(ctx, macro)
+    _process_docs_for_macro(DocsRenderer(config, manifest, config.project_name), macro)
 
 
 # This is called in task.rpc.sql_commands when a "dynamic" node is
@@ -2081,8 +2323,7 @@ def process_macro(config: RuntimeConfig, manifest: Manifest, macro: Macro) -> No
 def process_node(config: RuntimeConfig, manifest: Manifest, node: ManifestNode):
     _process_sources_for_node(manifest, config.project_name, node)
     _process_refs(manifest, config.project_name, node, config.dependencies)
-    ctx = generate_runtime_docs_context(config, node, manifest, config.project_name)
-    _process_docs_for_node(ctx, node, manifest)
+    _process_docs_for_node(DocsRenderer(config, manifest, config.project_name), node, manifest)
 
 
 def write_semantic_manifest(manifest: Manifest, target_path: str) -> None:
@@ -2115,14 +2356,16 @@ def parse_manifest(
 
     # If we should (over)write the manifest in the target path, do that now
     if write and write_json:
-        write_manifest(manifest, runtime_config.project_target_path)
-        pm = plugins.get_plugin_manager(runtime_config.project_name)
-        plugin_artifacts = pm.get_manifest_artifacts(manifest)
-        for path, plugin_artifact in plugin_artifacts.items():
-            plugin_artifact.write(path)
-            fire_event(
-                ArtifactWritten(
-                    artifact_type=plugin_artifact.__class__.__name__, artifact_path=path
-                )
-            )
+        write_manifest_and_plugin_artifacts(manifest, runtime_config)
     return manifest
+
+
+def write_manifest_and_plugin_artifacts(manifest: Manifest, runtime_config: RuntimeConfig):
+    write_manifest(manifest, runtime_config.project_target_path)
+    pm = plugins.get_plugin_manager(runtime_config.project_name)
+    plugin_artifacts = pm.get_manifest_artifacts(manifest)
+    for path, plugin_artifact in plugin_artifacts.items():
+        plugin_artifact.write(path)
+        fire_event(
+            ArtifactWritten(artifact_type=plugin_artifact.__class__.__name__, artifact_path=path)
+        )
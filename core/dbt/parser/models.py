@@ -10,7 +10,11 @@ import dbt.tracking as tracking
 from dbt import utils
 from dbt.artifacts.resources import RefArgs
 from dbt.clients.jinja import get_rendered
+from dbt.clients.jinja_static import StaticAnalysisError, statically_extract_model_calls
+from dbt.constants import TARGET_FIELD_VAR_PREFIX
 from dbt.context.context_config import ContextConfig
+from dbt.context.providers import ParseVar
+from dbt.contracts.files import SourceFile
 from dbt.contracts.graph.nodes import ModelNode
 from dbt.exceptions import (
     ModelConfigError,
@@ -377,20 +381,55 @@ class ModelParser(SimpleSQLParser[ModelNode]):
                 )
 
     def run_static_parser(self, node: ModelNode) -> Optional[Union[str, Dict[str, List[Any]]]]:
+        fallback_reasons = self.manifest._parsing_info.static_analysis_fallback_reasons
         # if any banned macros have been overridden by the user, we cannot use the static parser.
         if self._has_banned_macro(node):
+            fallback_reasons[node.file_id] = "has_banned_macro"
             return "has_banned_macro"
 
         # run the stable static parser and return the results
         try:
             statically_parsed = py_extract_from_source(node.raw_code)
             return _shift_sources(statically_parsed)
-        # if we want information on what features are barring the static
-        # parser from reading model files, this is where we would add that
-        # since that information is stored in the `ExtractionError`.
+        # the stable static parser doesn't read set statements, vars or if
+        # statements, so try the slower python static analysis before
+        # falling back to jinja rendering.
         except ExtractionError:
+            pass
+
+        try:
+            return self.run_static_analysis(node)
+        except StaticAnalysisError as exc:
+            fallback_reasons[node.file_id] = str(exc)
             return "cannot_parse"
 
+    def run_static_analysis(self, node: ModelNode) -> Dict[str, List[Any]]:
+        statically_parsed = statically_extract_model_calls(node.raw_code)
+
+        banned_macros = list(statically_parsed["macros"])
+        if statically_parsed["vars"]:
+            banned_macros.append("var")
+        if self._has_banned_macro(node, banned_macros):
+            raise StaticAnalysisError("has_banned_macro")
+
+        # vars are rendered when they are read, and could call ref or source
+        var = ParseVar({}, self.root_project, node)
+        for var_name in statically_parsed["vars"]:
+            if var.has_var(var_name):
+                value = var.get_raw_var(var_name)
+                if isinstance(value, str) and ("{{" in value or "{%" in value):
+                    raise StaticAnalysisError(f"var {var_name} has jinja in its value")
+
+        macro_ids = []
+        for macro_name in statically_parsed["macros"]:
+            macro_id = f"macro.dbt.{macro_name}"
+            if macro_id not in self.manifest.macros:
+                raise StaticAnalysisError(f"{macro_name} is not a dbt macro")
+            macro_ids.append(macro_id)
+        statically_parsed["macros"] = macro_ids
+
+        return statically_parsed
+
     def run_experimental_parser(
         self, node: ModelNode
     ) -> Optional[Union[str, Dict[str, List[Any]]]]:
@@ -412,11 +451,14 @@ class ModelParser(SimpleSQLParser[ModelNode]):
             return "cannot_parse"
 
     # checks for banned macros
-    def _has_banned_macro(self, node: ModelNode) -> bool:
+    def _has_banned_macro(
+        self, node: ModelNode, banned_macros: Optional[List[str]] = None
+    ) -> bool:
         # first check if there is a banned macro defined in scope for this model file
         root_project_name = self.root_project.project_name
         project_name = node.package_name
-        banned_macros = ["ref", "source", "config"]
+        if banned_macros is None:
+            banned_macros = ["ref", "source", "config"]
 
         all_banned_macro_keys: Iterator[str] = chain.from_iterable(
             map(
@@ -433,6 +475,22 @@ class ModelParser(SimpleSQLParser[ModelNode]):
     # as the node object. Used to populate these values when circumventing jinja
     # rendering like the static parser.
     def populate(self, node: ModelNode, config: ContextConfig, statically_parsed: Dict[str, Any]):
+        # the python static analysis also returns what rendering records on
+        # the node and its file: the macros called and the vars read
+        for macro_id in statically_parsed.get("macros", []):
+            node.depends_on.add_macro(macro_id)
+        source_file = self.manifest.files.get(node.file_id)
+        if isinstance(source_file, SourceFile):
+            for var_name in chain(
+                statically_parsed.get("vars", []),
+                (
+                    f"{TARGET_FIELD_VAR_PREFIX}{field}"
+                    for field in statically_parsed.get("target_fields", [])
+                ),
+            ):
+                if var_name not in source_file.vars:
+                    source_file.vars.append(var_name)
+
         # manually fit configs in
         config._config_call_dict = _get_config_call_dict(statically_parsed)
 
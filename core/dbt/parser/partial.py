@@ -1,6 +1,6 @@
 import os
 from copy import deepcopy
-from typing import Callable, Dict, List, MutableMapping, Union
+from typing import Callable, Dict, List, MutableMapping, Optional, Set, Union
 
 from dbt.constants import DEFAULT_ENV_PLACEHOLDER
 from dbt.contracts.files import (
@@ -68,10 +68,15 @@ special_override_macros = [
 # a full parse (such as for certain macro changes)
 class PartialParsing:
     def __init__(
-        self, saved_manifest: Manifest, new_files: MutableMapping[str, AnySourceFile]
+        self,
+        saved_manifest: Manifest,
+        new_files: MutableMapping[str, AnySourceFile],
+        changed_vars: Optional[Set[str]] = None,
     ) -> None:
         self.saved_manifest = saved_manifest
         self.new_files = new_files
+        # the names of the --vars and target fields whose values have changed
+        self.changed_vars: Set[str] = changed_vars or set()
         self.project_parser_files: Dict = {}
         self.saved_files = self.saved_manifest.files
         self.project_parser_files = {}
@@ -816,6 +821,7 @@ class PartialParsing:
                 pp_dict[key].append(patch)
 
         schema_file.delete_from_env_vars(key, patch["name"])
+        schema_file.delete_from_vars(key, patch["name"])
         schema_file.delete_from_unrendered_configs(key, patch["name"])
         self.add_to_pp_files(schema_file)
 
@@ -1065,7 +1071,7 @@ class PartialParsing:
             self.add_to_pp_files(orig_file)
 
     # This builds a dictionary of files that need to be scheduled for parsing
-    # because the env var has changed.
+    # because the env var or a var passed with --vars has changed.
     # source_files
     #   env_vars_changed_source_files: [file_id, file_id...]
     # schema_files
@@ -1098,7 +1104,7 @@ class PartialParsing:
 
         env_vars_changed_source_files = []
         env_vars_changed_schema_files = {}
-        # The SourceFiles contain a list of env_vars that were used in the file.
+        # The SourceFiles contain a list of env_vars and vars that were used in the file.
         # The SchemaSourceFiles contain a dictionary of yaml_key to schema entry names to
         # a list of vars.
         # Create a list of file_ids for source_files that need to be reparsed, and
@@ -1107,25 +1113,34 @@ class PartialParsing:
             if source_file.parse_file_type == ParseFileType.Fixture:
                 continue
             file_id = source_file.file_id
-            if not source_file.env_vars:
+            if not source_file.env_vars and not source_file.vars:
                 continue
             if source_file.parse_file_type == ParseFileType.Schema:
-                for yaml_key in source_file.env_vars.keys():
-                    for name in source_file.env_vars[yaml_key].keys():
-                        for env_var in source_file.env_vars[yaml_key][name]:
-                            if env_var in changed_vars:
-                                if file_id not in env_vars_changed_schema_files:
-                                    env_vars_changed_schema_files[file_id] = {}
-                                if yaml_key not in env_vars_changed_schema_files[file_id]:
-                                    env_vars_changed_schema_files[file_id][yaml_key] = []
-                                if name not in env_vars_changed_schema_files[file_id][yaml_key]:
-                                    env_vars_changed_schema_files[file_id][yaml_key].append(name)
-                                break  # if one env_var is changed we can stop
+                for used_vars, changed in (
+                    (source_file.env_vars, changed_vars),
+                    (source_file.vars, self.changed_vars),
+                ):
+                    for yaml_key in used_vars.keys():
+                        for name in used_vars[yaml_key].keys():
+                            for var in used_vars[yaml_key][name]:
+                                if var in changed:
+                                    if file_id not in env_vars_changed_schema_files:
+                                        env_vars_changed_schema_files[file_id] = {}
+                                    if yaml_key not in env_vars_changed_schema_files[file_id]:
+                                        env_vars_changed_schema_files[file_id][yaml_key] = []
+                                    if (
+                                        name
+                                        not in env_vars_changed_schema_files[file_id][yaml_key]
+                                    ):
+                                        env_vars_changed_schema_files[file_id][yaml_key].append(
+                                            name
+                                        )
+                                    break  # if one var is changed we can stop
 
             else:
-                for env_var in source_file.env_vars:
-                    if env_var in changed_vars:
-                        env_vars_changed_source_files.append(file_id)
-                        break  # if one env_var is changed we can stop
+                if any(env_var in changed_vars for env_var in source_file.env_vars) or any(
+                    var in self.changed_vars for var in source_file.vars
+                ):
+                    env_vars_changed_source_files.append(file_id)
 
         return (env_vars_changed_source_files, env_vars_changed_schema_files)
@@ -0,0 +1,433 @@
+import datetime
+import hashlib
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
+
+import msgpack  # type: ignore
+
+from dbt.contracts.graph.manifest import Manifest, ManifestMetadata, ManifestStateCheck
+from dbt_common.clients.system import make_directory
+from dbt_common.events.base_types import EventLevel
+from dbt_common.events.functions import fire_event
+from dbt_common.events.types import Note
+
+# The partial parse state is saved as a root file plus one shard per project file.
+#
+# The root file is a container of independently decodable sections:
+#
+#   MAGIC | header length (8 bytes, big endian) | header | section | section | ...
+#
+# The header is a small msgpack map holding the manifest's 'metadata' and
+# 'state_check', which are all that's needed to decide whether the saved
+# manifest can be used, and the offset and length of every section.
+# Offsets are relative to the end of the header. The last two bytes of
+# MAGIC are the format version.
+#
+# The sections hold the manifest fields that don't belong to a file, the
+# shard table mapping each file_id to the shard holding its objects, and the
+# order of the keys of every sharded field, so that the manifest is rebuilt
+# with the same ordering it was saved with. Shards are msgpack maps of
+# field -> key -> object, named by the sha256 of their contents, so a shard
+# is only written when the objects of its file have changed.
+PARTIAL_PARSE_FILE_MAGIC = b"dbtpp\x00\x00\x02"
+HEADER_LENGTH_FORMAT = ">Q"
+HEADER_KEYS = ("metadata", "state_check")
+SHARD_TABLE_SECTION = "shards"
+KEY_ORDER_SECTION = "keys"
+INDEX_SECTIONS = (SHARD_TABLE_SECTION, KEY_ORDER_SECTION)
+
+# Manifest fields whose objects are saved in the shard of the file that
+# defined them
+SHARDED_SECTIONS = (
+    "nodes",
+    "sources",
+    "macros",
+    "docs",
+    "exposures",
+    "metrics",
+    "groups",
+    "files",
+    "disabled",
+    "semantic_models",
+    "unit_tests",
+    "saved_queries",
+    "fixtures",
+)
+
+
+def partial_parse_shards_path(path: str) -> str:
+    """The directory holding the shards of the partial parse file at path"""
+    return f"{os.path.splitext(path)[0]}_shards"
+
+
+def extended_mashumaro_encoder(data):
+    return msgpack.packb(data, default=extended_msgpack_encoder, use_bin_type=True)
+
+
+def extended_msgpack_encoder(obj):
+    if type(obj) is datetime.date:
+        date_bytes = msgpack.ExtType(1, obj.isoformat().encode())
+        return date_bytes
+    elif type(obj) is datetime.datetime:
+        datetime_bytes = msgpack.ExtType(2, obj.isoformat().encode())
+        return datetime_bytes
+
+    return obj
+
+
+def extended_mashumuro_decoder(data):
+    return msgpack.unpackb(data, ext_hook=extended_msgpack_decoder, raw=False)
+
+
+def extended_msgpack_decoder(code, data):
+    if code == 1:
+        d = datetime.date.fromisoformat(data.decode())
+        return d
+    elif code == 2:
+        dt = datetime.datetime.fromisoformat(data.decode())
+        return dt
+    else:
+        return msgpack.ExtType(code, data)
+
+
+# section -> [(key, file_id of the owning file), ...] in manifest order. Disabled
+# nodes have an entry per node, so a key can appear more than once.
+KeyOrder = Dict[str, List[Tuple[str, str]]]
+
+
+def manifest_key_order(manifest: Manifest) -> KeyOrder:
+    key_order: KeyOrder = {}
+    for section in SHARDED_SECTIONS:
+        if section == "files":
+            key_order[section] = [(file_id, file_id) for file_id in manifest.files]
+        elif section == "disabled":
+            key_order[section] = [
+                (unique_id, node.file_id)
+                for unique_id, nodes in manifest.disabled.items()
+                for node in nodes
+            ]
+        else:
+            key_order[section] = [
+                (key, obj.file_id) for key, obj in getattr(manifest, section).items()
+            ]
+    return key_order
+
+
+@dataclass
+class PartialParseIndex:
+    """The shard table and key order saved in the root partial parse file"""
+
+    shards: Dict[str, str] = field(default_factory=dict)
+    key_order: KeyOrder = field(default_factory=dict)
+
+    def changed_files(self, key_order: KeyOrder) -> Set[str]:
+        """The file_ids that gained or lost objects compared to key_order"""
+        changed: Set[str] = set()
+        for section in SHARDED_SECTIONS:
+            saved = self.key_order.get(section, [])
+            current = key_order[section]
+            if section == "disabled":
+                # The position of a disabled node in its list is saved in the
+                # shard, so a list that changed in any way is rewritten whole
+                saved_lists = _group_owners(saved)
+                current_lists = _group_owners(current)
+                for unique_id in saved_lists.keys() | current_lists.keys():
+                    saved_owners = saved_lists.get(unique_id, [])
+                    current_owners = current_lists.get(unique_id, [])
+                    if saved_owners != current_owners:
+                        changed.update(saved_owners)
+                        changed.update(current_owners)
+            else:
+                changed.update(owner for _, owner in set(saved).symmetric_difference(current))
+        return changed
+
+
+def _group_owners(entries: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+    grouped: Dict[str, List[str]] = {}
+    for key, owner in entries:
+        grouped.setdefault(key, []).append(owner)
+    return grouped
+
+
+def pack_root(dct: Dict[str, Any]) -> bytes:
+    """Pack the header and sections of the root partial parse file"""
+    sections: List[bytes] = []
+    section_index: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for key, value in dct.items():
+        if key in HEADER_KEYS:
+            continue
+        packed = extended_mashumaro_encoder(value)
+        section_index[key] = (offset, len(packed))
+        sections.append(packed)
+        offset += len(packed)
+
+    header = {key: dct[key] for key in HEADER_KEYS}
+    header["sections"] = section_index
+    packed_header = extended_mashumaro_encoder(header)
+    return b"".join(
+        [
+            PARTIAL_PARSE_FILE_MAGIC,
+            struct.pack(HEADER_LENGTH_FORMAT, len(packed_header)),
+            packed_header,
+            *sections,
+        ]
+    )
+
+
+def _write_atomically(path: str, contents: bytes) -> None:
+    # Readers either see the previous file or the complete new one, never a
+    # partially written file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as fp:
+        fp.write(contents)
+    os.replace(tmp_path, path)
+
+
+def _manifest_subset(manifest: Manifest, files: Set[str]) -> Tuple[Manifest, Dict[str, List[int]]]:
+    """A manifest with the objects of the given files, and the fields that
+    don't belong to a file. Also returns the positions of the included disabled
+    nodes in their lists."""
+    sections: Dict[str, Any] = {}
+    for section in SHARDED_SECTIONS:
+        if section == "files":
+            sections[section] = {
+                file_id: source_file
+                for file_id, source_file in manifest.files.items()
+                if file_id in files
+            }
+        elif section != "disabled":
+            sections[section] = {
+                key: obj for key, obj in getattr(manifest, section).items() if obj.file_id in files
+            }
+    disabled: Dict[str, List[Any]] = {}
+    positions: Dict[str, List[int]] = {}
+    for unique_id, nodes in manifest.disabled.items():
+        for position, node in enumerate(nodes):
+            if node.file_id in files:
+                disabled.setdefault(unique_id, []).append(node)
+                positions.setdefault(unique_id, []).append(position)
+    subset = Manifest(
+        disabled=disabled,
+        selectors=manifest.selectors,
+        metadata=manifest.metadata,
+        flat_graph=manifest.flat_graph,
+        state_check=manifest.state_check,
+        env_vars=manifest.env_vars,
+        **sections,
+    )
+    return subset, positions
+
+
+def write_partial_parse_file(
+    path: str,
+    manifest: Manifest,
+    saved_index: Optional[PartialParseIndex] = None,
+    changed_files: Optional[Set[str]] = None,
+) -> PartialParseIndex:
+    """Save the manifest for partial parsing, and return the saved index.
+
+    If saved_index is the index the manifest was read with, only the shards of
+    changed_files, and of files that gained or lost objects, are serialized
+    and written again. The root file is replaced last, so an interrupted write
+    leaves the previous state in place."""
+    key_order = manifest_key_order(manifest)
+    all_files = {owner for entries in key_order.values() for _, owner in entries}
+    if saved_index is None or changed_files is None:
+        dirty_files = all_files
+        shards: Dict[str, str] = {}
+    else:
+        dirty_files = (
+            set(changed_files)
+            | saved_index.changed_files(key_order)
+            | (all_files - saved_index.shards.keys())
+        ) & all_files
+        shards = {
+            owner: name
+            for owner, name in saved_index.shards.items()
+            if owner in all_files and owner not in dirty_files
+        }
+
+    subset, disabled_positions = _manifest_subset(manifest, dirty_files)
+    captured: Dict[str, Any] = {}
+
+    def capture(dct: Dict[str, Any]) -> bytes:
+        captured.update(dct)
+        return b""
+
+    subset.to_msgpack(capture)
+
+    shard_contents: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for section in SHARDED_SECTIONS:
+        values = captured.pop(section)
+        if section == "files":
+            for file_id, value in values.items():
+                shard_contents.setdefault(file_id, {}).setdefault(section, {})[file_id] = value
+        elif section == "disabled":
+            for unique_id, nodes in values.items():
+                for node, position, value in zip(
+                    subset.disabled[unique_id], disabled_positions[unique_id], nodes
+                ):
+                    shard_contents.setdefault(node.file_id, {}).setdefault(section, {}).setdefault(
+                        unique_id, []
+                    ).append([position, value])
+        else:
+            objs = getattr(subset, section)
+            for key, value in values.items():
+                owner = objs[key].file_id
+                shard_contents.setdefault(owner, {}).setdefault(section, {})[key] = value
+
+    shards_path = partial_parse_shards_path(path)
+    make_directory(shards_path)
+    for owner, contents in shard_contents.items():
+        packed = extended_mashumaro_encoder(contents)
+        name = hashlib.sha256(packed).hexdigest()
+        shard_path = os.path.join(shards_path, f"{name}.msgpack")
+        if not os.path.exists(shard_path):
+            _write_atomically(shard_path, packed)
+        shards[owner] = name
+
+    captured[SHARD_TABLE_SECTION] = shards
+    captured[KEY_ORDER_SECTION] = key_order
+    make_directory(os.path.dirname(path))
+    _write_atomically(path, pack_root(captured))
+
+    # Remove the shards that are no longer referenced
+    referenced = {f"{name}.msgpack" for name in shards.values()}
+    for file_name in os.listdir(shards_path):
+        if file_name not in referenced:
+            try:
+                os.remove(os.path.join(shards_path, file_name))
+            except OSError:
+                pass
+
+    fire_event(
+        Note(msg=f"Wrote {len(shard_contents)} of {len(shards)} partial parse shards"),
+        level=EventLevel.DEBUG,
+    )
+    return PartialParseIndex(shards=shards, key_order=key_order)
+
+
+class PartialParseFile:
+    """A partial parse file opened for reading.
+
+    The root file is memory mapped, and only its header is decoded when it's
+    opened. Sections are decoded the first time they're accessed, and shards
+    are only read when the complete manifest is requested, so checking whether
+    the saved manifest can be used never decodes the nodes, macros or files."""
+
+    def __init__(self, fp: IO[bytes], shards_path: str) -> None:
+        self.shards_path = shards_path
+        self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._sections: Dict[str, Any] = {}
+        try:
+            magic_length = len(PARTIAL_PARSE_FILE_MAGIC)
+            if self._mmap[:magic_length] != PARTIAL_PARSE_FILE_MAGIC:
+                raise ValueError("not a partial parse file, or written by another version of dbt")
+            header_start = magic_length + struct.calcsize(HEADER_LENGTH_FORMAT)
+            (header_length,) = struct.unpack_from(HEADER_LENGTH_FORMAT, self._mmap, magic_length)
+            self._data_start = header_start + header_length
+            self.header: Dict[str, Any] = self._decode(header_start, self._data_start)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "PartialParseFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _decode(self, start: int, end: int) -> Any:
+        if end > len(self._mmap):
+            raise ValueError("partial parse file is truncated")
+        with memoryview(self._mmap) as view:
+            return extended_mashumuro_decoder(view[start:end])
+
+    @property
+    def section_names(self) -> List[str]:
+        return list(self.header["sections"])
+
+    def section(self, name: str) -> Any:
+        if name not in self._sections:
+            offset, length = self.header["sections"][name]
+            start = self._data_start + offset
+            self._sections[name] = self._decode(start, start + length)
+        return self._sections[name]
+
+    @property
+    def metadata(self) -> ManifestMetadata:
+        return ManifestMetadata.from_msgpack(self.header["metadata"], decoder=_decoded)
+
+    @property
+    def state_check(self) -> ManifestStateCheck:
+        return ManifestStateCheck.from_msgpack(self.header["state_check"], decoder=_decoded)
+
+    @property
+    def index(self) -> PartialParseIndex:
+        return PartialParseIndex(
+            shards=self.section(SHARD_TABLE_SECTION),
+            key_order={
+                section: [(key, owner) for key, owner in entries]
+                for section, entries in self.section(KEY_ORDER_SECTION).items()
+            },
+        )
+
+    def header_manifest(self) -> Manifest:
+        """An otherwise empty manifest with the saved metadata and state check,
+        for checking whether the saved manifest can be used"""
+        return Manifest(metadata=self.metadata, state_check=self.state_check)
+
+    def read_shard(self, name: str) -> Dict[str, Dict[str, Any]]:
+        with open(os.path.join(self.shards_path, f"{name}.msgpack"), "rb") as fp:
+            return extended_mashumuro_decoder(fp.read())
+
+    def to_manifest(self) -> Manifest:
+        dct: Dict[str, Any] = {key: self.header[key] for key in HEADER_KEYS}
+        for name in self.section_names:
+            if name not in INDEX_SECTIONS:
+                dct[name] = self.section(name)
+
+        index = self.index
+        objects: Dict[str, Dict[str, Any]] = {section: {} for section in SHARDED_SECTIONS}
+        disabled: Dict[str, List[List[Any]]] = {}
+        for name in index.shards.values():
+            for section, values in self.read_shard(name).items():
+                if section == "disabled":
+                    for unique_id, positioned_nodes in values.items():
+                        disabled.setdefault(unique_id, []).extend(positioned_nodes)
+                else:
+                    objects[section].update(values)
+
+        for section in SHARDED_SECTIONS:
+            key_order = index.key_order[section]
+            if section == "disabled":
+                dct[section] = {
+                    unique_id: [node for _, node in sorted(disabled[unique_id], key=itemgetter(0))]
+                    for unique_id in dict.fromkeys(key for key, _ in key_order)
+                }
+            else:
+                dct[section] = {key: objects[section][key] for key, _ in key_order}
+        return Manifest.from_msgpack(dct, decoder=_decoded)  # type: ignore[arg-type]
+
+
+def _decoded(data: Any) -> Any:
+    # Used as the 'decoder' for from_msgpack when the data is already decoded
+    return data
+
+
+def read_partial_parse_file(path: str) -> Optional[Manifest]:
+    """Read the complete manifest from a partial parse file, if it exists"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as fp, PartialParseFile(
+        fp, partial_parse_shards_path(path)
+    ) as partial_parse_file:
+        return partial_parse_file.to_manifest()
@@ -1,10 +1,14 @@
 import os
 import pathlib
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Mapping, MutableMapping, Optional, Protocol
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Protocol, Tuple
 
+import msgpack
 import pathspec  # type: ignore
 
+from dbt.clients.yaml_helper import load_yaml_text
 from dbt.config import Project
 from dbt.contracts.files import (
     AnySourceFile,
@@ -17,10 +21,11 @@ from dbt.contracts.files import (
 )
 from dbt.events.types import InputFileDiffError
 from dbt.exceptions import ParsingError
+from dbt.mp_context import get_mp_context
 from dbt.parser.common import schema_file_keys
-from dbt.parser.schemas import yaml_from_file
+from dbt.parser.schemas import schema_dict_from_yaml, yaml_from_file
 from dbt.parser.search import filesystem_search
-from dbt_common.clients.system import load_file_contents
+from dbt_common.clients.system import load_file_contents, make_directory
 from dbt_common.dataclass_schema import dbtClassMixin
 from dbt_common.events.functions import fire_event
 
@@ -41,12 +46,99 @@ class FileDiff(dbtClassMixin):
     added: List[InputFile]
 
 
+# Files modified this recently are not recorded in the FileStatCache, because
+# a second write within the same mtime tick would not change their stat key.
+RACY_MTIME_WINDOW_NS = 2 * 1_000_000_000
+
+
+class FileStatCache:
+    """An index of absolute path -> (size, mtime_ns, inode, checksum) for the
+    files read during parsing. It is saved next to partial_parse.msgpack so
+    that files whose stat information hasn't changed since the previous
+    invocation don't need to be read and hashed again. Only the entries that
+    were looked up or added in this invocation are written back out, so
+    deleted files drop out of the index.
+    """
+
+    VERSION = 1
+
+    def __init__(self, entries: Optional[Dict[str, List]] = None) -> None:
+        self.entries: Dict[str, List] = entries or {}
+        self.new_entries: Dict[str, List] = {}
+
+    @classmethod
+    def from_path(cls, path: str) -> "FileStatCache":
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, "rb") as fp:
+                data = msgpack.unpackb(fp.read(), raw=False)
+            if data.get("version") == cls.VERSION:
+                return cls(data["entries"])
+        except Exception:
+            # A corrupt or unreadable index just means we read every file
+            pass
+        return cls()
+
+    @property
+    def changed(self) -> bool:
+        return self.new_entries != self.entries
+
+    def write(self, path: str) -> None:
+        make_directory(os.path.dirname(path))
+        data = msgpack.packb({"version": self.VERSION, "entries": self.new_entries})
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp_path, path)
+        self.entries = dict(self.new_entries)
+
+    def get_checksum(self, absolute_path: str, stat: os.stat_result) -> Optional[FileHash]:
+        entry = self.entries.get(absolute_path)
+        if entry is None:
+            return None
+        size, mtime_ns, inode, name, checksum = entry
+        if size != stat.st_size or mtime_ns != stat.st_mtime_ns or inode != stat.st_ino:
+            return None
+        self.new_entries[absolute_path] = entry
+        return FileHash(name=name, checksum=checksum)
+
+    def set_checksum(self, absolute_path: str, stat: os.stat_result, checksum: FileHash) -> None:
+        if time.time_ns() - stat.st_mtime_ns < RACY_MTIME_WINDOW_NS:
+            return
+        self.new_entries[absolute_path] = [
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+            checksum.name,
+            checksum.checksum,
+        ]
+
+
+def get_cached_checksum(
+    path: FilePath, file_stat_cache: Optional[FileStatCache]
+) -> Tuple[Optional[FileHash], Optional[os.stat_result]]:
+    if file_stat_cache is None:
+        return None, None
+    stat = os.stat(path.absolute_path)
+    return file_stat_cache.get_checksum(path.absolute_path, stat), stat
+
+
+# Source files whose checksum came from the FileStatCache are created
+# without contents. They are read here, when a parser actually needs them.
+def load_deferred_contents(source_file: AnySourceFile) -> None:
+    if source_file.contents is None and isinstance(source_file.path, FilePath):
+        source_file.contents = load_file_contents(source_file.path.absolute_path, strip=True)
+
+
 # This loads the files contents and creates the SourceFile object
 def load_source_file(
     path: FilePath,
     parse_file_type: ParseFileType,
     project_name: str,
     saved_files,
+    file_stat_cache: Optional[FileStatCache] = None,
+    decode_yaml: bool = True,
 ) -> Optional[AnySourceFile]:
 
     if parse_file_type == ParseFileType.Schema:
@@ -63,14 +155,25 @@ def load_source_file(
         project_name=project_name,
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
+    old_source_file = None
+    if saved_files and source_file.file_id in saved_files:
         old_source_file = saved_files[source_file.file_id]
-        if (
+
+    cached_checksum, stat = get_cached_checksum(path, file_stat_cache)
+    if cached_checksum is not None and parse_file_type != ParseFileType.Schema:
+        # The contents will be loaded by load_deferred_contents if the
+        # file needs to be parsed
+        source_file.checksum = cached_checksum
+        return source_file
+
+    skip_loading_schema_file = False
+    if parse_file_type == ParseFileType.Schema and old_source_file is not None:
+        if cached_checksum is not None:
+            if old_source_file.checksum == cached_checksum:
+                source_file.checksum = cached_checksum
+                source_file.dfy = old_source_file.dfy
+                skip_loading_schema_file = True
+        elif (
             source_file.path.modification_time != 0.0
             and old_source_file.path.modification_time == source_file.path.modification_time
         ):
@@ -83,16 +186,77 @@ def load_source_file(
         # the checksum to match the stored file contents
         file_contents = load_file_contents(path.absolute_path, strip=True)
         source_file.contents = file_contents
-        source_file.checksum = FileHash.from_contents(file_contents)
+        source_file.checksum = cached_checksum or FileHash.from_contents(file_contents)
+        # The saved schema file caches the decoded yaml for its checksum, so a file
+        # that was touched without changing doesn't need to be decoded again
+        if (
+            parse_file_type == ParseFileType.Schema
+            and old_source_file is not None
+            and old_source_file.checksum == source_file.checksum
+        ):
+            source_file.dfy = old_source_file.dfy
+            skip_loading_schema_file = True
+
+    if file_stat_cache is not None and stat is not None:
+        file_stat_cache.set_checksum(path.absolute_path, stat, source_file.checksum)
 
-    if parse_file_type == ParseFileType.Schema and source_file.contents:
-        dfy = yaml_from_file(source_file)
-        if dfy:
-            validate_yaml(source_file.path.original_file_path, dfy)
-            source_file.dfy = dfy
+    if (
+        parse_file_type == ParseFileType.Schema
+        and source_file.contents
+        and not skip_loading_schema_file
+        and decode_yaml
+    ):
+        load_schema_file_yaml(source_file)
     return source_file
 
 
+def set_dict_from_yaml(source_file: SchemaSourceFile, dfy: Optional[Dict[str, Any]]) -> None:
+    if dfy:
+        validate_yaml(source_file.path.original_file_path, dfy)
+        source_file.dfy = dfy
+
+
+def load_schema_file_yaml(source_file: SchemaSourceFile) -> None:
+    set_dict_from_yaml(source_file, yaml_from_file(source_file))
+
+
+# Below this many schema files per process, starting the processes costs more
+# than decoding the yaml serially.
+MIN_SCHEMA_FILES_PER_PROCESS = 32
+
+
+def load_schema_files_yaml(source_files: List[SchemaSourceFile], max_workers: int = 1) -> None:
+    """Decode the yaml of schema files that were read with decode_yaml=False.
+
+    Decoding yaml is CPU bound, so with more than one worker the files are
+    decoded in a pool of processes and only the resulting dictionaries are
+    checked here. The files are checked in order, and a file that fails to
+    decode is decoded again here to raise the same error as a serial load."""
+    process_count = min(max_workers, len(source_files) // MIN_SCHEMA_FILES_PER_PROCESS)
+    loaded_yaml: List[Any] = []
+    if process_count > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=process_count, mp_context=get_mp_context()
+            ) as executor:
+                chunksize = max(1, len(source_files) // (process_count * 4))
+                for loaded in executor.map(
+                    load_yaml_text,
+                    [source_file.contents or "" for source_file in source_files],
+                    chunksize=chunksize,
+                ):
+                    loaded_yaml.append(loaded)
+        except Exception:
+            # The files from the one that failed onwards are decoded below
+            pass
+
+    for index, source_file in enumerate(source_files):
+        if index < len(loaded_yaml):
+            set_dict_from_yaml(source_file, schema_dict_from_yaml(source_file, loaded_yaml[index]))
+        else:
+            load_schema_file_yaml(source_file)
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -122,13 +286,19 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
+def load_seed_source_file(
+    match: FilePath, project_name, file_stat_cache: Optional[FileStatCache] = None
+) -> SourceFile:
     if match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
-        file_contents = load_file_contents(match.absolute_path, strip=True)
-        checksum = FileHash.from_contents(file_contents)
+        checksum, stat = get_cached_checksum(match, file_stat_cache)
+        if checksum is None:
+            file_contents = load_file_contents(match.absolute_path, strip=True)
+            checksum = FileHash.from_contents(file_contents)
+        if file_stat_cache is not None and stat is not None:
+            file_stat_cache.set_checksum(match.absolute_path, stat, checksum)
         source_file = SourceFile(path=match, checksum=checksum)
         source_file.contents = ""
     source_file.parse_file_type = ParseFileType.Seed
@@ -136,36 +306,83 @@ def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
     return source_file
 
 
+# Use the FilesystemSearcher to get the FilePaths for a parse file type
+def search_source_files(project, paths, extension, parse_file_type, ignore_spec) -> List[FilePath]:
+    fp_list = filesystem_search(project, paths, extension, ignore_spec)
+    # singular tests live in /tests but only generic tests live
+    # in /tests/generic and fixtures in /tests/fixture so we want to skip those
+    if parse_file_type == ParseFileType.SingularTest:
+        fp_list = [
+            fp
+            for fp in fp_list
+            if pathlib.Path(fp.relative_path).parts[0] not in ["generic", "fixtures"]
+        ]
+    return fp_list
+
+
+def load_source_file_for_parse_type(
+    path: FilePath,
+    parse_file_type: ParseFileType,
+    project_name: str,
+    saved_files,
+    file_stat_cache: Optional[FileStatCache] = None,
+    decode_yaml: bool = True,
+) -> Optional[AnySourceFile]:
+    if parse_file_type == ParseFileType.Seed:
+        return load_seed_source_file(path, project_name, file_stat_cache)
+    return load_source_file(
+        path, parse_file_type, project_name, saved_files, file_stat_cache, decode_yaml
+    )
+
+
 # Use the FilesystemSearcher to get a bunch of FilePaths, then turn
 # them into a bunch of FileSource objects
-def get_source_files(project, paths, extension, parse_file_type, saved_files, ignore_spec):
+def get_source_files(
+    project,
+    paths,
+    extension,
+    parse_file_type,
+    saved_files,
+    ignore_spec,
+    file_stat_cache=None,
+    decode_yaml=True,
+):
     # file path list
-    fp_list = filesystem_search(project, paths, extension, ignore_spec)
+    fp_list = search_source_files(project, paths, extension, parse_file_type, ignore_spec)
     # file block list
     fb_list = []
     for fp in fp_list:
-        if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
-        # singular tests live in /tests but only generic tests live
-        # in /tests/generic and fixtures in /tests/fixture so we want to skip those
-        else:
-            if parse_file_type == ParseFileType.SingularTest:
-                path = pathlib.Path(fp.relative_path)
-                if path.parts[0] in ["generic", "fixtures"]:
-                    continue
-            file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
-            # only append the list if it has contents. added to fix #3568
-            if file:
-                fb_list.append(file)
+        file = load_source_file_for_parse_type(
+            fp, parse_file_type, project.project_name, saved_files, file_stat_cache, decode_yaml
+        )
+        # only append the list if it has contents. added to fix #3568
+        if file:
+            fb_list.append(file)
     return fb_list
 
 
-def read_files_for_parser(project, files, parse_ft, file_type_info, saved_files, ignore_spec):
+def read_files_for_parser(
+    project,
+    files,
+    parse_ft,
+    file_type_info,
+    saved_files,
+    ignore_spec,
+    file_stat_cache=None,
+    decode_yaml=True,
+):
     dirs = file_type_info["paths"]
     parser_files = []
     for extension in file_type_info["extensions"]:
         source_files = get_source_files(
-            project, dirs, extension, parse_ft, saved_files, ignore_spec
+            project,
+            dirs,
+            extension,
+            parse_ft,
+            saved_files,
+            ignore_spec,
+            file_stat_cache,
+            decode_yaml,
         )
         for sf in source_files:
             files[sf.file_id] = sf
@@ -205,11 +422,85 @@ class ReadFilesFromFileSystem:
     # }
     #
     project_parser_files: Dict = field(default_factory=dict)
+    # The number of threads used to search, read and hash files. With a
+    # single worker the files are read serially on the calling thread.
+    max_workers: int = 1
+    # checksums of files that haven't changed on disk since the last parse
+    file_stat_cache: Optional[FileStatCache] = None
+    # The number of processes used to decode the yaml of schema files. With a
+    # single worker the yaml is decoded as each file is read.
+    yaml_workers: int = 1
+
+    @property
+    def decode_yaml(self) -> bool:
+        return self.yaml_workers <= 1
 
     def read_files(self):
-        for project in self.all_projects.values():
-            file_types = get_file_types_for_project(project)
-            self.read_files_for_project(project, file_types)
+        if self.max_workers > 1:
+            self.read_files_concurrently()
+        else:
+            for project in self.all_projects.values():
+                file_types = get_file_types_for_project(project)
+                self.read_files_for_project(project, file_types)
+        if not self.decode_yaml:
+            schema_files = [
+                source_file
+                for source_file in self.files.values()
+                if isinstance(source_file, SchemaSourceFile)
+                and source_file.contents
+                and not source_file.dfy
+            ]
+            load_schema_files_yaml(schema_files, self.yaml_workers)
+
+    def read_files_concurrently(self):
+        # Searching the file system, reading file contents and hashing them
+        # spend most of their time outside of the GIL, so a thread pool works
+        # well here. Results are consumed in the same order that the serial
+        # path reads them, so 'files' and 'project_parser_files' are identical.
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="read-files"
+        ) as executor:
+            searches = []
+            for project in self.all_projects.values():
+                dbt_ignore_spec = generate_dbt_ignore_spec(project.project_root)
+                self.project_parser_files[project.project_name] = {}
+                for parse_ft, file_type_info in get_file_types_for_project(project).items():
+                    for extension in file_type_info["extensions"]:
+                        future = executor.submit(
+                            search_source_files,
+                            project,
+                            file_type_info["paths"],
+                            extension,
+                            parse_ft,
+                            dbt_ignore_spec,
+                        )
+                        searches.append((project.project_name, parse_ft, file_type_info, future))
+
+            loads = []
+            for project_name, parse_ft, file_type_info, future in searches:
+                file_futures = [
+                    executor.submit(
+                        load_source_file_for_parse_type,
+                        fp,
+                        parse_ft,
+                        project_name,
+                        self.saved_files,
+                        self.file_stat_cache,
+                        self.decode_yaml,
+                    )
+                    for fp in future.result()
+                ]
+                loads.append((project_name, file_type_info["parser"], file_futures))
+
+            for project_name, parser_name, file_futures in loads:
+                project_files = self.project_parser_files[project_name]
+                parser_files = project_files.setdefault(parser_name, [])
+                for file_future in file_futures:
+                    source_file = file_future.result()
+                    # only append the list if it has contents. added to fix #3568
+                    if source_file:
+                        self.files[source_file.file_id] = source_file
+                        parser_files.append(source_file.file_id)
 
     def read_files_for_project(self, project, file_types):
         dbt_ignore_spec = generate_dbt_ignore_spec(project.project_root)
@@ -223,6 +514,8 @@ class ReadFilesFromFileSystem:
                 file_type_info,
                 self.saved_files,
                 dbt_ignore_spec,
+                self.file_stat_cache,
+                self.decode_yaml,
             )
 
 
@@ -281,10 +574,7 @@ class ReadFilesFromDiff:
                 source_file.path.modification_time = input_file.modification_time
                 # Handle creation of dictionary version of schema file content
                 if isinstance(source_file, SchemaSourceFile) and source_file.contents:
-                    dfy = yaml_from_file(source_file)
-                    if dfy:
-                        validate_yaml(source_file.path.original_file_path, dfy)
-                        source_file.dfy = dfy
+                    load_schema_file_yaml(source_file)
                     # TODO: ensure we have a file object even for empty files, such as schema files
 
         # Now the new files
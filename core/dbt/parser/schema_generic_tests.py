@@ -1,7 +1,7 @@
 import itertools
 import os
 import pathlib
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from dbt.adapters.factory import get_adapter, get_adapter_package_names
 from dbt.artifacts.resources import NodeVersion, RefArgs
@@ -174,6 +174,9 @@ class SchemaGenericTestParser(SimpleParser):
             if self.schema_yaml_vars.env_vars:
                 self.store_env_vars(target, schema_file_id, self.schema_yaml_vars.env_vars)
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                self.store_vars(target, schema_file_id, self.schema_yaml_vars.vars)
+                self.schema_yaml_vars.vars = {}
 
         except ParsingError as exc:
             context = trimmed(str(target))
@@ -256,21 +259,32 @@ class SchemaGenericTestParser(SimpleParser):
                     attached_node = self.manifest.disabled[disabled_node[0].unique_id][0]
         return attached_node
 
+    def get_yaml_key_and_name(self, target) -> Tuple[str, str]:
+        if isinstance(target, UnpatchedSourceDefinition):
+            search_name = target.source.name
+            yaml_key = target.source.yaml_key
+            if "." in search_name:  # source file definitions
+                (search_name, _) = search_name.split(".")
+        else:
+            search_name = target.name
+            yaml_key = target.yaml_key
+        return yaml_key, search_name
+
     def store_env_vars(self, target, schema_file_id, env_vars):
         self.manifest.env_vars.update(env_vars)
         if schema_file_id in self.manifest.files:
             schema_file = self.manifest.files[schema_file_id]
-            if isinstance(target, UnpatchedSourceDefinition):
-                search_name = target.source.name
-                yaml_key = target.source.yaml_key
-                if "." in search_name:  # source file definitions
-                    (search_name, _) = search_name.split(".")
-            else:
-                search_name = target.name
-                yaml_key = target.yaml_key
+            yaml_key, search_name = self.get_yaml_key_and_name(target)
             for var in env_vars.keys():
                 schema_file.add_env_var(var, yaml_key, search_name)
 
+    def store_vars(self, target, schema_file_id, vars):
+        if schema_file_id in self.manifest.files:
+            schema_file = self.manifest.files[schema_file_id]
+            yaml_key, search_name = self.get_yaml_key_and_name(target)
+            for var in vars.keys():
+                schema_file.add_var(var, yaml_key, search_name)
+
     # This does special shortcut processing for the two
     # most common internal macros, not_null and unique,
     # which avoids the jinja rendering to resolve config
@@ -114,29 +114,40 @@ def yaml_from_file(source_file: SchemaSourceFile) -> Optional[Dict[str, Any]]:
     try:
         # source_file.contents can sometimes be None
         contents = load_yaml_text(source_file.contents or "", source_file.path)
+    except DbtValidationError as e:
+        raise YamlLoadError(
+            project_name=source_file.project_name, path=source_file.path.relative_path, exc=e
+        )
+    return schema_dict_from_yaml(source_file, contents)
 
-        if contents is None:
-            return contents
-
-        if not isinstance(contents, dict):
-            raise DbtValidationError(
-                f"Contents of file '{source_file.original_file_path}' are not valid. Dictionary expected."
-            )
-
-        # When loaded_loaded_at_field is defined as None or null, it shows up in
-        # the dict but when it is not defined, it does not show up in the dict
-        # We need to capture this to be able to override source level settings later.
-        for source in contents.get("sources", []):
-            for table in source.get("tables", []):
-                if "loaded_at_field" in table:
-                    table["loaded_at_field_present"] = True
 
+def schema_dict_from_yaml(
+    source_file: SchemaSourceFile, contents: Any
+) -> Optional[Dict[str, Any]]:
+    """Check the yaml loaded from a schema file, which may have been loaded in
+    another process, and record which source tables set 'loaded_at_field'."""
+    if contents is None:
         return contents
-    except DbtValidationError as e:
+
+    if not isinstance(contents, dict):
         raise YamlLoadError(
-            project_name=source_file.project_name, path=source_file.path.relative_path, exc=e
+            project_name=source_file.project_name,
+            path=source_file.path.relative_path,
+            exc=DbtValidationError(
+                f"Contents of file '{source_file.original_file_path}' are not valid. Dictionary expected."
+            ),
         )
 
+    # When loaded_loaded_at_field is defined as None or null, it shows up in
+    # the dict but when it is not defined, it does not show up in the dict
+    # We need to capture this to be able to override source level settings later.
+    for source in contents.get("sources", []):
+        for table in source.get("tables", []):
+            if "loaded_at_field" in table:
+                table["loaded_at_field_present"] = True
+
+    return contents
+
 
 # This is the main schema file parser, but almost everything happens in the
 # the schema sub-parsers.
@@ -282,7 +293,6 @@ class SchemaParser(SimpleParser[YamlBlock, ModelNode]):
         function looks for such snapshots and adds a node to manifest for each
         one we find, since they were not added during SQL parsing."""
 
-        rebuild_refs = False
         for snapshot in snapshots:
             if "relation" in snapshot:
                 from dbt.parser import SnapshotParser
@@ -320,14 +330,10 @@ class SchemaParser(SimpleParser[YamlBlock, ModelNode]):
                 # Implement the snapshot SQL as a simple select *
                 snapshot_node.raw_code = "select * from {{ " + snapshot["relation"] + " }}"
 
-                # Add our new node to the manifest, and note that ref lookup collections
-                # will need to be rebuilt. This adds the node unique_id to the "snapshots"
-                # list in the SchemaSourceFile.
+                # Add our new node to the manifest, which also adds it to the ref
+                # lookup. This adds the node unique_id to the "snapshots" list in
+                # the SchemaSourceFile.
                 self.manifest.add_node(block.file, snapshot_node)
-                rebuild_refs = True
-
-        if rebuild_refs:
-            self.manifest.rebuild_ref_lookup()
 
 
 Parsed = TypeVar(
@@ -448,6 +454,11 @@ class YamlReader(metaclass=ABCMeta):
                     schema_file.add_env_var(var, self.key, entry["name"])
                 self.schema_yaml_vars.env_vars = {}
 
+            if self.schema_yaml_vars.vars:
+                for var in self.schema_yaml_vars.vars.keys():
+                    schema_file.add_var(var, self.key, entry["name"])
+                self.schema_yaml_vars.vars = {}
+
             yield entry
 
     def render_entry(self, dct):
@@ -863,8 +874,10 @@ class NodePatchParser(PatchParser[NodeTarget, ParsedNodePatch], Generic[NodeTarg
         # step on the model name or anything
         # Note: config should already be updated
         node.patch_path = patch.file_id
-        # update created_at so process_docs will run in partial parsing
+        # update created_at and mark the node dirty so process_docs will run in
+        # partial parsing
         node.created_at = time.time()
+        self.manifest.mark_dirty(node.unique_id)
         node.description = patch.description
         node.columns = patch.columns
         node.name = patch.name
@@ -958,11 +971,13 @@ class ModelPatchParser(NodePatchParser[UnparsedModelUpdate]):
                         # otherwise we would have raised the error above
                         found_node = found_nodes[0]
                         self.manifest.disabled.pop(found_node.unique_id)
+                        self.manifest.disabled_lookup.remove_node(found_node)
                         assert isinstance(found_node, ModelNode)
                         versioned_model_node = found_node
                         add_node_nofile_fn = self.manifest.add_disabled_nofile
                 else:
                     found_node = self.manifest.nodes.pop(versioned_model_unique_id)
+                    self.manifest.ref_lookup.remove_node(versioned_model_unique_id)
                     assert isinstance(found_node, ModelNode)
                     versioned_model_node = found_node
                     add_node_nofile_fn = self.manifest.add_node_nofile
@@ -1034,8 +1049,15 @@ class ModelPatchParser(NodePatchParser[UnparsedModelUpdate]):
                 source_file.append_patch(
                     versioned_model_patch.yaml_key, versioned_model_node.unique_id
                 )
-            self.manifest.rebuild_ref_lookup()
-            self.manifest.rebuild_disabled_lookup()
+
+                # The node was added to the lookups before it was patched with its
+                # version, so add it again under its versioned names
+                if versioned_model_unique_id is None:
+                    self.manifest.disabled_lookup.remove_node(versioned_model_node)
+                    self.manifest.disabled_lookup.add_node(versioned_model_node)
+                else:
+                    self.manifest.ref_lookup.remove_node(versioned_model_node.unique_id)
+                    self.manifest.ref_lookup.add_node(versioned_model_node)
 
     def _target_type(self) -> Type[UnparsedModelUpdate]:
         return UnparsedModelUpdate
@@ -1225,6 +1247,7 @@ class SingularTestPatchParser(PatchParser[UnparsedSingularTestUpdate, ParsedSing
         node.patch_path = patch.file_id
         node.description = patch.description
         node.created_at = time.time()
+        self.manifest.mark_dirty(node.unique_id)
 
 
 class MacroPatchParser(PatchParser[UnparsedMacroUpdate, ParsedMacroPatch]):
@@ -1263,6 +1286,7 @@ class MacroPatchParser(PatchParser[UnparsedMacroUpdate, ParsedMacroPatch]):
         macro.patch_path = patch.file_id
         macro.description = patch.description
         macro.created_at = time.time()
+        self.manifest.mark_dirty(macro.unique_id)
         macro.meta = patch.meta
         macro.docs = patch.docs
         macro.arguments = patch.arguments
@@ -613,3 +613,4 @@ def process_models_for_unit_test(
             schema_file.unit_tests.append(versioned_unit_test_unique_id)
             # fqn?
             manifest.unit_tests[versioned_unit_test_unique_id] = new_unit_test_def
+            manifest.mark_dirty(versioned_unit_test_unique_id)
@@ -0,0 +1,221 @@
+import os
+import time
+from typing import Dict, List, Optional
+
+from dbt.config import RuntimeConfig
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.types import MainEncounteredError
+from dbt.flags import get_flags
+from dbt.parser.manifest import ManifestLoader, write_manifest_and_plugin_artifacts
+from dbt.parser.read_files import (
+    FileDiff,
+    InputFile,
+    generate_dbt_ignore_spec,
+    get_file_types_for_project,
+    search_source_files,
+)
+from dbt_common.clients.system import load_file_contents
+from dbt_common.events.base_types import EventLevel
+from dbt_common.events.functions import fire_event
+from dbt_common.events.types import Note
+
+# How often the project files are checked for changes, in seconds
+POLL_INTERVAL = 0.1
+
+# How long the files have to stay unchanged before the changes are parsed.
+# Editors often write a file more than once when saving it, and switching
+# branches touches many files at once.
+DEBOUNCE_INTERVAL = 0.05
+
+# How many times a snapshot is retried when files are deleted while it's taken
+SNAPSHOT_ATTEMPTS = 5
+
+
+class ProjectFileWatcher:
+    """Polls the files of the root project and reports changes as a FileDiff.
+
+    Only the root project is watched, because a FileDiff can only refer to
+    files in the root project. Files are found the same way they are when
+    reading the project from the file system, including the .dbtignore file."""
+
+    def __init__(
+        self,
+        project: RuntimeConfig,
+        poll_interval: float = POLL_INTERVAL,
+        debounce_interval: float = DEBOUNCE_INTERVAL,
+    ) -> None:
+        self.project = project
+        self.poll_interval = poll_interval
+        self.debounce_interval = debounce_interval
+        self.file_types = get_file_types_for_project(project)
+        self.ignore_spec = generate_dbt_ignore_spec(project.project_root)
+        self.project_file_path = os.path.join(project.project_root, "dbt_project.yml")
+        self.project_file_mtime = self.get_project_file_mtime()
+        # original_file_path -> modification time
+        self.snapshot: Dict[str, float] = self.take_snapshot()
+
+    def get_project_file_mtime(self) -> float:
+        try:
+            return os.path.getmtime(self.project_file_path)
+        except OSError:
+            return 0.0
+
+    def take_snapshot(self) -> Dict[str, float]:
+        for _ in range(SNAPSHOT_ATTEMPTS - 1):
+            try:
+                return self._take_snapshot()
+            except FileNotFoundError:
+                # A file was deleted between listing a directory and reading
+                # its modification time. Look again.
+                time.sleep(self.debounce_interval)
+        return self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, float]:
+        snapshot: Dict[str, float] = {}
+        for parse_ft, file_type_info in self.file_types.items():
+            for extension in file_type_info["extensions"]:
+                for fp in search_source_files(
+                    self.project, file_type_info["paths"], extension, parse_ft, self.ignore_spec
+                ):
+                    snapshot[fp.original_file_path] = fp.modification_time
+        return snapshot
+
+    def check_project_file(self) -> None:
+        project_file_mtime = self.get_project_file_mtime()
+        if project_file_mtime != self.project_file_mtime:
+            self.project_file_mtime = project_file_mtime
+            fire_event(
+                Note(
+                    msg="dbt_project.yml has changed. Restart dbt parse --watch to pick up "
+                    "the new project configuration."
+                ),
+                level=EventLevel.WARN,
+            )
+
+    def wait_for_changes(self) -> FileDiff:
+        """Block until files have changed and stayed unchanged for the debounce
+        interval, then return the changes since the last call."""
+        while True:
+            time.sleep(self.poll_interval)
+            self.check_project_file()
+            current = self.take_snapshot()
+            if current != self.snapshot:
+                break
+
+        while True:
+            time.sleep(self.debounce_interval)
+            latest = self.take_snapshot()
+            if latest == current:
+                break
+            current = latest
+
+        file_diff = self.build_file_diff(self.snapshot, current)
+        self.snapshot = current
+        return file_diff
+
+    def build_file_diff(self, previous: Dict[str, float], current: Dict[str, float]) -> FileDiff:
+        deleted = [path for path in previous if path not in current]
+        added: List[InputFile] = []
+        changed: List[InputFile] = []
+        for path, modification_time in current.items():
+            if path in previous and previous[path] == modification_time:
+                continue
+            try:
+                # Contents are stripped when files are read from the file system,
+                # so do the same here to get the same checksums
+                contents = load_file_contents(
+                    os.path.join(self.project.project_root, path), strip=True
+                )
+            except OSError:
+                # The file was deleted again before it could be read. The next
+                # snapshot will report it as deleted.
+                continue
+            input_file = InputFile(
+                path=path, content=contents, modification_time=modification_time
+            )
+            if path in previous:
+                changed.append(input_file)
+            else:
+                added.append(input_file)
+        return FileDiff(deleted=deleted, changed=changed, added=added)
+
+
+def file_diff_is_empty(file_diff: FileDiff) -> bool:
+    return not (file_diff.deleted or file_diff.changed or file_diff.added)
+
+
+class ManifestWatcher:
+    """Keeps the manifest in memory and partially parses the project again
+    each time its files change, without reading the saved manifest back in.
+
+    The partial parse file and manifest.json are only written when a file's
+    contents have actually changed. If a parse fails part way through, the
+    manifest in memory can't be trusted, so the next change is parsed from the
+    partial parse file on disk instead."""
+
+    def __init__(
+        self,
+        config: RuntimeConfig,
+        manifest: Manifest,
+        write_json: bool = True,
+        poll_interval: float = POLL_INTERVAL,
+        debounce_interval: float = DEBOUNCE_INTERVAL,
+    ) -> None:
+        self.config = config
+        self.manifest: Optional[Manifest] = manifest
+        self.write_json = write_json
+        self.file_watcher = ProjectFileWatcher(config, poll_interval, debounce_interval)
+
+    def run(self) -> Optional[Manifest]:
+        fire_event(Note(msg="Watching for changes to project files. Press Ctrl-C to stop."))
+        try:
+            while True:
+                self.parse(self.file_watcher.wait_for_changes())
+        except KeyboardInterrupt:
+            pass
+        return self.manifest
+
+    def remove_unchanged_files(self, file_diff: FileDiff) -> FileDiff:
+        """Files that were saved without changing their contents don't need
+        to be parsed again"""
+        assert self.manifest is not None
+        changed = []
+        for input_file in file_diff.changed:
+            file_id = f"{self.config.project_name}://{input_file.path}"
+            source_file = self.manifest.files.get(file_id)
+            if source_file is None or source_file.checksum != FileHash.from_contents(
+                input_file.content
+            ):
+                changed.append(input_file)
+        return FileDiff(deleted=file_diff.deleted, changed=changed, added=file_diff.added)
+
+    def parse(self, file_diff: FileDiff) -> bool:
+        """Parse the changes in file_diff. Returns True if the manifest changed."""
+        partial_parse = self.manifest is not None and get_flags().PARTIAL_PARSE
+        if self.manifest is not None:
+            file_diff = self.remove_unchanged_files(file_diff)
+            if file_diff_is_empty(file_diff):
+                fire_event(Note(msg="No file contents changed"), level=EventLevel.DEBUG)
+                return False
+
+        start = time.perf_counter()
+        try:
+            if partial_parse:
+                manifest = ManifestLoader.get_full_manifest(
+                    self.config, file_diff=file_diff, saved_manifest=self.manifest
+                )
+            else:
+                manifest = ManifestLoader.get_full_manifest(self.config)
+        except Exception as exc:
+            self.manifest = None
+            fire_event(MainEncounteredError(exc=str(exc)))
+            return False
+
+        self.manifest = manifest
+        if self.write_json:
+            write_manifest_and_plugin_artifacts(manifest, self.config)
+        elapsed = time.perf_counter() - start
+        file_count = len(file_diff.deleted) + len(file_diff.changed) + len(file_diff.added)
+        fire_event(Note(msg=f"Parsed {file_count} changed file(s) in {elapsed * 1000:.0f}ms"))
+        return True
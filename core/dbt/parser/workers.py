@@ -0,0 +1,327 @@
+import importlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import dbt.deprecations
+from dbt.adapters.factory import load_plugin, register_adapter
+from dbt.config import RuntimeConfig
+from dbt.contracts.files import AnySourceFile
+from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.nodes import GraphMemberNode, Macro, ManifestNode
+from dbt.flags import get_flags, set_flags
+from dbt.mp_context import get_mp_context
+from dbt.parser.analysis import AnalysisParser
+from dbt.parser.base import Parser
+from dbt.parser.models import ModelParser
+from dbt.parser.read_files import load_deferred_contents
+from dbt.parser.search import FileBlock
+from dbt.parser.singular_test import SingularTestParser
+from dbt.parser.snapshots import SnapshotParser
+from dbt_common.context import get_invocation_context, set_invocation_context
+from dbt_common.events.base_types import BaseEvent, EventLevel
+from dbt_common.events.event_manager_client import ctx_set_event_manager
+from dbt_common.events.functions import fire_event
+
+# Parsers whose files can be parsed independently of each other: each file only
+# adds nodes to the manifest, and only needs the macros to do so.
+PROCESS_POOL_PARSERS: Dict[str, Type[Parser]] = {
+    ModelParser.__name__: ModelParser,
+    SnapshotParser.__name__: SnapshotParser,
+    AnalysisParser.__name__: AnalysisParser,
+    SingularTestParser.__name__: SingularTestParser,
+}
+
+# Below this many files per worker, the cost of starting the workers and shipping
+# results back outweighs the parallel parse.
+MIN_FILES_PER_WORKER = 8
+
+# Files are handed to the workers in this many chunks per worker, so that a chunk
+# of expensive files doesn't leave the other workers idle.
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class RecordedEvent:
+    """An event fired while parsing in a worker process. Events are not picklable,
+    so the serialized proto message is shipped instead and the event is rebuilt
+    in the parent process."""
+
+    module: str
+    name: str
+    msg: bytes
+    level: Optional[EventLevel]
+    node: Any
+    force_warn_or_error_handling: bool
+
+    @classmethod
+    def from_event(
+        cls,
+        e: BaseEvent,
+        level: Optional[EventLevel],
+        node: Any,
+        force_warn_or_error_handling: bool,
+    ) -> "RecordedEvent":
+        return cls(
+            module=type(e).__module__,
+            name=type(e).__name__,
+            msg=e.pb_msg.SerializeToString(),
+            level=level,
+            node=node,
+            force_warn_or_error_handling=force_warn_or_error_handling,
+        )
+
+    def to_event(self) -> BaseEvent:
+        event_cls = getattr(importlib.import_module(self.module), self.name)
+        event = event_cls.__new__(event_cls)
+        pb_msg = getattr(event_cls.PROTO_TYPES_MODULE, self.name)()
+        pb_msg.ParseFromString(self.msg)
+        event.pb_msg = pb_msg
+        return event
+
+
+class RecordingEventManager:
+    """Event manager installed in the worker processes. Nothing is logged or raised
+    in the workers; the parent replays the events in order, so that logging,
+    --warn-error and deprecation handling behave exactly as in a serial parse."""
+
+    def __init__(self) -> None:
+        self.callbacks: List = []
+        self.loggers: List = []
+        self.warn_error = False
+        self.warn_error_options = None
+        self.require_warn_or_error_handling = False
+        self.recorded: List[RecordedEvent] = []
+
+    def fire_event(
+        self,
+        e: BaseEvent,
+        level: Optional[EventLevel] = None,
+        node: Any = None,
+        force_warn_or_error_handling: bool = False,
+    ) -> None:
+        self.recorded.append(
+            RecordedEvent.from_event(e, level, node, force_warn_or_error_handling)
+        )
+
+    def add_logger(self, config) -> None:
+        pass
+
+    def add_callback(self, callback) -> None:
+        pass
+
+
+@dataclass
+class ParseWorkerState:
+    """Everything a worker needs to parse files the same way the parent would."""
+
+    flags: Any
+    env: Dict[str, str]
+    root_project_name: str
+    all_projects: Dict[str, RuntimeConfig]
+    macros: MutableMapping[str, Macro]
+    metadata: ManifestMetadata
+
+
+@dataclass
+class ParseWorkerResult:
+    files: List[AnySourceFile] = field(default_factory=list)
+    nodes: List[ManifestNode] = field(default_factory=list)
+    disabled: List[GraphMemberNode] = field(default_factory=list)
+    env_vars: MutableMapping[str, str] = field(default_factory=dict)
+    unattributed_vars: List[str] = field(default_factory=list)
+    static_analysis_path_count: int = 0
+    static_analysis_parsed_path_count: int = 0
+    static_analysis_fallback_reasons: Dict[str, str] = field(default_factory=dict)
+    events: List[RecordedEvent] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def merge_into(self, manifest: Manifest) -> None:
+        """Add the results of parsing a chunk of files to the parent manifest, and
+        replay the events fired while parsing them."""
+        for source_file in self.files:
+            manifest.files[source_file.file_id] = source_file
+        for node in self.nodes:
+            manifest.add_node_nofile(node)
+        for disabled in self.disabled:
+            manifest.add_disabled_nofile(disabled)
+        manifest.env_vars.update(self.env_vars)
+        for var_name in self.unattributed_vars:
+            manifest.state_check.add_unattributed_var(var_name)
+        manifest._parsing_info.static_analysis_path_count += self.static_analysis_path_count
+        manifest._parsing_info.static_analysis_parsed_path_count += (
+            self.static_analysis_parsed_path_count
+        )
+        manifest._parsing_info.static_analysis_fallback_reasons.update(
+            self.static_analysis_fallback_reasons
+        )
+        for recorded_event in self.events:
+            replay_event(recorded_event)
+
+
+_DEPRECATIONS_BY_EVENT: Dict[str, str] = {
+    deprecation._event: name
+    for name, deprecation in dbt.deprecations.deprecations.items()
+    if deprecation._event is not None
+}
+
+
+def replay_event(recorded_event: RecordedEvent) -> None:
+    event = recorded_event.to_event()
+    deprecation_name = _DEPRECATIONS_BY_EVENT.get(recorded_event.name)
+    if deprecation_name is not None:
+        # Let the parent decide whether this deprecation was already shown
+        dbt.deprecations.deprecations[deprecation_name].show(**event.to_dict())
+        return
+    fire_event(
+        event,
+        level=recorded_event.level,
+        node=recorded_event.node,
+        force_warn_or_error_handling=recorded_event.force_warn_or_error_handling,
+    )
+
+
+_worker_state: Optional[ParseWorkerState] = None
+_worker_event_manager: Optional[RecordingEventManager] = None
+
+
+def _initialize_worker(state_path: str) -> None:
+    global _worker_state, _worker_event_manager
+    with open(state_path, "rb") as fp:
+        state: ParseWorkerState = pickle.load(fp)
+    _worker_state = state
+    _worker_event_manager = RecordingEventManager()
+    ctx_set_event_manager(_worker_event_manager)  # type: ignore[arg-type]
+    set_flags(state.flags)
+    set_invocation_context(state.env)
+    root_project = state.all_projects[state.root_project_name]
+    load_plugin(root_project.credentials.type)
+    register_adapter(root_project, get_mp_context())
+
+
+def _parse_files_in_worker(
+    project_name: str, parser_name: str, source_files: List[AnySourceFile]
+) -> ParseWorkerResult:
+    assert _worker_state is not None and _worker_event_manager is not None
+    _worker_event_manager.recorded = []
+    manifest = Manifest(
+        macros=_worker_state.macros,
+        files={source_file.file_id: source_file for source_file in source_files},
+        metadata=_worker_state.metadata,
+    )
+    parser = PROCESS_POOL_PARSERS[parser_name](
+        _worker_state.all_projects[project_name],
+        manifest,
+        _worker_state.all_projects[_worker_state.root_project_name],
+    )
+    try:
+        for source_file in source_files:
+            load_deferred_contents(source_file)
+            parser.parse_file(FileBlock(file=source_file))
+    except Exception as exc:
+        # The parent reparses the chunk to raise the error with full context
+        return ParseWorkerResult(error=str(exc))
+
+    return ParseWorkerResult(
+        files=source_files,
+        nodes=list(manifest.nodes.values()),
+        disabled=[node for nodes in manifest.disabled.values() for node in nodes],
+        env_vars=manifest.env_vars,
+        unattributed_vars=manifest.state_check.unattributed_vars,
+        static_analysis_path_count=manifest._parsing_info.static_analysis_path_count,
+        static_analysis_parsed_path_count=(
+            manifest._parsing_info.static_analysis_parsed_path_count
+        ),
+        static_analysis_fallback_reasons=(manifest._parsing_info.static_analysis_fallback_reasons),
+        events=_worker_event_manager.recorded,
+    )
+
+
+class ParseProcessPool:
+    """Parses model, snapshot, analysis and singular test files in a pool of
+    spawned worker processes.
+
+    Each worker gets a copy of the projects and the parsed macros when it starts.
+    They're pickled to a temporary file once rather than handed to every spawned
+    process, which would block the parent until each worker has started.
+    Files are sent to the workers in contiguous chunks, and the results are
+    yielded in the order the files were given, so merging them produces the same
+    manifest as a serial parse."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        root_project: RuntimeConfig,
+        all_projects: Mapping[str, RuntimeConfig],
+        manifest: Manifest,
+    ) -> None:
+        self.max_workers = max_workers
+        state = ParseWorkerState(
+            flags=get_flags(),
+            env=dict(get_invocation_context().env),
+            root_project_name=root_project.project_name,
+            all_projects=dict(all_projects),
+            macros=manifest.macros,
+            metadata=manifest.metadata,
+        )
+        with tempfile.NamedTemporaryFile("wb", suffix=".pickle", delete=False) as fp:
+            pickle.dump(state, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            self._state_path = fp.name
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_mp_context(),
+            initializer=_initialize_worker,
+            initargs=(self._state_path,),
+        )
+
+    def should_parse(self, parser_name: str, file_count: int) -> bool:
+        return parser_name in PROCESS_POOL_PARSERS and file_count >= MIN_FILES_PER_WORKER * 2
+
+    def parse_files(
+        self, project_name: str, parser_name: str, source_files: List[AnySourceFile]
+    ) -> Iterator[Tuple[List[AnySourceFile], Optional[ParseWorkerResult]]]:
+        """Yields each chunk of files with its result. The result is None if the
+        worker could not return one, e.g. because it died."""
+        chunk_count = min(
+            self.max_workers * CHUNKS_PER_WORKER,
+            max(1, len(source_files) // MIN_FILES_PER_WORKER),
+        )
+        chunk_size = -(-len(source_files) // chunk_count)
+        chunks = [
+            source_files[start : start + chunk_size]
+            for start in range(0, len(source_files), chunk_size)
+        ]
+        futures: List[Optional[Future]] = []
+        for chunk in chunks:
+            try:
+                futures.append(
+                    self._executor.submit(_parse_files_in_worker, project_name, parser_name, chunk)
+                )
+            except RuntimeError:
+                # The pool is broken or shut down
+                futures.append(None)
+        for chunk, future in zip(chunks, futures):
+            result: Optional[ParseWorkerResult] = None
+            if future is not None:
+                try:
+                    result = future.result()
+                except Exception:
+                    result = None
+            yield chunk, result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        os.remove(self._state_path)
@@ -54,9 +54,10 @@ from dbt.task.base import BaseRunner, ConfiguredTask
 from dbt.task.printer import print_run_end_messages, print_run_result_error
 from dbt_common.context import _INVOCATION_CONTEXT_VAR, get_invocation_context
 from dbt_common.dataclass_schema import StrEnum
+from dbt_common.events.base_types import EventLevel
 from dbt_common.events.contextvars import log_contextvars, task_contextvars
 from dbt_common.events.functions import fire_event, warn_or_error
-from dbt_common.events.types import Formatting
+from dbt_common.events.types import Formatting, Note
 from dbt_common.exceptions import NotImplementedError
 
 RESULT_FILE_NAME = "run_results.json"
@@ -91,6 +92,7 @@ class GraphRunnableTask(ConfiguredTask):
         self.previous_defer_state: Optional[PreviousState] = None
         self.run_count: int = 0
         self.started_at: float = 0
+        self.predicted_makespan: Optional[float] = None
 
         if self.args.state:
             self.previous_state = PreviousState(
@@ -172,6 +174,8 @@ class GraphRunnableTask(ConfiguredTask):
             raise DbtInternalError("_runtime_initialize never loaded the graph!")
 
         self.job_queue = self.get_graph_queue()
+        if get_flags().CRITICAL_PATH_SCHEDULING:
+            self.prioritize_by_previous_durations(self.job_queue)
 
         # we use this a couple of times. order does not matter.
         self._flattened_nodes = []
@@ -193,6 +197,28 @@ class GraphRunnableTask(ConfiguredTask):
 
         self.num_nodes = len([n for n in self._flattened_nodes if not n.is_ephemeral_model])
 
+    def prioritize_by_previous_durations(self, job_queue: GraphQueue) -> None:
+        """Run the nodes on the longest remaining path first, using the
+        execution times of the previous run in the --state directory."""
+        results = self.previous_state.results if self.previous_state else None
+        if results is None:
+            fire_event(
+                Note(
+                    msg="Critical path scheduling needs a run_results.json in the --state "
+                    "directory, nodes will be run in the order of their depth in the graph"
+                ),
+                level=EventLevel.WARN,
+            )
+            return
+        # skipped nodes report no time, so they have no useful history
+        durations = {
+            result.unique_id: result.execution_time
+            for result in results.results
+            if result.status != NodeStatus.Skipped
+        }
+        job_queue.prioritize_by_duration(durations)
+        self.predicted_makespan = job_queue.predicted_makespan(self.config.threads)
+
     def raise_on_first_error(self) -> bool:
         return False
 
@@ -409,6 +435,7 @@ class GraphRunnableTask(ConfiguredTask):
         num_threads = self.config.threads
 
         pool = ThreadPool(num_threads, self._pool_thread_initializer, [get_invocation_context()])
+        started_at = time.time()
         try:
             self.run_queue(pool)
         except FailFastError as failure:
@@ -450,6 +477,14 @@ class GraphRunnableTask(ConfiguredTask):
         pool.close()
         pool.join()
 
+        if self.predicted_makespan is not None:
+            fire_event(
+                Note(
+                    msg=f"Critical path scheduling predicted the nodes would take "
+                    f"{self.predicted_makespan:0.2f}s, and they took {time.time() - started_at:0.2f}s"
+                )
+            )
+
         return self.node_results
 
     @staticmethod
@@ -16,6 +16,10 @@ from dbt.adapters.factory import Adapter
 from dbt.cli.main import dbtRunner
 from dbt.contracts.graph.manifest import Manifest
 from dbt.materializations.incremental.microbatch import MicrobatchBuilder
+from dbt.parser.partial_parse_file import (
+    PARTIAL_PARSE_FILE_MAGIC,
+    read_partial_parse_file,
+)
 from dbt_common.context import _INVOCATION_CONTEXT_VAR, InvocationContext
 from dbt_common.events.base_types import EventLevel, EventMsg
 from dbt_common.events.functions import (
@@ -150,13 +154,16 @@ def get_logging_events(log_output, event_name):
 # parts of it will not be supported for external use.
 def get_manifest(project_root) -> Optional[Manifest]:
     path = os.path.join(project_root, "target", "partial_parse.msgpack")
-    if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)  # type: ignore[attr-defined]
-        return manifest
-    else:
+    if not os.path.exists(path):
         return None
+    with open(path, "rb") as fp:
+        magic = fp.read(len(PARTIAL_PARSE_FILE_MAGIC))
+        if magic != PARTIAL_PARSE_FILE_MAGIC:
+            # Written by a version of dbt that saved the whole manifest as msgpack
+            fp.seek(0)
+            manifest: Manifest = Manifest.from_msgpack(fp.read())  # type: ignore[attr-defined]
+            return manifest
+    return read_partial_parse_file(path)
 
 
 # Used in test cases to get the run_results.json file.
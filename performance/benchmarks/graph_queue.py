@@ -0,0 +1,77 @@
+"""Measures the scheduling overhead of GraphQueue: the time to build the queue
+from a generated DAG and to hand out and mark done every node on a single
+thread, which is the time dbt spends between node completions.
+
+    python performance/benchmarks/graph_queue.py --sizes 1000,10000,100000
+"""
+
+import argparse
+import random
+import time
+
+import networkx as nx  # type: ignore
+
+from dbt.graph.queue import GraphQueue
+
+
+class _Node:
+    def __init__(self, unique_id: str) -> None:
+        self.unique_id = unique_id
+
+
+class _Manifest:
+    # GraphQueue.get only needs to look up the node
+    def expect(self, unique_id: str) -> _Node:
+        return _Node(unique_id)
+
+
+def make_graph(size: int, parents: int, seed: int) -> nx.DiGraph:
+    """A DAG of models that each have up to 'parents' parents among the
+    nodes before them, mostly nearby ones, and a test on every other model
+    that also depends on its parents, like the test edges of 'dbt build'."""
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    models = [f"model.pkg.model_{i}" for i in range(size // 2)]
+    graph.add_nodes_from(models)
+    for i, model in enumerate(models[1:], start=1):
+        for _ in range(rng.randint(0, parents)):
+            graph.add_edge(models[max(0, i - 1 - int(rng.expovariate(0.05)))], model)
+    for i, model in enumerate(models[: size - len(models)]):
+        test = f"test.pkg.test_{i}"
+        graph.add_edge(model, test)
+        for parent in list(graph.predecessors(model))[:1]:
+            graph.add_edge(parent, test)
+    return graph
+
+
+def measure(size: int, parents: int, seed: int) -> None:
+    graph = make_graph(size, parents, seed)
+    nodes, edges = len(graph), graph.number_of_edges()
+    start = time.perf_counter()
+    queue = GraphQueue(graph, _Manifest(), set(graph.nodes))  # type: ignore[arg-type]
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while not queue.empty():
+        node = queue.get(block=False)
+        queue.mark_done(node.unique_id)
+    drained = time.perf_counter() - start
+
+    print(
+        f"{nodes:>7} nodes, {edges:>7} edges: built in {built:6.2f}s, "
+        f"drained in {drained:6.2f}s ({drained / nodes * 1e6:5.1f}us per node)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--parents", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        measure(int(size), args.parents, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measures the memory and time taken by Manifest.deepcopy, as used for
+deferral and state comparison, on manifests of generated models: the memory
+retained by the copy and the peak while it is made, then after the copy
+changes a share of its nodes. Each copy is compared with copying every
+member up front, as deepcopy used to.
+
+    python performance/benchmarks/manifest_deepcopy.py --sizes 1000,10000,50000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+from dbt.artifacts.resources import Contract
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import Manifest, _deepcopy
+from dbt.contracts.graph.nodes import ColumnInfo, DependsOn, ModelConfig, ModelNode
+from dbt.node_types import NodeType
+
+PACKAGES = 5
+
+
+def make_manifest(size: int, columns: int) -> Manifest:
+    nodes = {}
+    for i in range(size):
+        package = f"package_{i % PACKAGES}"
+        name = f"model_{i}"
+        unique_id = f"model.{package}.{name}"
+        parents = [f"model.package_{j % PACKAGES}.model_{j}" for j in range(max(0, i - 3), i)]
+        nodes[unique_id] = ModelNode(
+            package_name=package,
+            path=f"staging/{name}.sql",
+            original_file_path=f"models/staging/{name}.sql",
+            language="sql",
+            raw_code="select 1",
+            name=name,
+            resource_type=NodeType.Model,
+            unique_id=unique_id,
+            fqn=[package, "staging", name],
+            depends_on=DependsOn(nodes=parents),
+            database="analytics",
+            schema="dbt_staging",
+            alias=name,
+            config=ModelConfig(materialized="table"),
+            contract=Contract(),
+            checksum=FileHash.from_contents(name),
+            columns={
+                f"column_{c}": ColumnInfo(name=f"column_{c}", data_type="varchar")
+                for c in range(columns)
+            },
+        )
+    return Manifest(nodes=nodes)
+
+
+def copy_every_member(manifest: Manifest) -> Manifest:
+    """Manifest.deepcopy as it was before members were shared"""
+    copy = Manifest(
+        nodes={k: _deepcopy(v) for k, v in manifest.nodes.items()},
+        metadata=manifest.metadata,
+        state_check=_deepcopy(manifest.state_check),
+    )
+    copy.build_flat_graph()
+    return copy
+
+
+def measure_copy(
+    label: str, manifest: Manifest, deepcopy: Callable[[Manifest], Manifest], changed: int
+) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    copy = deepcopy(manifest)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+
+    # like deferral, which changes the nodes it defers
+    for node in list(copy.nodes.values())[:changed]:
+        node.relation_name = f'"analytics"."dbt_prod"."{node.name}"'
+    gc.collect()
+    after_changes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"  {label:<7} {elapsed:6.2f}s, {retained / 2**20:7.1f} MiB retained, "
+        f"{peak / 2**20:7.1f} MiB peak, {after_changes / 2**20:7.1f} MiB after "
+        f"changing {changed} nodes"
+    )
+
+
+def measure(size: int, columns: int, changed: int) -> None:
+    print(f"{size} nodes x {columns} columns:")
+    measure_copy("before", make_manifest(size, columns), copy_every_member, changed)
+    measure_copy("after", make_manifest(size, columns), Manifest.deepcopy, changed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--changed", type=int, default=100)
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        measure(int(size), args.columns, args.changed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measures the memory used by a manifest of generated models after it's read
+back from its msgpack form, as it is from partial_parse.msgpack, and how much
+of it Manifest.compact (--compact-manifest) saves.
+
+    python performance/benchmarks/manifest_memory.py --sizes 1000,10000,50000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from dbt.artifacts.resources import Contract
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import ColumnInfo, DependsOn, ModelConfig, ModelNode
+from dbt.node_types import NodeType
+
+PACKAGES = 5
+DATA_TYPES = ["varchar", "integer", "bigint", "timestamp", "boolean", "numeric(38, 2)"]
+TAGS = ["nightly", "finance", "marketing", "pii"]
+
+
+def make_manifest(size: int, columns: int) -> Manifest:
+    nodes = {}
+    for i in range(size):
+        package = f"package_{i % PACKAGES}"
+        name = f"model_{i}"
+        unique_id = f"model.{package}.{name}"
+        parents = [f"model.package_{j % PACKAGES}.model_{j}" for j in range(max(0, i - 3), i)]
+        nodes[unique_id] = ModelNode(
+            package_name=package,
+            path=f"staging/{name}.sql",
+            original_file_path=f"models/staging/{name}.sql",
+            language="sql",
+            raw_code="select 1",
+            name=name,
+            resource_type=NodeType.Model,
+            unique_id=unique_id,
+            fqn=[package, "staging", name],
+            depends_on=DependsOn(nodes=parents),
+            database="analytics",
+            schema="dbt_staging",
+            alias=name,
+            tags=[TAGS[i % len(TAGS)]],
+            config=ModelConfig(materialized="table", tags=[TAGS[i % len(TAGS)]]),
+            contract=Contract(),
+            checksum=FileHash.from_contents(name),
+            columns={
+                f"column_{c}": ColumnInfo(
+                    name=f"column_{c}",
+                    description="The primary key" if c == 0 else "",
+                    data_type=DATA_TYPES[c % len(DATA_TYPES)],
+                    tags=[TAGS[c % len(TAGS)]],
+                )
+                for c in range(columns)
+            },
+        )
+    return Manifest(nodes=nodes)
+
+
+def measure(size: int, columns: int) -> None:
+    packed = make_manifest(size, columns).to_msgpack()
+    gc.collect()
+
+    tracemalloc.start()
+    manifest = Manifest.from_msgpack(packed)
+    gc.collect()
+    loaded, _ = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    manifest.compact()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    compacted, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    saved = loaded - compacted
+    print(
+        f"{size:>7} nodes x {columns} columns: {loaded / 2**20:8.1f} MiB loaded, "
+        f"{compacted / 2**20:8.1f} MiB compacted, {saved / 2**20:7.1f} MiB saved "
+        f"({saved / loaded:.0%}) in {elapsed:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--columns", type=int, default=25)
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        measure(int(size), args.columns)
+
+
+if __name__ == "__main__":
+    main()
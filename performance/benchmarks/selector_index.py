@@ -0,0 +1,88 @@
+"""Measures the selector methods that 'dbt ls -s' and 'dbt run -s' evaluate
+against every node of the manifest (fqn, tag, path, package and config), on
+generated manifests, evaluating a batch of selectors of each method.
+
+    python performance/benchmarks/selector_index.py --sizes 1000,10000,50000
+"""
+
+import argparse
+import random
+import time
+
+from dbt.artifacts.resources import DependsOn, FileHash, NodeConfig
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import ModelNode
+from dbt.graph.selector_methods import MethodManager
+from dbt.node_types import NodeType
+
+
+def make_manifest(size: int, seed: int) -> Manifest:
+    """A manifest of models spread over nested directories of two packages,
+    each with a couple of tags and a materialization."""
+    rng = random.Random(seed)
+    manifest = Manifest()
+    for i in range(size):
+        package = "pkg" if i % 5 else "other_pkg"
+        dirs = [f"area_{i % 20}", f"domain_{i % 7}"]
+        name = f"model_{i}"
+        manifest.nodes[f"model.{package}.{name}"] = ModelNode(
+            language="sql",
+            raw_code="select 1",
+            database="dbt",
+            schema="dbt_schema",
+            alias=name,
+            name=name,
+            fqn=[package, *dirs, name],
+            unique_id=f"model.{package}.{name}",
+            package_name=package,
+            path=f"{'/'.join(dirs)}/{name}.sql",
+            original_file_path=f"models/{'/'.join(dirs)}/{name}.sql",
+            config=NodeConfig(materialized=rng.choice(["view", "table", "incremental"])),
+            tags=[f"tag_{rng.randrange(50)}", f"team_{i % 10}"],
+            depends_on=DependsOn(),
+            resource_type=NodeType.Model,
+            checksum=FileHash.from_contents(""),
+        )
+    return manifest
+
+
+SELECTORS = [
+    ("fqn", [], ["model_{i}", "pkg.area_{j}", "area_{j}.domain_1.model_{i}"]),
+    ("tag", [], ["tag_{j}", "team_*"]),
+    ("path", [], ["models/area_{j}", "models/area_{j}/domain_1/model_{i}.sql"]),
+    ("package", [], ["pkg", "other_pkg"]),
+    ("config", ["materialized"], ["table", "incremental"]),
+]
+
+
+def measure(size: int, selectors: int, seed: int) -> None:
+    manifest = make_manifest(size, seed)
+    methods = MethodManager(manifest, None)
+    included = set(manifest.nodes)
+    rng = random.Random(seed)
+
+    timings = []
+    for method_name, arguments, patterns in SELECTORS:
+        method = methods.get_method(method_name, arguments)  # type: ignore[arg-type]
+        start = time.perf_counter()
+        for n in range(selectors):
+            pattern = patterns[n % len(patterns)]
+            value = pattern.format(i=rng.randrange(size), j=rng.randrange(20))
+            set(method.search(included, value))
+        timings.append(f"{method_name} {time.perf_counter() - start:6.3f}s")
+
+    print(f"{size:>6} nodes, {selectors} selectors per method: " + ", ".join(timings))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--selectors", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        measure(int(size), args.selectors, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measures Graph.get_subset_graph, which builds the graph of the selected
+nodes that 'dbt run -s' and 'dbt retry' schedule, on generated DAGs with hub
+nodes that a large share of the models depend on, like a date spine or a
+widely used staging model, selecting a small and a large share of the nodes.
+
+    python performance/benchmarks/subset_graph.py --sizes 1000,10000,20000
+"""
+
+import argparse
+import random
+import time
+
+import networkx as nx  # type: ignore
+
+from dbt.graph.graph import Graph
+
+
+def make_graph(size: int, parents: int, hubs: int, seed: int) -> nx.DiGraph:
+    """A DAG of models that each have up to 'parents' parents among the
+    nodes before them, mostly nearby ones, where a third of the models also
+    depend on one of 'hubs' hub models, each of which has hub parents too."""
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    hub_models = [f"model.pkg.hub_{i}" for i in range(hubs)]
+    for i, hub in enumerate(hub_models):
+        graph.add_node(hub)
+        for parent in hub_models[:i]:
+            graph.add_edge(parent, hub)
+    models = [f"model.pkg.model_{i}" for i in range(size - hubs)]
+    graph.add_nodes_from(models)
+    for i, model in enumerate(models):
+        for _ in range(rng.randint(0, parents) if i else 0):
+            graph.add_edge(models[max(0, i - 1 - int(rng.expovariate(0.05)))], model)
+        if rng.random() < 1 / 3:
+            graph.add_edge(rng.choice(hub_models), model)
+    return graph
+
+
+def measure(size: int, parents: int, hubs: int, share: float, seed: int) -> None:
+    graph = Graph(make_graph(size, parents, hubs, seed))
+    nodes = sorted(graph.nodes())
+    selected = random.Random(seed).sample(nodes, max(1, int(len(nodes) * share)))
+
+    start = time.perf_counter()
+    subset = graph.get_subset_graph(selected)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(nodes):>6} nodes, {graph.graph.number_of_edges():>6} edges, "
+        f"{len(selected):>5} selected: {elapsed:7.3f}s "
+        f"({subset.graph.number_of_edges()} edges in the subset)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,20000")
+    parser.add_argument("--shares", default="0.01,0.3")
+    parser.add_argument("--parents", type=int, default=3)
+    parser.add_argument("--hubs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        for share in args.shares.split(","):
+            measure(int(size), args.parents, args.hubs, float(share), args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Measures the graph lookups of 'dbt build' on generated DAGs: adding the
+edges from tests to the nodes that wait on them (Linker.add_test_edges_1),
+then finding the ancestors and descendants of each of a sample of nodes, as
+'+model' and 'model+' selectors do.
+
+    python performance/benchmarks/test_edges.py --sizes 1000,5000,20000
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import networkx as nx  # type: ignore
+
+from dbt.compilation import Linker
+from dbt.graph import Graph
+from dbt.node_types import NodeType
+
+
+def make_project(size: int, parents: int, seed: int):
+    """A DAG of models that each have up to 'parents' parents among the
+    models before them, mostly nearby ones, and a manifest stand-in with a
+    test on each model and a relationship test on every tenth model."""
+    rng = random.Random(seed)
+    models = [f"model.pkg.model_{i}" for i in range(size // 2)]
+    depends_on = {}
+    for i, model in enumerate(models):
+        depends_on[model] = list(
+            {
+                models[max(0, i - 1 - int(rng.expovariate(0.05)))]
+                for _ in range(rng.randint(0, parents))
+            }
+            if i
+            else ()
+        )
+    for i, model in enumerate(models):
+        depends_on[f"test.pkg.not_null_{i}"] = [model]
+        if i and i % 10 == 0:
+            depends_on[f"test.pkg.relationships_{i}"] = [model, rng.choice(models[:i])]
+
+    graph = nx.DiGraph()
+    nodes, child_map = {}, defaultdict(list)
+    for unique_id, parent_ids in depends_on.items():
+        is_test = unique_id.startswith("test.")
+        nodes[unique_id] = SimpleNamespace(
+            resource_type=NodeType.Test if is_test else NodeType.Model,
+            depends_on_nodes=parent_ids,
+        )
+        graph.add_node(unique_id)
+        for parent in parent_ids:
+            graph.add_edge(parent, unique_id)
+            child_map[parent].append(unique_id)
+    return graph, SimpleNamespace(nodes=nodes, child_map=child_map), models
+
+
+def measure(size: int, parents: int, samples: int, seed: int) -> None:
+    graph, manifest, models = make_project(size, parents, seed)
+    linker = Linker()
+    linker.graph = graph
+
+    start = time.perf_counter()
+    linker.add_test_edges_1(manifest)  # type: ignore[arg-type]
+    test_edges = time.perf_counter() - start
+
+    full_graph = Graph(linker.graph)
+    sample = random.Random(seed).sample(models, min(samples, len(models)))
+    start = time.perf_counter()
+    for model in sample:
+        full_graph.ancestors(model)
+        full_graph.descendants(model)
+    lookups = time.perf_counter() - start
+
+    print(
+        f"{len(graph):>6} nodes: test edges added in {test_edges:7.3f}s, "
+        f"{len(sample)} ancestors and descendants in {lookups:7.3f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    parser.add_argument("--parents", type=int, default=3)
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for size in args.sizes.split(","):
+        measure(int(size), args.parents, args.samples, args.seed)
+
+
+if __name__ == "__main__":
+    main()
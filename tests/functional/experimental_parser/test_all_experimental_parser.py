@@ -1,21 +1,15 @@
-import os
+from typing import Optional
 
 import pytest
 
 from dbt.artifacts.resources import RefArgs
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_parse_file import read_partial_parse_file
 from dbt.tests.util import run_dbt
 
 
-def get_manifest():
-    path = "./target/partial_parse.msgpack"
-    if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
-        return manifest
-    else:
-        return None
+def get_manifest() -> Optional[Manifest]:
+    return read_partial_parse_file("./target/partial_parse.msgpack")
 
 
 basic__schema_yml = """
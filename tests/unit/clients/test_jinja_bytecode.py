@@ -0,0 +1,82 @@
+import msgpack
+
+from dbt.clients.jinja_bytecode import JinjaBytecodeCache
+from dbt_common.clients.jinja import MacroFuzzEnvironment, get_environment
+
+
+def compile_template(cache: JinjaBytecodeCache, source: str, native: bool = False):
+    env = get_environment(native=native)
+    code = cache.compile(env, source, capture_macros=False, native=native)
+    return env.template_class.from_code(env, code, env.make_globals({}), None)
+
+
+class TestJinjaBytecodeCache:
+    def test_not_opened(self):
+        cache = JinjaBytecodeCache()
+        assert compile_template(cache, "{{ 1 + 1 }}").render({}) == "2"
+        assert (cache.hits, cache.misses) == (0, 0)
+        assert cache.entries == {}
+
+    def test_roundtrip(self, tmp_path, mocker):
+        path = str(tmp_path / "target" / "jinja_bytecode.msgpack")
+        cache = JinjaBytecodeCache()
+        cache.open(path)
+        compile_template(cache, "{{ x }} one")
+        compile_template(cache, "{{ x }} one", native=True)
+        assert (cache.hits, cache.misses) == (0, 2)
+        cache.save()
+
+        cache = JinjaBytecodeCache()
+        cache.open(path)
+        env_compile = mocker.spy(MacroFuzzEnvironment, "compile")
+        template = compile_template(cache, "{{ x }} one")
+
+        assert template.render({"x": "two"}) == "two one"
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert env_compile.call_count == 0
+        assert not cache.changed
+
+    def test_other_versions_are_ignored(self, tmp_path):
+        path = tmp_path / "jinja_bytecode.msgpack"
+        cache = JinjaBytecodeCache()
+        cache.open(str(path))
+        compile_template(cache, "{{ x }}")
+        cache.save()
+        data = msgpack.unpackb(path.read_bytes(), raw=False)
+        data["dbt"] = "0.0.0"
+        path.write_bytes(msgpack.packb(data))
+
+        cache = JinjaBytecodeCache()
+        cache.open(str(path))
+
+        assert cache.entries == {}
+        assert cache.size == 0
+
+    def test_least_recently_used_are_evicted(self, tmp_path):
+        cache = JinjaBytecodeCache()
+        cache.open(str(tmp_path / "jinja_bytecode.msgpack"))
+        for source in ("{{ a }}", "{{ b }}", "{{ c }}"):
+            compile_template(cache, source)
+        first, second, third = cache.entries
+        compile_template(cache, "{{ a }}")
+        cache.max_size = cache.size - 1
+
+        cache.save()
+
+        assert list(cache.entries) == [third, first]
+        assert cache.size == sum(len(code) for code in cache.entries.values())
+
+    def test_close(self, tmp_path):
+        path = tmp_path / "jinja_bytecode.msgpack"
+        cache = JinjaBytecodeCache()
+        cache.open(str(path))
+        compile_template(cache, "{{ x }}")
+
+        cache.close()
+        cache.save()
+
+        assert not path.exists()
+        assert cache.path is None
+        assert cache.entries == {}
+        assert compile_template(cache, "{{ 1 + 1 }}").render({}) == "2"
+        assert (cache.hits, cache.misses) == (0, 1)
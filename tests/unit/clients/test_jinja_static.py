@@ -1,9 +1,13 @@
+import re
+
 import pytest
 
 from dbt.artifacts.resources import RefArgs
 from dbt.clients.jinja_static import (
+    StaticAnalysisError,
     statically_extract_has_name_this,
     statically_extract_macro_calls,
+    statically_extract_model_calls,
     statically_parse_ref_or_source,
     statically_parse_unrendered_config,
 )
@@ -134,3 +138,52 @@ class TestStaticallyParseUnrenderedConfig:
 )
 def test_statically_extract_has_name_this(raw_code: str, expected_result: bool) -> None:
     assert statically_extract_has_name_this(raw_code) == expected_result
+
+
+class TestStaticallyExtractModelCalls:
+    def test_extracts_calls_like_rendering(self):
+        raw_code = """
+            {{ config(materialized='incremental', enabled=true, pre_hook=['select 1']) }}
+            {% set upstream = 'model_a' %}
+            select * from {{ ref(upstream) }} join {{ source('src', 'tbl') }} using (id)
+            where '{{ target.schema }}' = '{{ var('schema', 'raw') }}'
+            {% if is_incremental() %}
+            and id > (select max(id) from {{ this }}) and {{ ref('skipped') }}
+            {% elif not execute %}
+            union all select * from {{ ref('pkg', 'model_b', v=2) }}
+            {% endif %}
+        """
+        assert statically_extract_model_calls(raw_code) == {
+            "refs": [
+                {"name": "model_a", "package": None, "version": None},
+                {"name": "model_b", "package": "pkg", "version": 2},
+            ],
+            "sources": [["src", "tbl"]],
+            "configs": [
+                ("materialized", "incremental"),
+                ("enabled", True),
+                ("pre-hook", ["select 1"]),
+            ],
+            "vars": ["schema"],
+            "target_fields": ["schema"],
+            "macros": ["is_incremental"],
+        }
+
+    @pytest.mark.parametrize(
+        "raw_code,reason",
+        [
+            ("{{ my_macro() }}", "call to my_macro()"),
+            ("{{ adapter.get_relation('a') }}", "call to a method()"),
+            ("{% for i in range(3) %}{{ i }}{% endfor %}", "For statement"),
+            (
+                "{% if target.name == 'prod' %}{% endif %}",
+                "if statement that depends on the context",
+            ),
+            ("{{ ref(var('model')) }}", "call where a literal is required"),
+            ("{{ a or ref('b') }}", "call in a conditional expression"),
+            ("{{ ref('a', 'b', 'c') }}", "ref() with invalid arguments"),
+        ],
+    )
+    def test_unsupported_jinja(self, raw_code, reason):
+        with pytest.raises(StaticAnalysisError, match=re.escape(reason)):
+            statically_extract_model_calls(raw_code)
@@ -6,9 +6,10 @@ import pytest
 
 import dbt_common.exceptions
 from dbt.adapters import factory, postgres
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import MacroStack, get_rendered
 from dbt.config.project import VarProvider
 from dbt.context import base, docs, macros, providers, query_header
+from dbt.context.target import TargetDict
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.nodes import (
     DependsOn,
@@ -115,6 +116,16 @@ class TestVar:
         assert var("foo", "bar") == "bar"
         assert var("foo") is None
 
+    def test_parser_var_records_reads(self, model, config, context):
+        config.cli_vars = {"foo": "baz"}
+        read = []
+        var = providers.ParseVar(context, config, model, on_read=read.append)
+
+        var("foo")
+        var("bar", "default")
+        var.has_var("baz")
+        assert read == ["foo", "bar", "baz"]
+
 
 class TestParseWrapper:
     @pytest.fixture
@@ -430,6 +441,20 @@ def postgres_adapter(config_postgres, get_adapter):
     clear_plugin(postgres.Plugin)
 
 
+def test_target_dict_records_reads():
+    read = []
+    target = TargetDict({"name": "dev", "schema": "analytics", "user": "alice"}, read.append)
+
+    rendered = get_rendered(
+        "{{ target.schema }} {{ target.get('role', 'none') }}", {"target": target}
+    )
+
+    assert rendered == "analytics none"
+    assert read == ["schema", "role"]
+    assert dict(target) == {"name": "dev", "schema": "analytics", "user": "alice"}
+    assert set(read) == {"name", "schema", "user", "role"}
+
+
 def test_query_header_context(config_postgres, manifest_fx):
     ctx = query_header.generate_query_header_context(
         config=config_postgres,
@@ -448,6 +473,20 @@ def test_macro_runtime_context(config_postgres, manifest_fx, get_adapter, get_in
     assert_has_keys(REQUIRED_MACRO_KEYS, MAYBE_KEYS, ctx)
 
 
+def test_macros_override_context_members(config_postgres, get_adapter, get_include_paths):
+    manifest = mock_manifest(config_postgres, [mock_macro("env_var", "root")])
+    ctx = providers.generate_runtime_macro_context(
+        macro=manifest.macros["macro.root.macro_a"],
+        config=config_postgres,
+        manifest=manifest,
+        package_name="root",
+    )
+
+    assert ctx["env_var"].macro is manifest.macros["macro.root.env_var"]
+    assert ctx["builtins"]["env_var"] is not ctx["env_var"]
+    assert ctx["macro_a"].macro is manifest.macros["macro.root.macro_a"]
+
+
 def test_invocation_args_to_dict_in_macro_runtime_context(
     config_postgres, manifest_fx, get_adapter, get_include_paths
 ):
@@ -494,14 +533,14 @@ def test_docs_runtime_context(config_postgres):
 
 def test_macro_namespace_duplicates(config_postgres, manifest_fx):
     mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
-    mn.add_macros(manifest_fx.macros.values(), {})
+    mn.add_macros(manifest_fx.macros.values())
 
     # same pkg, same name: error
     with pytest.raises(dbt_common.exceptions.CompilationError):
-        mn.add_macro(mock_macro("macro_a", "root"), {})
+        mn.add_macro(mock_macro("macro_a", "root"))
 
     # different pkg, same name: no error
-    mn.add_macros(mock_macro("macro_a", "dbt"), {})
+    mn.add_macro(mock_macro("macro_a", "dbt"))
 
 
 def test_macro_namespace(config_postgres, manifest_fx):
@@ -538,6 +577,51 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result["some_macro"].macro is package_macro
 
 
+def test_macro_namespace_binds_macros_on_lookup(config_postgres, manifest_fx):
+    mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
+    ctx = macros.ContextDict()
+    namespace = mn.build_namespace(manifest_fx.get_macros_by_package(), ctx)
+    ctx.set_namespace(namespace)
+
+    with mock.patch.object(macros, "MacroGenerator") as generator:
+        assert "macro_a" in namespace
+        assert "root" in ctx
+        generator.assert_not_called()
+
+        macro_a = ctx["macro_a"]
+        assert ctx["root"]["macro_a"] is macro_a
+        assert namespace.get_from_package("root", "macro_a") is macro_a
+        generator.assert_called_once_with(
+            manifest_fx.macros["macro.root.macro_a"], ctx, None, mn.thread_ctx
+        )
+
+
+def test_macro_namespace_package_overrides(config_postgres, manifest_fx):
+    mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
+    namespace = mn.build_namespace(manifest_fx.get_macros_by_package(), {})
+
+    namespace["root"]["macro_a"] = "override"
+
+    assert namespace.get_from_package("root", "macro_a") == "override"
+    assert namespace["macro_a"].macro is manifest_fx.macros["macro.root.macro_a"]
+    other_namespace = mn.build_namespace(manifest_fx.get_macros_by_package(), {})
+    assert other_namespace["root"]["macro_a"].macro is manifest_fx.macros["macro.root.macro_a"]
+
+
+def test_context_dict(config_postgres, manifest_fx):
+    mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
+    ctx = macros.ContextDict()
+    ctx.set_namespace(mn.build_namespace(manifest_fx.get_macros_by_package(), ctx))
+    ctx["macro_b"] = "member"
+    ctx["other"] = "value"
+
+    assert ctx["macro_b"] == "member"
+    assert ctx.get("missing") is None
+    assert set(ctx) == {"macro_a", "macro_b", "other", "root", "dbt"}
+    assert dict(ctx)["macro_a"].macro is manifest_fx.macros["macro.root.macro_a"]
+    assert get_rendered("{{ other }}{{ macro_a is defined }}", ctx) == "valueTrue"
+
+
 def test_dbt_metadata_envs(
     monkeypatch, config_postgres, manifest_fx, get_adapter, get_include_paths
 ):
@@ -0,0 +1,52 @@
+from unittest import mock
+
+from dbt.context.context_config import ProjectConfigTrie, RenderedConfig
+from dbt.node_types import NodeType
+
+MODEL_CONFIGS = {
+    "+materialized": "view",
+    "+tags": ["root"],
+    "my_project": {
+        "+schema": "analytics",
+        "enabled": True,
+        "staging": {
+            "+tags": ["staging"],
+            "+meta": {"owner": {"name": "data"}},
+        },
+    },
+}
+
+
+class TestProjectConfigTrie:
+    def test_configs_for(self):
+        trie = ProjectConfigTrie(MODEL_CONFIGS)
+
+        assert list(trie.configs_for(["my_project", "staging", "model_a"])) == [
+            {"materialized": "view", "tags": ["root"]},
+            {"schema": "analytics", "enabled": True},
+            {"tags": ["staging"], "meta": {"owner": {"name": "data"}}},
+        ]
+        assert list(trie.configs_for(["other_project", "staging", "model_a"])) == [
+            {"materialized": "view", "tags": ["root"]},
+        ]
+
+    def test_values_are_copied(self):
+        trie = ProjectConfigTrie(MODEL_CONFIGS)
+
+        _, _, layer = trie.configs_for(["my_project", "staging", "model_a"])
+        layer["tags"].append("changed")
+        layer["meta"]["owner"]["name"] = "changed"
+
+        _, _, layer = trie.configs_for(["my_project", "staging", "model_a"])
+        assert layer == {"tags": ["staging"], "meta": {"owner": {"name": "data"}}}
+        assert MODEL_CONFIGS["my_project"]["staging"]["+tags"] == ["staging"]
+
+    def test_config_tries_are_kept_on_the_project(self):
+        project = mock.Mock(models=MODEL_CONFIGS, seeds={}, config_tries={})
+        trie = RenderedConfig(project).get_config_trie(NodeType.Model)
+
+        assert RenderedConfig(project).get_config_trie(NodeType.Model) is trie
+        assert RenderedConfig(project).get_config_trie(NodeType.Seed) is not trie
+
+        project.models = dict(MODEL_CONFIGS)
+        assert RenderedConfig(project).get_config_trie(NodeType.Model) is not trie
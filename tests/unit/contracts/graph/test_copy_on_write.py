@@ -0,0 +1,84 @@
+import gc
+import pickle
+from copy import deepcopy
+from unittest import mock
+
+from dbt.contracts.graph.copy_on_write import is_shared, share
+from dbt.contracts.graph.nodes import ModelNode
+from dbt.node_types import NodeType
+from tests.unit.utils.manifest import make_model
+
+
+def _clone(node):
+    return node.from_dict(node.to_dict(omit_none=True))
+
+
+class TestShare:
+    def test_reads_keep_members_shared(self):
+        node = make_model("pkg", "orders", "select 1", tags=["nightly"])
+        clone = mock.Mock(side_effect=_clone)
+        copy = share(node, clone)
+
+        assert isinstance(copy, ModelNode)
+        assert type(copy).__name__ == "ModelNode"
+        assert copy.name == "orders"
+        assert copy.resource_type == NodeType.Model
+        assert copy.search_name == "orders"
+        assert node.unique_id == "model.pkg.orders"
+        assert is_shared(node) and is_shared(copy)
+        clone.assert_not_called()
+
+    def test_setting_an_attribute_unshares(self):
+        node = make_model("pkg", "orders", "select 1")
+        copy = share(node, _clone)
+
+        node.description = "changed"
+
+        assert not is_shared(node) and not is_shared(copy)
+        assert type(node) is ModelNode and type(copy) is ModelNode
+        assert node.description == "changed"
+        assert copy.description == ""
+
+    def test_changes_in_place_are_not_seen_by_the_other_side(self):
+        node = make_model("pkg", "orders", "select 1", tags=["nightly"])
+        tags = node.tags
+        copy = share(node, _clone)
+
+        copy.tags.append("hourly")
+        copy.config.materialized = "table"
+
+        assert node.tags is tags
+        assert tags == ["nightly"]
+        assert node.config.materialized == "view"
+        assert copy.tags == ["nightly", "hourly"]
+
+        other = make_model("pkg", "customers", "select 1", tags=["nightly"])
+        other_copy = share(other, _clone)
+        other.tags.append("hourly")
+        assert other_copy.tags == ["nightly"]
+
+    def test_members_outliving_their_copy_are_not_cloned(self):
+        node = make_model("pkg", "orders", "select 1")
+        clone = mock.Mock(side_effect=_clone)
+        share(node, clone)
+        gc.collect()
+
+        node.description = "changed"
+
+        assert type(node) is ModelNode
+        clone.assert_not_called()
+
+    def test_pickle_equality_and_deepcopy(self):
+        node = make_model("pkg", "orders", "select 1")
+        copy = share(node, deepcopy)
+        assert copy == node
+        assert type(copy) is ModelNode
+
+        copy = share(node, deepcopy)
+        restored = pickle.loads(pickle.dumps(copy))
+        assert type(restored) is ModelNode
+        assert restored == node
+
+        copy = share(node, deepcopy)
+        assert type(deepcopy(node)) is ModelNode
+        assert not is_shared(copy)
@@ -1,8 +1,10 @@
+import json
 import os
 import unittest
 from argparse import Namespace
 from collections import namedtuple
 from copy import deepcopy
+from dataclasses import replace
 from datetime import datetime
 from itertools import product
 from unittest import mock
@@ -17,6 +19,7 @@ from dbt import tracking
 from dbt.adapters.base.plugin import AdapterPlugin
 from dbt.artifacts.resources import (
     ExposureType,
+    Hook,
     MaturityType,
     MetricInputMeasure,
     MetricTypeParams,
@@ -26,7 +29,14 @@ from dbt.artifacts.resources import (
     WhereFilterIntersection,
 )
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import DisabledLookup, Manifest, ManifestMetadata
+from dbt.contracts.graph.copy_on_write import is_shared
+from dbt.contracts.graph.manifest import (
+    DisabledLookup,
+    FlatGraph,
+    Manifest,
+    ManifestMetadata,
+    build_node_edges,
+)
 from dbt.contracts.graph.nodes import (
     DependsOn,
     Exposure,
@@ -37,7 +47,7 @@ from dbt.contracts.graph.nodes import (
     SeedNode,
     SourceDefinition,
 )
-from dbt.exceptions import AmbiguousResourceNameRefError, ParsingError
+from dbt.exceptions import AmbiguousResourceNameRefError, DbtInternalError, ParsingError
 from dbt.flags import set_from_args
 from dbt.node_types import NodeType
 from dbt_common.events.functions import reset_metadata_vars
@@ -52,6 +62,7 @@ from tests.unit.utils import (
     inject_plugin,
     make_manifest,
 )
+from tests.unit.utils.manifest import make_macro
 
 REQUIRED_PARSED_NODE_KEYS = frozenset(
     {
@@ -477,6 +488,92 @@ class ManifestTest(unittest.TestCase):
         )
         self.assertEqual(child_map["model.snowplow.events"], [])
 
+    def test_parent_and_child_maps_are_updated(self):
+        manifest = Manifest(
+            nodes=deepcopy(self.nested_nodes),
+            sources={},
+            macros={},
+            docs={},
+            disabled={},
+            files={},
+            exposures={},
+            metrics={},
+            selectors={},
+        )
+        manifest.build_parent_and_child_maps()
+        child_map = manifest.child_map
+        self.assertEqual(child_map["model.root.dep"], ["model.root.nested"])
+
+        # depends_on changed in place, a node replaced, one removed and one added
+        manifest.nodes["model.root.multi"].depends_on.nodes.append("model.root.dep")
+        manifest.nodes["model.root.nested"] = replace(
+            manifest.nodes["model.root.nested"], depends_on=DependsOn(nodes=["model.root.events"])
+        )
+        manifest.nodes.pop("model.root.sibling")
+        manifest.add_node_nofile(
+            replace(
+                manifest.nodes["model.root.dep"],
+                unique_id="model.root.new",
+                depends_on=DependsOn(nodes=["model.root.multi", "model.root.dep"]),
+            )
+        )
+        manifest.build_parent_and_child_maps()
+
+        expected_child_map, expected_parent_map = build_node_edges(list(manifest.nodes.values()))
+        self.assertEqual(dict(manifest.child_map), expected_child_map)
+        self.assertEqual(dict(manifest.parent_map), expected_parent_map)
+        self.assertEqual(child_map["model.root.dep"], ["model.root.multi", "model.root.new"])
+        self.assertNotIn("model.root.sibling", child_map)
+
+    def test_ref_lookup_is_updated(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = Manifest(
+            nodes={"model.root.events": nodes["model.root.events"]},
+            sources={},
+            macros={},
+            docs={},
+            disabled={},
+            files={},
+            exposures={},
+            metrics={},
+            selectors={},
+        )
+        lookup = manifest.ref_lookup
+        manifest.add_node_nofile(nodes["model.root.dep"])
+        self.assertEqual(lookup.get_unique_id("dep", "root", None), "model.root.dep")
+
+        manifest.nodes.pop("model.root.dep")
+        lookup.remove_node("model.root.dep")
+        self.assertIsNone(lookup.get_unique_id("dep", "root", None))
+        self.assertEqual(lookup.get_unique_id("events", "root", None), "model.root.events")
+
+    def test_compact(self):
+        manifest = Manifest.from_msgpack(
+            Manifest(
+                nodes=deepcopy(self.nested_nodes),
+                sources={},
+                macros={},
+                docs={},
+                disabled={},
+                files={},
+                exposures={},
+                metrics={},
+                selectors={},
+            ).to_msgpack()
+        )
+        dep = manifest.nodes["model.root.dep"]
+        nested = manifest.nodes["model.root.nested"]
+        self.assertIsNot(dep.package_name, nested.package_name)
+        self.assertIsNot(dep.unique_id, nested.depends_on.nodes[0])
+
+        manifest.compact()
+
+        self.assertIs(dep.package_name, nested.package_name)
+        self.assertIs(dep.fqn[0], nested.fqn[0])
+        self.assertIs(dep.unique_id, nested.depends_on.nodes[0])
+        self.assertIs(dep.config.materialized, nested.config.materialized)
+        self.assertEqual(nested.depends_on.nodes, ["model.root.dep"])
+
     def test_build_flat_graph(self):
         exposures = deepcopy(self.exposures)
         metrics = deepcopy(self.metrics)
@@ -528,6 +625,109 @@ class ManifestTest(unittest.TestCase):
         for node in flat_nodes.values():
             self.assertEqual(frozenset(node), REQUIRED_PARSED_NODE_KEYS)
 
+    def test_flat_graph_is_lazy(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, sources={}, macros={}, docs={}, disabled={}, files={})
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph["nodes"]
+        unique_id = "model.snowplow.events"
+        node = nodes[unique_id]
+
+        with mock.patch.object(type(node), "to_dict", autospec=True) as to_dict:
+            to_dict.return_value = {"name": "events"}
+            assert len(flat_nodes) == len(nodes)
+            assert unique_id in flat_nodes
+            to_dict.assert_not_called()
+            assert flat_nodes[unique_id] == {"name": "events"}
+            assert flat_nodes[unique_id] is flat_nodes.get(unique_id)
+            to_dict.assert_called_once_with(node, omit_none=False)
+
+            manifest.snapshot_flat_graph_node(unique_id)
+            flat_nodes[unique_id]
+            assert to_dict.call_count == 1
+
+    def test_flat_graph_keeps_snapshots(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, sources={}, macros={}, docs={}, disabled={}, files={})
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph["nodes"]
+        unique_id = "model.snowplow.events"
+        original = nodes[unique_id]
+        replaced = "model.root.events"
+
+        manifest.snapshot_flat_graph_node(unique_id)
+        original.compiled = True
+        original.compiled_code = "select 1"
+        nodes[replaced] = replace(nodes[replaced], description="replaced")
+
+        assert "compiled_code" not in flat_nodes[unique_id]
+        assert flat_nodes[replaced]["description"] == ""
+
+    def test_refers_to_graph(self):
+        nodes = deepcopy(self.nested_nodes)
+        macro = make_macro("root", "my_macro", "{% macro my_macro() %}select 1{% endmacro %}")
+        manifest = Manifest(
+            nodes=nodes,
+            sources={},
+            macros={macro.unique_id: macro},
+            docs={},
+            disabled={},
+            files={},
+        )
+        assert not manifest.refers_to_graph()
+
+        macro.macro_sql = "{% macro my_macro() %}{{ graph.nodes | length }}{% endmacro %}"
+        assert not manifest.refers_to_graph()
+        manifest.clear_lookups()
+        assert manifest.refers_to_graph()
+
+        macro.macro_sql = "{% macro my_macro() %}select graph from graphs{% endmacro %}"
+        nodes["model.snowplow.events"].config.post_hook = [
+            Hook(sql="{% for node in graph.nodes.values() %}{% endfor %}")
+        ]
+        manifest.clear_lookups()
+        assert manifest.refers_to_graph()
+
+    def test_flat_graph_is_built_when_read(self):
+        manifest = Manifest(
+            nodes=deepcopy(self.nested_nodes),
+            sources={},
+            macros={},
+            docs={},
+            disabled={},
+            files={},
+        )
+        manifest.build_flat_graph()
+        flat_graph = manifest.flat_graph
+
+        assert isinstance(flat_graph, FlatGraph)
+        assert dict.get(flat_graph, "nodes") is None
+        manifest.snapshot_flat_graph_node("model.snowplow.events")
+        assert dict.get(flat_graph, "nodes") is None
+        assert set(flat_graph["nodes"]) == set(manifest.nodes)
+        assert json.loads(json.dumps(flat_graph))["sources"] == {}
+
+    def test_flat_graph_looks_like_a_dict(self):
+        manifest = Manifest(
+            nodes=deepcopy(self.nested_nodes),
+            sources={},
+            macros={},
+            docs={},
+            disabled={},
+            files={},
+        )
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph["nodes"]
+        expected = {k: v.to_dict(omit_none=False) for k, v in manifest.nodes.items()}
+
+        assert isinstance(flat_nodes, dict)
+        assert dict(flat_nodes) == expected
+        assert flat_nodes == expected
+        assert json.loads(json.dumps(flat_nodes)) == json.loads(json.dumps(expected))
+        assert deepcopy(flat_nodes) == expected
+        with pytest.raises(DbtInternalError):
+            flat_nodes["model.snowplow.events"] = {}
+
     @mock.patch.object(tracking, "active_user")
     @freezegun.freeze_time("2018-02-14T09:15:13Z")
     def test_no_nodes_with_metadata(self, mock_user):
@@ -682,6 +882,71 @@ class ManifestTest(unittest.TestCase):
         copy = original.deepcopy()
         self.assertEqual(original.flat_graph, copy.flat_graph)
 
+    def test_deepcopy_isolates_manifests(self):
+        original = Manifest(
+            nodes=deepcopy(self.nested_nodes),
+            sources={},
+            macros={},
+            docs={},
+            disabled={},
+            files={},
+            selectors={"my_selector": {"name": "my_selector", "definition": "tag:nightly"}},
+        )
+        original.build_flat_graph()
+        copy = original.deepcopy()
+        assert copy.flat_graph["nodes"]["model.snowplow.events"]["config"]["materialized"] == (
+            "view"
+        )
+
+        copy.nodes["model.snowplow.events"].config.materialized = "table"
+        original.nodes["model.root.dep"].tags.append("changed")
+        copy.selectors["my_selector"]["definition"] = "tag:hourly"
+
+        assert original.nodes["model.snowplow.events"].config.materialized == "view"
+        assert copy.nodes["model.root.dep"].tags == []
+        assert original.selectors["my_selector"]["definition"] == "tag:nightly"
+        assert set(copy.nodes) == set(original.nodes)
+
+    def test_deepcopy_ignores_changes_through_earlier_references(self):
+        original = Manifest(nodes=deepcopy(self.nested_nodes), disabled={}, files={})
+        node = original.nodes["model.snowplow.events"]
+        copy = original.deepcopy()
+
+        node.description = "changed after copy"
+
+        assert copy.nodes["model.snowplow.events"].description == ""
+        assert original.nodes["model.snowplow.events"].description == "changed after copy"
+
+    def test_deepcopy_leaves_original_as_is(self):
+        nodes = deepcopy(self.nested_nodes)
+        original = Manifest(nodes=nodes, disabled={}, files={})
+        node = original.nodes["model.snowplow.events"]
+        node._event_status["node_status"] = "success"
+
+        copy = original.deepcopy()
+        copy.nodes["model.snowplow.events"].description = "changed in copy"
+
+        assert original.nodes is nodes
+        assert original.nodes["model.snowplow.events"] is node
+        assert node._event_status == {"node_status": "success"}
+        assert node.description == ""
+        assert copy.nodes["model.snowplow.events"]._event_status == {}
+
+    def test_deepcopy_shares_members_until_changed(self):
+        original = Manifest(nodes=deepcopy(self.nested_nodes), disabled={}, files={})
+        node = original.nodes["model.snowplow.events"]
+        copy = original.deepcopy()
+        copied = copy.nodes["model.snowplow.events"]
+
+        assert copied.name == node.name == "events"
+        assert all(is_shared(member) for member in copy.nodes.values())
+
+        copied.description = "changed in copy"
+
+        assert not is_shared(node) and not is_shared(copied)
+        assert original.nodes["model.snowplow.events"] is node
+        assert node.description == ""
+
 
 class MixedManifestTest(unittest.TestCase):
     def setUp(self):
@@ -2152,3 +2417,14 @@ class TestDisabledLookup:
         lookup = DisabledLookup(manifest)
 
         assert lookup.find("name", "package", resource_types=[]) is None
+
+    def test_remove_node(self, manifest, mock_model, mock_seed):
+        manifest.disabled = {"model.package.name": [mock_model, mock_seed]}
+        lookup = DisabledLookup(manifest)
+
+        lookup.remove_node(mock_model)
+        assert lookup.find("name", "package") == [mock_seed]
+        lookup.remove_node(mock_seed)
+        assert lookup.find("name", "package") is None
+        lookup.add_node(mock_model)
+        assert lookup.find("name", None) == [mock_model]
@@ -1,9 +1,10 @@
+import networkx as nx
 import pytest
 
 from dbt.compilation import Linker
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import ModelNode
-from dbt.graph.graph import Graph
+from dbt.graph.graph import AncestryIndex, Graph
 from tests.unit.utils.manifest import make_model
 
 
@@ -162,3 +163,57 @@ class TestGraph:
         # neither nodes parents set is a subset of the other
         assert not non_shareds_parents.issubset(tables_parents)
         assert not tables_parents.issubset(non_shareds_parents)
+
+    def test_get_subset_graph(self) -> None:
+        graph = nx.DiGraph()
+        graph.add_edges_from(
+            [
+                ("a", "hub"),
+                ("b", "hub"),
+                ("hub", "c"),
+                ("hub", "x"),
+                ("x", "d"),
+                ("a", "d"),
+                ("c", "y"),
+            ]
+        )
+        graph.add_edge("c", "test", edge_type="parent_test")
+
+        subset = Graph(graph).get_subset_graph(["a", "b", "c", "d", "test"]).graph
+
+        assert set(subset.nodes) == {"a", "b", "c", "d", "test"}
+        # edges across the removed hub, x and y, and the edges between selected nodes
+        assert set(subset.edges) == {
+            ("a", "c"),
+            ("b", "c"),
+            ("a", "d"),
+            ("b", "d"),
+            ("c", "test"),
+        }
+        assert subset.edges["c", "test"] == {"edge_type": "parent_test"}
+
+    def test_get_subset_graph_missing_node(self) -> None:
+        with pytest.raises(ValueError):
+            Graph(nx.DiGraph([("a", "b")])).get_subset_graph(["a", "c"])
+
+    def test_ancestry_index(self) -> None:
+        graph = nx.DiGraph([("a", "b"), ("b", "c"), ("a", "d"), ("e", "d")])
+
+        ancestry = AncestryIndex(graph)
+
+        assert ancestry.descendants(["a"]) == {"b", "c", "d"}
+        assert ancestry.descendants(["b", "e"]) == {"c", "d"}
+        assert ancestry.descendants(["missing"]) == set()
+        assert ancestry.common_descendants(["a", "e"]) == {"d"}
+        assert ancestry.common_descendants(["b", "e"]) == set()
+        assert ancestry.common_descendants([]) == set()
+
+    def test_lookups_skip_test_edges(self) -> None:
+        graph = Graph(nx.DiGraph([("a", "b"), ("b", "c"), ("a", "d"), ("e", "d")]))
+        graph.graph.add_edge("d", "c", edge_type="parent_test")
+
+        assert graph.ancestors("c") == {"a", "b"}
+        assert graph.descendants("e") == {"d"}
+        assert graph.select_parents({"c", "d"}) == {"a", "b", "e"}
+        assert graph.select_children({"a", "missing"}) == {"b", "c", "d"}
+        assert graph.select_children({"a", "e"}, max_depth=1) == {"b", "d"}
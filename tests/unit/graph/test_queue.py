@@ -45,3 +45,69 @@ class TestGraphQueue:
             "model.test_package.upstream_model",
             "model.test_package.downstream_model",
         }
+
+    def test_mark_done(self):
+        manifest = make_manifest(
+            nodes=[MockNode(package="pkg", name=name) for name in ["a", "b", "c", "d", "e"]]
+        )
+        graph = nx.DiGraph()
+        graph.add_edges_from(
+            [
+                ("model.pkg.a", "model.pkg.b"),
+                ("model.pkg.a", "model.pkg.c"),
+                ("model.pkg.b", "model.pkg.d"),
+                ("model.pkg.c", "model.pkg.d"),
+            ]
+        )
+        graph.add_node("model.pkg.e")
+        graph_queue = GraphQueue(graph=graph, manifest=manifest, selected=set(graph.nodes))
+
+        # nodes are ordered by their depth, then their unique_id
+        assert graph_queue.inner.queue == [(0, "model.pkg.a"), (0, "model.pkg.e")]
+        assert len(graph_queue) == 5
+
+        assert graph_queue.get(block=False).unique_id == "model.pkg.a"
+        graph_queue.mark_done("model.pkg.a")
+        assert graph_queue.queued == {"model.pkg.b", "model.pkg.c", "model.pkg.e"}
+        assert len(graph_queue) == 4
+
+        for node_id in ["model.pkg.e", "model.pkg.b"]:
+            assert graph_queue.get(block=False).unique_id == node_id
+            graph_queue.mark_done(node_id)
+        # d still waits on c
+        assert graph_queue.queued == {"model.pkg.c"}
+
+        assert graph_queue.get(block=False).unique_id == "model.pkg.c"
+        graph_queue.mark_done("model.pkg.c")
+        assert graph_queue.inner.queue == [(2, "model.pkg.d")]
+        assert graph_queue.get(block=False).unique_id == "model.pkg.d"
+        assert graph_queue.empty()
+        graph_queue.mark_done("model.pkg.d")
+        assert graph_queue.inner.unfinished_tasks == 0
+        # the graph isn't modified
+        assert len(graph) == 5
+
+    def test_prioritize_by_duration(self):
+        manifest = make_manifest(
+            nodes=[
+                MockNode(package="pkg", name=name, is_ephemeral=False)
+                for name in ["a", "b", "c", "d"]
+            ]
+        )
+        graph = nx.DiGraph()
+        graph.add_edges_from([("model.pkg.a", "model.pkg.b"), ("model.pkg.c", "model.pkg.d")])
+        graph_queue = GraphQueue(graph=graph, manifest=manifest, selected=set(graph.nodes))
+        # d has no history, so it's expected to take the median of 1, 10 and 2
+        graph_queue.prioritize_by_duration(
+            {"model.pkg.a": 1.0, "model.pkg.b": 10.0, "model.pkg.c": 2.0}
+        )
+
+        # a starts first, because a and b take longer than c and d
+        assert graph_queue.inner.queue == [(-11.0, "model.pkg.a"), (-4.0, "model.pkg.c")]
+        assert graph_queue.queued == {"model.pkg.a", "model.pkg.c"}
+        assert graph_queue.predicted_makespan(threads=1) == 15.0
+        assert graph_queue.predicted_makespan(threads=2) == 11.0
+
+        assert graph_queue.get(block=False).unique_id == "model.pkg.a"
+        graph_queue.mark_done("model.pkg.a")
+        assert graph_queue.get(block=False).unique_id == "model.pkg.b"
@@ -22,6 +22,7 @@ from dbt.graph.selector_methods import (
     PathSelectorMethod,
     QualifiedNameSelectorMethod,
     SavedQuerySelectorMethod,
+    SelectorIndex,
     SemanticModelSelectorMethod,
     SourceSelectorMethod,
     StateSelectorMethod,
@@ -165,6 +166,88 @@ def test_select_tag(manifest):
     }
 
 
+def test_selector_index_shared_and_rebuilt(manifest):
+    index = SelectorIndex.for_manifest(manifest)
+    assert SelectorIndex.for_manifest(manifest) is index
+    assert MethodManager(manifest, None).get_method("tag", []).index is index
+
+    method = MethodManager(manifest, None).get_method("tag", [])
+    assert search_manifest_using_method(manifest, method, "new_tag") == set()
+
+    model = make_model("pkg", "tagged_model", "select 1", tags=["new_tag"])
+    manifest.nodes[model.unique_id] = model
+    assert SelectorIndex.for_manifest(manifest) is not index
+    assert search_manifest_using_method(manifest, method, "new_tag") == {"tagged_model"}
+
+
+def test_selector_index_wildcard_keys():
+    manifest = Manifest()
+    for model in (
+        make_model("pkg", "orders", "select 1", tags=["finance", "daily"]),
+        make_model("pkg_extra", "customers", "select 1", tags=["fin_ops"]),
+        make_model("other", "events", "select 1", tags=["hourly"]),
+    ):
+        manifest.nodes[model.unique_id] = model
+    methods = MethodManager(manifest, None)
+
+    tag_method = methods.get_method("tag", [])
+    assert search_manifest_using_method(manifest, tag_method, "fin*") == {"orders", "customers"}
+    assert search_manifest_using_method(manifest, tag_method, "?aily") == {"orders"}
+    assert search_manifest_using_method(manifest, tag_method, "[dh]*") == {"orders", "events"}
+    assert not search_manifest_using_method(manifest, tag_method, "fin")
+
+    package_method = methods.get_method("package", [])
+    assert search_manifest_using_method(manifest, package_method, "pkg*") == {
+        "orders",
+        "customers",
+    }
+    assert search_manifest_using_method(manifest, package_method, "*") == {
+        "orders",
+        "customers",
+        "events",
+    }
+    assert not search_manifest_using_method(manifest, package_method, "pk")
+
+
+def test_selector_index_paths(tmp_path, monkeypatch):
+    manifest = Manifest()
+    for model in (
+        make_model("pkg", "orders", "select 1", path="marts/finance/orders.sql"),
+        make_model(
+            "pkg",
+            "customers",
+            "select 1",
+            path="marts/customers.sql",
+            patch_path="pkg://models/marts/schema.yml",
+        ),
+        make_model("pkg", "events", "select 1", path="staging/events.sql"),
+    ):
+        manifest.nodes[model.unique_id] = model
+
+    paths = SelectorIndex.for_manifest(manifest).paths()
+    assert paths[Path("models/marts/finance/orders.sql")] == {"model.pkg.orders"}
+    assert paths[Path("models/marts/finance")] == {"model.pkg.orders"}
+    assert paths[Path("models/marts")] == {"model.pkg.orders", "model.pkg.customers"}
+    assert paths[Path("models")] == {
+        "model.pkg.orders",
+        "model.pkg.customers",
+        "model.pkg.events",
+    }
+    assert paths[Path("models/marts/schema.yml")] == {"model.pkg.customers"}
+
+    for path in ("models/marts/finance/orders.sql", "models/marts/schema.yml"):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+    monkeypatch.chdir(tmp_path)
+    method = MethodManager(manifest, None).get_method("path", [])
+    assert search_manifest_using_method(manifest, method, "models/marts") == {
+        "orders",
+        "customers",
+    }
+    assert search_manifest_using_method(manifest, method, "models/marts/*.yml") == {"customers"}
+    assert search_manifest_using_method(manifest, method, "models/marts/finance/*") == {"orders"}
+
+
 def test_select_group(manifest, view_model):
     group_name = "my_group"
     group = make_group("test", group_name)
@@ -427,6 +510,31 @@ def test_select_config_meta(manifest):
     assert not search_manifest_using_method(manifest, list_method, "other") == {"table_model"}
 
 
+def test_select_config_list_values():
+    manifest = Manifest()
+    for name, values in (
+        ("strings", ["a", "b"]),
+        ("with_true", ["a", True]),
+        ("with_false", [False, "c"]),
+        ("plain_true", True),
+        ("plain_string", "a"),
+    ):
+        model = make_model("pkg", name, "select 1", config_kwargs={"meta": {"flags": values}})
+        manifest.nodes[model.unique_id] = model
+    method = MethodManager(manifest, None).get_method("config", ["meta", "flags"])
+
+    assert search_manifest_using_method(manifest, method, "a") == {
+        "strings",
+        "with_true",
+        "plain_string",
+    }
+    assert search_manifest_using_method(manifest, method, "b") == {"strings"}
+    assert search_manifest_using_method(manifest, method, "true") == {"with_true", "plain_true"}
+    assert search_manifest_using_method(manifest, method, "TRUE") == {"with_true", "plain_true"}
+    assert search_manifest_using_method(manifest, method, "false") == {"with_false"}
+    assert search_manifest_using_method(manifest, method, "c") == {"with_false"}
+
+
 def test_select_test_name(manifest):
     methods = MethodManager(manifest, None)
     method = methods.get_method("test_name", [])
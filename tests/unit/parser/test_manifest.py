@@ -11,7 +11,12 @@ from dbt.config import RuntimeConfig
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
 from dbt.events.types import InvalidConcurrentBatchesConfig, UnusedResourceConfigPath
 from dbt.flags import set_from_args
-from dbt.parser.manifest import ManifestLoader, _warn_for_unused_resource_config_paths
+from dbt.parser.manifest import (
+    DocsRenderer,
+    ManifestLoader,
+    ReparseReason,
+    _warn_for_unused_resource_config_paths,
+)
 from dbt.parser.read_files import FileDiff
 from dbt.tracking import User
 from dbt_common.events.event_manager_client import add_callback_to_manager
@@ -36,14 +41,27 @@ class TestPartialParse:
         patched_open.assert_called_with("specified_partial_parse_path", "rb")
 
     def test_profile_hash_change(self, mock_project):
-        # This test validate that the profile_hash is updated when the connection keys change
-        profile_hash = "750bc99c1d64ca518536ead26b28465a224be5ffc918bf2a490102faa5a1bcf5"
+        # This test validate that the profile_hash is only updated when the parts
+        # of the profile that parsing uses directly change
+        mock_project.credentials.type = "postgres"
+        mock_project.credentials.database = "dbt"
+        mock_project.credentials.schema = "analytics"
         mock_project.credentials.connection_info.return_value = "test"
-        manifest = ManifestLoader(mock_project, {})
-        assert manifest.manifest.state_check.profile_hash.checksum == profile_hash
+        profile_hash = ManifestLoader(mock_project, {}).manifest.state_check.profile_hash
         mock_project.credentials.connection_info.return_value = "test1"
         manifest = ManifestLoader(mock_project, {})
-        assert manifest.manifest.state_check.profile_hash.checksum != profile_hash
+        assert manifest.manifest.state_check.profile_hash == profile_hash
+        mock_project.credentials.schema = "other"
+        manifest = ManifestLoader(mock_project, {})
+        assert manifest.manifest.state_check.profile_hash != profile_hash
+
+    def test_target_hashes(self, mock_project):
+        mock_project.to_target_dict.return_value = {"name": "dev", "user": "alice"}
+        state_check = ManifestLoader(mock_project, {}).manifest.state_check
+        mock_project.to_target_dict.return_value = {"name": "dev", "user": "bob", "role": "r"}
+        new_state_check = ManifestLoader(mock_project, {}).manifest.state_check
+
+        assert new_state_check.changed_vars(state_check) == {"target.user", "target.role"}
 
     @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
     @patch("dbt.parser.manifest.os.path.exists")
@@ -62,6 +80,7 @@ class TestPartialParse:
             profile_hash=file_hash,
             profile_env_vars_hash=file_hash,
             project_env_vars_hash=file_hash,
+            project_config_hash=file_hash,
         )
         # we need a loader to compare the two manifests
         loader = ManifestLoader(runtime_config, {runtime_config.project_name: runtime_config})
@@ -78,6 +97,43 @@ class TestPartialParse:
         is_partial_parsable, _ = loader.is_partial_parsable(manifest)
         assert not is_partial_parsable
 
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    @patch("dbt.parser.manifest.os.path.exists")
+    @patch("dbt.parser.manifest.open")
+    def test_partial_parse_by_vars(
+        self,
+        patched_open,
+        patched_os_exist,
+        patched_state_check,
+        runtime_config: RuntimeConfig,
+        manifest: Manifest,
+    ):
+        file_hash = FileHash.from_contents("test contests")
+        manifest.state_check = ManifestStateCheck(
+            vars_hash=file_hash,
+            profile_hash=file_hash,
+            profile_env_vars_hash=file_hash,
+            project_env_vars_hash=file_hash,
+            project_config_hash=file_hash,
+            cli_var_hashes={"start_date": FileHash.from_contents("2020-01-01")},
+        )
+        loader = ManifestLoader(runtime_config, {runtime_config.project_name: runtime_config})
+        loader.manifest = manifest.deepcopy()
+        loader.manifest.state_check.cli_var_hashes = {
+            "start_date": FileHash.from_contents("2021-01-01")
+        }
+        assert loader.manifest.state_check.changed_vars(manifest.state_check) == {"start_date"}
+
+        # Files that read the var are reparsed
+        is_partial_parsable, _ = loader.is_partial_parsable(manifest)
+        assert is_partial_parsable
+
+        # The var was read somewhere it couldn't be tracked to a file
+        manifest.state_check.add_unattributed_var("start_date")
+        is_partial_parsable, reparse_reason = loader.is_partial_parsable(manifest)
+        assert not is_partial_parsable
+        assert reparse_reason == ReparseReason.vars_changed
+
 
 class TestFailedPartialParse:
     @patch("dbt.tracking.track_partial_parser")
@@ -103,7 +159,9 @@ class TestFailedPartialParse:
 
         mock_saved_manifest = MagicMock(Manifest)
         mock_saved_manifest.files = {}
+        mock_saved_manifest.state_check = ManifestStateCheck()
         patched_read_manifest_for_partial_parse.return_value = mock_saved_manifest
+        patched_state_check.return_value = ManifestStateCheck()
 
         loader = ManifestLoader(mock_project, {})
         loader.safe_update_project_parser_files_partially({})
@@ -296,3 +354,72 @@ class TestCheckForcingConcurrentBatches:
             assert "Batches will be run sequentially" in event_catcher.caught_events[0].info.msg  # type: ignore
         else:
             assert len(event_catcher.caught_events) == 0
+
+
+class TestDirtyMembers:
+    @pytest.fixture
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    @patch("dbt.parser.manifest.os.path.exists")
+    @patch("dbt.parser.manifest.open")
+    def manifest_loader(
+        self, patched_open, patched_os_exist, patched_state_check
+    ) -> ManifestLoader:
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_target_path = "mock_target_path"
+        mock_project.project_name = "mock_project_name"
+        return ManifestLoader(mock_project, {})
+
+    def test_dirty_members(self, manifest_loader: ManifestLoader):
+        manifest = manifest_loader.manifest
+        unchanged = model_node()
+        unchanged.created_at = manifest_loader.started_at - 1
+        manifest.add_node_nofile(unchanged)
+
+        manifest.track_dirty()
+        changed = model_node()
+        changed.unique_id = "model.test.bar"
+        manifest.add_node_nofile(changed)
+
+        assert manifest.dirty == {"model.test.bar": None}
+        members = manifest_loader._dirty_members("phase", manifest.nodes)
+        assert members == [changed]
+        members = manifest_loader._dirty_members("phase", manifest.nodes, all_if_untracked=True)
+        assert members == [changed]
+
+        phase_info = manifest_loader._perf_info.process_phases[0]
+        assert phase_info.phase == "phase"
+        assert phase_info.visited_count == 2
+        assert phase_info.skipped_count == 2
+
+    def test_untracked_dirty_members(self, manifest_loader: ManifestLoader):
+        manifest = manifest_loader.manifest
+        unchanged = model_node()
+        unchanged.created_at = manifest_loader.started_at - 1
+        manifest.add_node_nofile(unchanged)
+
+        assert manifest.dirty is None
+        assert manifest_loader._dirty_members("phase", manifest.nodes) == []
+        members = manifest_loader._dirty_members("phase", manifest.nodes, all_if_untracked=True)
+        assert members == [unchanged]
+
+
+class TestDocsRenderer:
+    def test_render(self, mocker: MockerFixture):
+        docs_context = mocker.patch("dbt.parser.manifest.DocsRuntimeContext")
+        docs_context.return_value.to_dict.return_value = {"answer": 42}
+        renderer = DocsRenderer(MagicMock(RuntimeConfig), Manifest(), "root")
+        node = model_node()
+        other_node = model_node()
+        other_node.unique_id = "model.test.bar"
+
+        assert renderer.render("plain text", node) == "plain text"
+        assert not docs_context.called
+
+        assert renderer.render("answer: {{ answer }}", node) == "answer: 42"
+        assert renderer.render("{{ answer }}", other_node) == "42"
+        # the context of the package is reused and pointed at the last node
+        assert docs_context.call_count == 1
+        assert docs_context.return_value.node is other_node
+
+        assert renderer.plain_count == 1
+        assert renderer.rendered_count == 2
@@ -1392,6 +1392,47 @@ class StaticModelParserTest(BaseParserTest):
 
         assert self.parser._has_banned_macro(node)
 
+    def test_static_analysis_when_static_parser_fails(self):
+        macro_unique_id = "macro.dbt.is_incremental"
+        self.parser.manifest.macros[macro_unique_id] = Macro(
+            name="is_incremental",
+            resource_type=NodeType.Macro,
+            unique_id=macro_unique_id,
+            package_name="dbt",
+            original_file_path=normalize("macros/is_incremental.sql"),
+            path=normalize("macros/is_incremental.sql"),
+            macro_sql="{% macro is_incremental() %}{{ return(False) }}{% endmacro %}",
+        )
+        raw_code = (
+            "{% set name = 'model_2' %}"
+            "select * from {{ ref(name) }} where id > {{ var('min_id', 0) }}"
+            "{% if is_incremental() %} and id > (select max(id) from {{ this }}){% endif %}"
+        )
+        block = self.file_block_for(raw_code, "nested/model_1.sql")
+        self.parser.manifest.files[block.file.file_id] = block.file
+        self.parser.parse_file(block)
+
+        node = list(self.parser.manifest.nodes.values())[0]
+        self.assertEqual(node.refs, [RefArgs(name="model_2")])
+        self.assertEqual(node.depends_on.macros, [macro_unique_id])
+        self.assertEqual(block.file.vars, ["min_id"])
+        parsing_info = self.parser.manifest._parsing_info
+        self.assertEqual(parsing_info.static_analysis_parsed_path_count, 1)
+        self.assertEqual(parsing_info.static_analysis_fallback_reasons, {})
+
+    def test_static_analysis_fallback_reasons(self):
+        raw_code = "{% for i in range(2) %}select {{ i }}{% endfor %}"
+        block = self.file_block_for(raw_code, "nested/model_1.sql")
+        self.parser.manifest.files[block.file.file_id] = block.file
+        self.parser.parse_file(block)
+
+        parsing_info = self.parser.manifest._parsing_info
+        self.assertEqual(parsing_info.static_analysis_parsed_path_count, 0)
+        self.assertEqual(
+            parsing_info.static_analysis_fallback_reasons,
+            {block.file.file_id: "For statement"},
+        )
+
 
 # TODO
 class StaticModelParserUnitTest(BaseParserTest):
@@ -238,3 +238,29 @@ class TestFileDiff:
         assert partial_parsing.file_diff["changed"] == [
             "my_test://models/python_model_untouched.py"
         ]
+
+
+class TestVarsChanged:
+    def test_files_reading_changed_vars_are_reparsed(self, manifest, files):
+        safe_set_invocation_context()
+        new_files = deepcopy(files)
+        manifest.files["my_test://models/my_model.sql"].vars = ["start_date"]
+        manifest.files["my_test://models/my_model_untouched.sql"].vars = ["unchanged"]
+        manifest.files["my_test://models/schema.yml"].add_var("end_date", "models", "python_model")
+
+        partial_parsing = PartialParsing(manifest, new_files, {"start_date", "end_date"})
+
+        assert partial_parsing.file_diff["changed"] == ["my_test://models/my_model.sql"]
+        assert partial_parsing.file_diff["changed_schema_files"] == ["my_test://models/schema.yml"]
+        assert partial_parsing.env_vars_changed_schema_files == {
+            "my_test://models/schema.yml": {"models": ["python_model"]}
+        }
+
+    def test_unread_vars_are_ignored(self, manifest, files):
+        safe_set_invocation_context()
+        new_files = deepcopy(files)
+        manifest.files["my_test://models/my_model.sql"].vars = ["start_date"]
+
+        partial_parsing = PartialParsing(manifest, new_files, {"end_date"})
+
+        assert partial_parsing.skip_parsing()
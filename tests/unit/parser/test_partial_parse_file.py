@@ -0,0 +1,169 @@
+import os
+
+import pytest
+
+import dbt.parser.partial_parse_file as partial_parse_file_module
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.parser.partial_parse_file import (
+    PartialParseFile,
+    extended_mashumaro_encoder,
+    extended_mashumuro_decoder,
+    partial_parse_shards_path,
+    read_partial_parse_file,
+    write_partial_parse_file,
+)
+from dbt.tests.util import get_manifest
+from dbt.version import __version__
+from tests.unit.utils.manifest import make_model
+
+
+@pytest.fixture
+def saved_manifest() -> Manifest:
+    manifest = Manifest(
+        state_check=ManifestStateCheck(vars_hash=FileHash.from_contents("vars")),
+    )
+    manifest.metadata.dbt_version = __version__
+    for model in (
+        make_model("pkg", "model_a", "select 1"),
+        make_model("pkg", "model_b", "select * from {{ ref('model_a') }}"),
+    ):
+        manifest.add_node_nofile(model)
+    manifest.add_disabled_nofile(
+        make_model("pkg", "model_c", "select 2", config_kwargs={"enabled": False})
+    )
+    return manifest
+
+
+def read_index(path):
+    with open(path, "rb") as fp, PartialParseFile(
+        fp, partial_parse_shards_path(str(path))
+    ) as partial_parse_file:
+        return partial_parse_file.index
+
+
+class TestPartialParseFile:
+    def test_roundtrip(self, tmp_path, saved_manifest):
+        path = str(tmp_path / "target" / "partial_parse.msgpack")
+        write_partial_parse_file(path, saved_manifest)
+
+        manifest = read_partial_parse_file(path)
+
+        # Decodes to the same manifest as a single msgpack document does
+        expected = Manifest.from_msgpack(
+            saved_manifest.to_msgpack(extended_mashumaro_encoder),
+            decoder=extended_mashumuro_decoder,
+        )
+        assert manifest is not None
+        assert manifest.writable_manifest().to_dict() == expected.writable_manifest().to_dict()
+        assert manifest.state_check.to_dict() == saved_manifest.state_check.to_dict()
+        assert not (tmp_path / "target" / "partial_parse.msgpack.tmp").exists()
+
+    def test_header_is_read_without_decoding_sections(self, tmp_path, saved_manifest, mocker):
+        path = tmp_path / "partial_parse.msgpack"
+        write_partial_parse_file(str(path), saved_manifest)
+        decode = mocker.spy(PartialParseFile, "_decode")
+        read_shard = mocker.spy(PartialParseFile, "read_shard")
+
+        with open(path, "rb") as fp, PartialParseFile(
+            fp, partial_parse_shards_path(str(path))
+        ) as partial_parse_file:
+            header_manifest = partial_parse_file.header_manifest()
+            assert decode.call_count == 1
+            shards = partial_parse_file.section("shards")
+            partial_parse_file.section("shards")
+
+        assert decode.call_count == 2
+        assert read_shard.call_count == 0
+        assert header_manifest.metadata.dbt_version == __version__
+        assert header_manifest.state_check.to_dict() == saved_manifest.state_check.to_dict()
+        assert set(shards) == {
+            "pkg://models/model_a.sql",
+            "pkg://models/model_b.sql",
+            "pkg://models/model_c.sql",
+        }
+
+    def test_only_changed_files_are_written(self, tmp_path, saved_manifest, mocker):
+        path = tmp_path / "partial_parse.msgpack"
+        shards_path = tmp_path / "partial_parse_shards"
+        saved_index = write_partial_parse_file(str(path), saved_manifest)
+        saved_shards = set(os.listdir(shards_path))
+        assert read_index(path) == saved_index
+
+        model_b = make_model("pkg", "model_b", "select 2 from {{ ref('model_a') }}")
+        saved_manifest.nodes[model_b.unique_id] = model_b
+        model_d = make_model("pkg", "model_d", "select 3")
+        saved_manifest.add_node_nofile(model_d)
+        del saved_manifest.disabled["model.pkg.model_c"]
+        subset = mocker.spy(partial_parse_file_module, "_manifest_subset")
+        write = mocker.spy(partial_parse_file_module, "_write_atomically")
+
+        index = write_partial_parse_file(
+            str(path), saved_manifest, saved_index, {"pkg://models/model_b.sql"}
+        )
+
+        # Only the changed and added files are serialized, and written with the root
+        assert subset.call_args.args[1] == {"pkg://models/model_b.sql", "pkg://models/model_d.sql"}
+        assert write.call_count == 3
+        assert (
+            index.shards["pkg://models/model_a.sql"]
+            == saved_index.shards["pkg://models/model_a.sql"]
+        )
+        assert set(index.shards) == {
+            "pkg://models/model_a.sql",
+            "pkg://models/model_b.sql",
+            "pkg://models/model_d.sql",
+        }
+        assert set(os.listdir(shards_path)) == {
+            f"{name}.msgpack" for name in index.shards.values()
+        }
+        assert set(os.listdir(shards_path)) != saved_shards
+
+        manifest = read_partial_parse_file(str(path))
+        assert manifest is not None
+        assert list(manifest.nodes) == list(saved_manifest.nodes)
+        assert manifest.nodes[model_b.unique_id].raw_code == model_b.raw_code
+        assert manifest.disabled == {}
+
+    def test_rejects_other_formats(self, tmp_path, saved_manifest):
+        path = tmp_path / "partial_parse.msgpack"
+        path.write_bytes(saved_manifest.to_msgpack())
+
+        with open(path, "rb") as fp:
+            with pytest.raises(ValueError, match="not a partial parse file"):
+                PartialParseFile(fp, str(tmp_path))
+
+    def test_rejects_truncated_file(self, tmp_path, saved_manifest):
+        path = tmp_path / "partial_parse.msgpack"
+        write_partial_parse_file(str(path), saved_manifest)
+        path.write_bytes(path.read_bytes()[:20])
+
+        with open(path, "rb") as fp:
+            with pytest.raises(ValueError, match="truncated"):
+                PartialParseFile(fp, str(tmp_path))
+
+
+class TestGetManifest:
+    def test_reads_partial_parse_file(self, tmp_path, saved_manifest):
+        write_partial_parse_file(
+            str(tmp_path / "target" / "partial_parse.msgpack"), saved_manifest
+        )
+
+        manifest = get_manifest(str(tmp_path))
+
+        assert manifest is not None
+        assert list(manifest.nodes) == list(saved_manifest.nodes)
+
+    def test_reads_whole_manifest_msgpack(self, tmp_path, saved_manifest):
+        # The format written before the manifest was split into sections and shards
+        (tmp_path / "target").mkdir()
+        (tmp_path / "target" / "partial_parse.msgpack").write_bytes(saved_manifest.to_msgpack())
+
+        manifest = get_manifest(str(tmp_path))
+
+        assert manifest is not None
+        assert list(manifest.nodes) == list(saved_manifest.nodes)
+        assert list(manifest.disabled) == list(saved_manifest.disabled)
+
+    def test_missing_file(self, tmp_path):
+        assert get_manifest(str(tmp_path)) is None
@@ -0,0 +1,178 @@
+import os
+
+import pytest
+
+import dbt.parser.read_files
+from dbt.config.project import Project
+from dbt.contracts.files import FileHash
+from dbt.parser.read_files import (
+    FileStatCache,
+    ReadFilesFromFileSystem,
+    load_deferred_contents,
+)
+
+PROJECT_FILES = {
+    "models/model_a.sql": "select 1 as id",
+    "models/staging/model_b.sql": "select * from {{ ref('model_a') }}",
+    "models/staging/model_c.py": "def model(dbt, session):\n    return dbt.ref('model_b')",
+    "models/schema.yml": "models:\n  - name: model_a\n    description: a model",
+    "models/sources.yml": (
+        "sources:\n  - name: src\n    tables:\n"
+        "      - name: table_a\n        loaded_at_field: null\n"
+        "      - name: table_b"
+    ),
+    "macros/my_macro.sql": "{% macro my_macro() %}1{% endmacro %}",
+    "seeds/my_seed.csv": "id,name\n1,a\n2,b",
+    "snapshots/my_snapshot.sql": "{% snapshot my_snapshot %}select 1{% endsnapshot %}",
+    "tests/singular.sql": "select 1 where false",
+    "tests/generic/my_test.sql": "{% test my_test(model) %}select 1{% endtest %}",
+    "tests/fixtures/my_fixture.csv": "id\n1",
+    "docs/overview.md": "{% docs __overview__ %}hi{% enddocs %}",
+    "analyses/my_analysis.sql": "select 2",
+}
+
+
+@pytest.fixture
+def project_on_disk(tmp_path, project: Project) -> Project:
+    for relative_path, contents in PROJECT_FILES.items():
+        path = tmp_path / relative_path
+        os.makedirs(path.parent, exist_ok=True)
+        path.write_text(contents)
+    project.project_root = str(tmp_path)
+    return project
+
+
+class TestReadFilesFromFileSystem:
+    def test_concurrent_read_matches_serial_read(self, project_on_disk: Project):
+        all_projects = {project_on_disk.project_name: project_on_disk}
+
+        serial_reader = ReadFilesFromFileSystem(all_projects=all_projects)
+        serial_reader.read_files()
+
+        concurrent_reader = ReadFilesFromFileSystem(all_projects=all_projects, max_workers=4)
+        concurrent_reader.read_files()
+
+        assert list(concurrent_reader.files.keys()) == list(serial_reader.files.keys())
+        assert concurrent_reader.project_parser_files == serial_reader.project_parser_files
+        for file_id, source_file in serial_reader.files.items():
+            assert concurrent_reader.files[file_id].checksum == source_file.checksum
+            assert concurrent_reader.files[file_id].contents == source_file.contents
+
+    def test_concurrent_read_skips_generic_tests_and_fixtures(self, project_on_disk: Project):
+        reader = ReadFilesFromFileSystem(
+            all_projects={project_on_disk.project_name: project_on_disk}, max_workers=4
+        )
+        reader.read_files()
+
+        parser_files = reader.project_parser_files[project_on_disk.project_name]
+        assert parser_files["SingularTestParser"] == ["test_project://tests/singular.sql"]
+        assert parser_files["GenericTestParser"] == ["test_project://tests/generic/my_test.sql"]
+        assert parser_files["FixtureParser"] == ["test_project://tests/fixtures/my_fixture.csv"]
+        assert parser_files["ModelParser"] == [
+            "test_project://models/model_a.sql",
+            "test_project://models/staging/model_b.sql",
+            "test_project://models/staging/model_c.py",
+        ]
+
+    def test_schema_yaml_decoded_in_processes_matches_serial(
+        self, project_on_disk: Project, mocker
+    ):
+        all_projects = {project_on_disk.project_name: project_on_disk}
+        mocker.patch("dbt.parser.read_files.MIN_SCHEMA_FILES_PER_PROCESS", 1)
+
+        serial_reader = ReadFilesFromFileSystem(all_projects=all_projects)
+        serial_reader.read_files()
+
+        schema_dict_from_yaml = mocker.spy(dbt.parser.read_files, "schema_dict_from_yaml")
+        process_reader = ReadFilesFromFileSystem(all_projects=all_projects, yaml_workers=2)
+        process_reader.read_files()
+
+        assert schema_dict_from_yaml.call_count == 2
+
+        for file_id in ("test_project://models/schema.yml", "test_project://models/sources.yml"):
+            assert process_reader.files[file_id].dfy == serial_reader.files[file_id].dfy
+        tables = process_reader.files["test_project://models/sources.yml"].dfy["sources"][0][
+            "tables"
+        ]
+        assert tables[0]["loaded_at_field_present"] is True
+        assert "loaded_at_field_present" not in tables[1]
+
+    def test_unchanged_schema_yaml_is_not_decoded(
+        self, project_on_disk: Project, tmp_path, mocker
+    ):
+        all_projects = {project_on_disk.project_name: project_on_disk}
+        first_reader = ReadFilesFromFileSystem(all_projects=all_projects)
+        first_reader.read_files()
+
+        # Touch the file without changing it
+        os.utime(tmp_path / "models" / "schema.yml", ns=(0, 0))
+        yaml_from_file = mocker.spy(dbt.parser.read_files, "yaml_from_file")
+        second_reader = ReadFilesFromFileSystem(
+            all_projects=all_projects, saved_files=first_reader.files
+        )
+        second_reader.read_files()
+
+        assert yaml_from_file.call_count == 0
+        schema_file = second_reader.files["test_project://models/schema.yml"]
+        assert schema_file.dfy == first_reader.files["test_project://models/schema.yml"].dfy
+
+
+class TestFileStatCache:
+    def test_unchanged_files_are_not_read(self, project_on_disk: Project, tmp_path, mocker):
+        all_projects = {project_on_disk.project_name: project_on_disk}
+        mocker.patch("dbt.parser.read_files.RACY_MTIME_WINDOW_NS", 0)
+        cache_path = str(tmp_path / "target" / "partial_parse_file_stats.msgpack")
+
+        file_stat_cache = FileStatCache()
+        first_reader = ReadFilesFromFileSystem(
+            all_projects=all_projects, file_stat_cache=file_stat_cache
+        )
+        first_reader.read_files()
+        assert file_stat_cache.changed
+        file_stat_cache.write(cache_path)
+
+        loaded_cache = FileStatCache.from_path(cache_path)
+        assert loaded_cache.entries == file_stat_cache.entries
+        load_file_contents = mocker.spy(dbt.parser.read_files, "load_file_contents")
+        second_reader = ReadFilesFromFileSystem(
+            all_projects=all_projects,
+            saved_files=first_reader.files,
+            file_stat_cache=loaded_cache,
+        )
+        second_reader.read_files()
+
+        assert load_file_contents.call_count == 0
+        assert not loaded_cache.changed
+        for file_id, source_file in first_reader.files.items():
+            assert second_reader.files[file_id].checksum == source_file.checksum
+
+        model = second_reader.files["test_project://models/model_a.sql"]
+        assert model.contents is None
+        load_deferred_contents(model)
+        assert model.contents == "select 1 as id"
+
+    def test_changed_file_is_read(self, project_on_disk: Project, tmp_path, mocker):
+        all_projects = {project_on_disk.project_name: project_on_disk}
+        mocker.patch("dbt.parser.read_files.RACY_MTIME_WINDOW_NS", 0)
+        file_stat_cache = FileStatCache()
+        ReadFilesFromFileSystem(
+            all_projects=all_projects, file_stat_cache=file_stat_cache
+        ).read_files()
+        file_stat_cache.entries = file_stat_cache.new_entries
+        file_stat_cache.new_entries = {}
+
+        (tmp_path / "models" / "model_a.sql").write_text("select 2 as id, 'longer' as name")
+        reader = ReadFilesFromFileSystem(
+            all_projects=all_projects, file_stat_cache=file_stat_cache
+        )
+        reader.read_files()
+
+        model = reader.files["test_project://models/model_a.sql"]
+        assert model.contents == "select 2 as id, 'longer' as name"
+        assert model.checksum == FileHash.from_contents("select 2 as id, 'longer' as name")
+        assert file_stat_cache.changed
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        cache_path = tmp_path / "partial_parse_file_stats.msgpack"
+        cache_path.write_bytes(b"not msgpack")
+        assert FileStatCache.from_path(str(cache_path)).entries == {}
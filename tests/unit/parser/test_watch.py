@@ -0,0 +1,183 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from dbt.cli.exceptions import DbtUsageException
+from dbt.cli.main import dbtRunner
+from dbt.config.project import Project
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.read_files import FileDiff, InputFile
+from dbt.parser.watch import (
+    SNAPSHOT_ATTEMPTS,
+    ManifestWatcher,
+    ProjectFileWatcher,
+    file_diff_is_empty,
+)
+
+
+@pytest.fixture
+def project_on_disk(tmp_path, project: Project) -> Project:
+    for relative_path, contents in {
+        "models/model_a.sql": "select 1 as id",
+        "models/model_b.sql": "select 2 as id",
+        "models/schema.yml": "models:\n  - name: model_a",
+    }.items():
+        path = tmp_path / relative_path
+        os.makedirs(path.parent, exist_ok=True)
+        path.write_text(contents)
+    project.project_root = str(tmp_path)
+    return project
+
+
+class TestProjectFileWatcher:
+    def test_build_file_diff(self, project_on_disk: Project, tmp_path):
+        watcher = ProjectFileWatcher(project_on_disk)
+        assert set(watcher.snapshot) == {
+            "models/model_a.sql",
+            "models/model_b.sql",
+            "models/schema.yml",
+        }
+
+        model_a = tmp_path / "models" / "model_a.sql"
+        model_a.write_text("select 10 as id  \n")
+        os.utime(model_a, (1, 1))
+        (tmp_path / "models" / "model_b.sql").unlink()
+        (tmp_path / "models" / "model_c.sql").write_text("select 3 as id")
+        (tmp_path / "models" / "notes.txt").write_text("not a project file")
+
+        current = watcher.take_snapshot()
+        file_diff = watcher.build_file_diff(watcher.snapshot, current)
+
+        assert file_diff.deleted == ["models/model_b.sql"]
+        assert [f.path for f in file_diff.added] == ["models/model_c.sql"]
+        assert [f.path for f in file_diff.changed] == ["models/model_a.sql"]
+        assert file_diff.changed[0].content == "select 10 as id"
+        assert file_diff.changed[0].modification_time == 1
+        assert file_diff_is_empty(watcher.build_file_diff(current, current))
+
+    def test_snapshot_retries_when_a_file_is_deleted(self, project_on_disk: Project, mocker):
+        watcher = ProjectFileWatcher(project_on_disk, debounce_interval=0)
+        take_snapshot = mocker.patch.object(
+            watcher, "_take_snapshot", side_effect=[FileNotFoundError(), {"models/a.sql": 1.0}]
+        )
+
+        assert watcher.take_snapshot() == {"models/a.sql": 1.0}
+        assert take_snapshot.call_count == 2
+
+    def test_snapshot_gives_up_after_retrying(self, project_on_disk: Project, mocker):
+        watcher = ProjectFileWatcher(project_on_disk, debounce_interval=0)
+        take_snapshot = mocker.patch.object(
+            watcher, "_take_snapshot", side_effect=FileNotFoundError()
+        )
+
+        with pytest.raises(FileNotFoundError):
+            watcher.take_snapshot()
+        assert take_snapshot.call_count == SNAPSHOT_ATTEMPTS
+
+
+class TestManifestWatcher:
+    def test_remove_unchanged_files(self, project_on_disk: Project):
+        manifest = Manifest()
+        for path, contents in (("model_a.sql", "select 1 as id"), ("model_b.sql", "select 2")):
+            source_file = SourceFile(
+                path=FilePath(
+                    searched_path="models",
+                    relative_path=path,
+                    modification_time=0.0,
+                    project_root=project_on_disk.project_root,
+                ),
+                checksum=FileHash.from_contents(contents),
+                project_name=project_on_disk.project_name,
+                parse_file_type=ParseFileType.Model,
+            )
+            manifest.files[source_file.file_id] = source_file
+        watcher = ManifestWatcher(project_on_disk, manifest, write_json=False)
+
+        file_diff = watcher.remove_unchanged_files(
+            FileDiff(
+                deleted=[],
+                changed=[
+                    InputFile(path="models/model_a.sql", content="select 1 as id"),
+                    InputFile(path="models/model_b.sql", content="select 3"),
+                ],
+                added=[],
+            )
+        )
+
+        assert [f.path for f in file_diff.changed] == ["models/model_b.sql"]
+
+
+PROFILES_YML = """
+watch_profile:
+  target: dev
+  outputs:
+    dev:
+      type: postgres
+      host: localhost
+      port: 5432
+      user: root
+      pass: password
+      dbname: dbt
+      schema: dbt
+      threads: 1
+"""
+
+
+def make_dbt_project(tmp_path: Path) -> Path:
+    (tmp_path / "dbt_project.yml").write_text(
+        "name: watch_project\nversion: '1.0'\nprofile: watch_profile\n"
+    )
+    (tmp_path / "profiles.yml").write_text(PROFILES_YML)
+    (tmp_path / "models").mkdir()
+    model_a = tmp_path / "models" / "model_a.sql"
+    model_a.write_text("select 1 as id")
+    return model_a
+
+
+def invoke_parse_watch(project_dir: Path, *args: str):
+    return dbtRunner().invoke(
+        [
+            "parse",
+            "--watch",
+            *args,
+            "--project-dir",
+            str(project_dir),
+            "--profiles-dir",
+            str(project_dir),
+        ]
+    )
+
+
+class TestParseWatch:
+    def test_changes_are_parsed(self, tmp_path: Path, mocker):
+        model_a = make_dbt_project(tmp_path)
+
+        def wait_for_changes(watcher: ProjectFileWatcher):
+            if model_a.read_text() != "select 1 as id":
+                raise KeyboardInterrupt
+            model_a.write_text("select 2 as id")
+            current = watcher.take_snapshot()
+            file_diff = watcher.build_file_diff(watcher.snapshot, current)
+            watcher.snapshot = current
+            return file_diff
+
+        mocker.patch.object(
+            ProjectFileWatcher, "wait_for_changes", autospec=True, side_effect=wait_for_changes
+        )
+        result = invoke_parse_watch(tmp_path)
+
+        assert result.success
+        assert result.result.nodes["model.watch_project.model_a"].raw_code == "select 2 as id"
+
+    def test_file_diffs_cannot_be_turned_off(self, tmp_path: Path, mocker):
+        make_dbt_project(tmp_path)
+        wait_for_changes = mocker.patch.object(ProjectFileWatcher, "wait_for_changes")
+
+        result = invoke_parse_watch(tmp_path, "--no-partial-parse-file-diff")
+
+        assert not result.success
+        assert isinstance(result.exception, DbtUsageException)
+        assert "no_partial_parse_file_diff" in str(result.exception)
+        wait_for_changes.assert_not_called()
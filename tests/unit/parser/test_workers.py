@@ -0,0 +1,163 @@
+import pickle
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+import dbt.deprecations
+from dbt.cli.main import dbtRunner
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.types import ExposureNameDeprecation
+from dbt.parser.workers import (
+    MIN_FILES_PER_WORKER,
+    ParseWorkerResult,
+    RecordedEvent,
+    replay_event,
+)
+from dbt_common.events.base_types import EventLevel
+from dbt_common.events.types import Note
+from tests.unit.utils.manifest import make_model
+
+
+class TestRecordedEvent:
+    def test_event_survives_pickling(self):
+        recorded = RecordedEvent.from_event(
+            Note(msg="parsed in a worker"), EventLevel.DEBUG, None, False
+        )
+
+        event = pickle.loads(pickle.dumps(recorded)).to_event()
+
+        assert isinstance(event, Note)
+        assert event.msg == "parsed in a worker"
+        assert event.message() == "parsed in a worker"
+
+    def test_deprecations_are_shown_once(self, mocker):
+        dbt.deprecations.reset_deprecations()
+        warn_or_error = mocker.patch("dbt.deprecations.warn_or_error")
+        recorded = RecordedEvent.from_event(
+            ExposureNameDeprecation(exposure="my exposure"), None, None, True
+        )
+
+        replay_event(recorded)
+        replay_event(recorded)
+
+        assert warn_or_error.call_count == 1
+        assert "exposure-name" in dbt.deprecations.active_deprecations
+        dbt.deprecations.reset_deprecations()
+
+
+class TestParseWorkerResult:
+    def test_merge_into(self, mocker):
+        fire_event = mocker.patch("dbt.parser.workers.fire_event")
+        manifest = Manifest()
+        model_a = make_model("pkg", "model_a", "select 1")
+        model_b = make_model("pkg", "model_b", "select * from {{ ref('model_a') }}")
+        disabled = make_model("pkg", "model_c", "select 2", config_kwargs={"enabled": False})
+        result = ParseWorkerResult(
+            nodes=[model_a, model_b],
+            disabled=[disabled],
+            env_vars={"DBT_ENV": "prod"},
+            static_analysis_path_count=2,
+            static_analysis_parsed_path_count=1,
+            static_analysis_fallback_reasons={"pkg://models/model_b.sql": "For statement"},
+            events=[RecordedEvent.from_event(Note(msg="done"), EventLevel.DEBUG, None, False)],
+        )
+
+        result.merge_into(manifest)
+
+        assert list(manifest.nodes) == [model_a.unique_id, model_b.unique_id]
+        assert manifest.disabled == {disabled.unique_id: [disabled]}
+        assert manifest.env_vars == {"DBT_ENV": "prod"}
+        assert manifest._parsing_info.static_analysis_path_count == 2
+        assert manifest._parsing_info.static_analysis_parsed_path_count == 1
+        assert manifest._parsing_info.static_analysis_fallback_reasons == {
+            "pkg://models/model_b.sql": "For statement"
+        }
+        assert fire_event.call_count == 1
+        assert fire_event.call_args.kwargs["level"] == EventLevel.DEBUG
+
+
+PROFILES_YML = """
+workers_profile:
+  target: dev
+  outputs:
+    dev:
+      type: postgres
+      host: localhost
+      port: 5432
+      user: root
+      pass: password
+      dbname: dbt
+      schema: dbt
+      threads: 1
+"""
+
+
+@pytest.fixture
+def workers_project(tmp_path: Path) -> Path:
+    (tmp_path / "dbt_project.yml").write_text(
+        "name: workers_project\nversion: '1.0'\nprofile: workers_profile\n"
+    )
+    (tmp_path / "profiles.yml").write_text(PROFILES_YML)
+    models = tmp_path / "models"
+    models.mkdir()
+    # Enough files for the pool to parse them in more than one chunk
+    for i in range(MIN_FILES_PER_WORKER * 3):
+        if i == 0:
+            sql = "select 1 as id"
+        elif i % 3 == 0:
+            sql = "{% set cols = adapter.get_columns_in_relation(ref('model_0')) %}select 1 as id"
+        else:
+            sql = f"select * from {{{{ ref('model_{i - 1}') }}}}"
+        (models / f"model_{i}.sql").write_text(sql)
+    return tmp_path
+
+
+def parse_project(project_dir: Path, parse_workers: int) -> Manifest:
+    result = dbtRunner().invoke(
+        [
+            "parse",
+            "--project-dir",
+            str(project_dir),
+            "--profiles-dir",
+            str(project_dir),
+            "--no-partial-parse",
+            "--parse-workers",
+            str(parse_workers),
+        ]
+    )
+    assert result.success
+    return result.result
+
+
+def node_dicts(manifest: Manifest) -> Dict[str, Dict[str, Any]]:
+    node_dicts = {unique_id: node.to_dict() for unique_id, node in manifest.nodes.items()}
+    for node_dict in node_dicts.values():
+        del node_dict["created_at"]
+    return node_dicts
+
+
+class TestParseProcessPool:
+    def test_parse_matches_serial_parse(self, workers_project, mocker):
+        serial = parse_project(workers_project, 1)
+        merge_into = mocker.spy(ParseWorkerResult, "merge_into")
+        parallel = parse_project(workers_project, 2)
+
+        assert merge_into.call_count > 1
+        assert list(parallel.nodes) == list(serial.nodes)
+        assert node_dicts(parallel) == node_dicts(serial)
+        assert parallel.child_map == serial.child_map
+
+    def test_static_analysis_matches_serial_parse(self, workers_project):
+        serial = parse_project(workers_project, 1)
+        parallel = parse_project(workers_project, 2)
+
+        assert serial._parsing_info.static_analysis_fallback_reasons
+        assert (
+            parallel._parsing_info.static_analysis_fallback_reasons
+            == serial._parsing_info.static_analysis_fallback_reasons
+        )
+        assert (
+            parallel._parsing_info.static_analysis_path_count
+            == serial._parsing_info.static_analysis_path_count
+        )
@@ -9,6 +9,7 @@ from dbt.compilation import Graph, Linker
 from dbt.graph.cli import parse_difference
 from dbt.graph.queue import GraphQueue
 from dbt.graph.selector import NodeSelector
+from dbt.node_types import NodeType
 
 
 def _mock_manifest(nodes):
@@ -193,3 +194,40 @@ class TestLinker:
             linker.dependency(l, r)
 
         assert linker.find_cycles() is None
+
+    def test_linker_add_test_edges(self, linker: Linker) -> None:
+        #  model1 --> model2 --> model3
+        #    |          |          |
+        #  test1      test2     test3 (also on model1)
+        deps = {
+            "model.pkg.model1": [],
+            "model.pkg.model2": ["model.pkg.model1"],
+            "model.pkg.model3": ["model.pkg.model2"],
+            "test.pkg.test1": ["model.pkg.model1"],
+            "test.pkg.test2": ["model.pkg.model2"],
+            "test.pkg.test3": ["model.pkg.model1", "model.pkg.model3"],
+        }
+        manifest = mock.MagicMock(nodes={}, child_map={})
+        for unique_id, depends_on in deps.items():
+            resource_type = NodeType.Test if unique_id.startswith("test.") else NodeType.Model
+            manifest.nodes[unique_id] = mock.MagicMock(
+                resource_type=resource_type, depends_on_nodes=depends_on
+            )
+            manifest.child_map[unique_id] = []
+            linker.add_node(unique_id)
+            for parent in depends_on:
+                linker.dependency(unique_id, parent)
+                manifest.child_map[parent].append(unique_id)
+
+        linker.add_test_edges_1(manifest)
+
+        test_edges = {
+            (test, node)
+            for test, node, data in linker.graph.edges(data=True)
+            if data.get("edge_type") == "parent_test"
+        }
+        assert test_edges == {
+            ("test.pkg.test1", "model.pkg.model2"),
+            ("test.pkg.test1", "model.pkg.model3"),
+            ("test.pkg.test2", "model.pkg.model3"),
+        }